@@ -4,8 +4,26 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
+import exporters
 import naver_collector
+import pipeline
 import youtube_collector
+import quota_ledger
+import rate_limiter
+import response_cache
+import settings
+import storage
+
+
+# 소스 타입별 화면 표시 이름
+SOURCE_LABELS = {
+    'naver_news': "네이버 뉴스",
+    'youtube_video': "유튜브 영상",
+    'youtube_comment': "유튜브 댓글",
+}
+
+# 전문 검색 결과 최대 표시 건수 (소스 타입별)
+SEARCH_LIMIT = 200
 
 
 # 페이지 설정
@@ -68,6 +86,8 @@ def main():
         st.session_state.collected_data = None
     if 'collection_stats' not in st.session_state:
         st.session_state.collection_stats = {}
+    if 'exports' not in st.session_state:
+        st.session_state.exports = {}
     
     # 사이드바 - API 키 입력
     with st.sidebar:
@@ -115,6 +135,42 @@ def main():
         
         st.markdown("---")
         
+        # 응답 캐시 설정
+        st.markdown("#### 💾 응답 캐시")
+        use_cache = st.checkbox(
+            "API 응답 캐시 사용",
+            value=True,
+            help="같은 조건의 API 요청은 저장된 응답을 재사용하여 할당량을 절약합니다"
+        )
+        cache = response_cache.configure(enabled=use_cache)
+        
+        if cache is not None:
+            cache_stats = cache.stats()
+            st.caption(
+                f"적중 {cache_stats['hits']:,}회 · 미적중 {cache_stats['misses']:,}회 · "
+                f"저장 {cache_stats['entries']:,}건 ({cache_stats['bytes'] / 1024 / 1024:.1f} MB)"
+            )
+            if st.button("🗑️ 캐시 비우기", use_container_width=True):
+                cache.clear()
+                st.success("캐시를 비웠습니다.")
+        
+        st.markdown("---")
+        
+        # 로컬 저장소 설정
+        st.markdown("#### 🗄️ 로컬 저장소")
+        save_to_store = st.checkbox(
+            "수집 결과를 로컬 DB에 누적 저장",
+            value=True,
+            help="수집한 뉴스/영상/댓글을 고유 키 기준으로 SQLite 파일에 누적하여, 다시 수집하지 않고 기간/키워드로 조회할 수 있습니다"
+        )
+        store_counts = storage.get_store().counts()
+        st.caption(
+            f"뉴스 {store_counts['naver_news']:,}건 · 영상 {store_counts['youtube_video']:,}건 · "
+            f"댓글 {store_counts['youtube_comment']:,}건"
+        )
+        
+        st.markdown("---")
+        
         # API 발급 가이드
         with st.expander("📘 API 키 발급 방법"):
             st.markdown("""
@@ -173,6 +229,11 @@ def main():
                 step=10,
                 key="naver_max"
             )
+            naver_extend = st.checkbox(
+                "정확도순 보충 검색",
+                value=False,
+                help="최신순 검색이 1,000건 상한에 걸려 기간 앞부분이 누락되면 정확도순 검색으로 보충 (호출 수 증가)"
+            )
     
     with col2:
         collect_youtube = st.checkbox("유튜브 영상", value=True)
@@ -190,6 +251,18 @@ def main():
                 value=True,
                 help="KBS, MBC, SBS, JTBC, TV조선, 채널A, MBN, 뉴스1, 연합뉴스TV"
             )
+            youtube_engine = "search"
+            if youtube_channel_filter:
+                youtube_engine = st.radio(
+                    "채널 수집 방식",
+                    options=["search", "uploads"],
+                    format_func=lambda x: {
+                        "search": "채널별 검색 (100 units/페이지)",
+                        "uploads": "업로드 목록에서 키워드 찾기 (1 unit/페이지)"
+                    }[x],
+                    help="업로드 목록 방식은 기간 내 채널 업로드 영상을 한 번 받아 두고 제목/설명/태그에서 "
+                         "키워드를 찾으므로, 여러 키워드를 수집할 때 할당량을 크게 절약합니다"
+                )
     
     with col3:
         collect_comments = st.checkbox("유튜브 댓글", value=True)
@@ -203,6 +276,12 @@ def main():
                 key="comments_max"
             )
     
+    incremental = st.checkbox(
+        "증분 수집 (이전 수집 이후 새 항목만)",
+        value=False,
+        help="키워드별로 마지막으로 수집한 최신 게시 시각을 기억해 두고, 그 이후에 게시된 뉴스/영상만 수집합니다"
+    )
+    
     # 정보 박스
     st.markdown('<div class="info-box">', unsafe_allow_html=True)
     st.markdown("""
@@ -223,31 +302,40 @@ def main():
         st.markdown('<div class="warning-box">', unsafe_allow_html=True)
         st.markdown(f"**📊 예상 API 사용량 (키워드 {num_keywords}개)**")
         
+        plan = quota_ledger.plan_run(
+            num_keywords,
+            start_date.strftime("%Y-%m-%d"),
+            end_date.strftime("%Y-%m-%d"),
+            naver_max=naver_max if collect_naver else 0,
+            youtube_max=youtube_max if collect_youtube else 0,
+            channel_filter=youtube_channel_filter if collect_youtube else True,
+            engine=youtube_engine if collect_youtube else "search",
+            comments_per_video=comments_per_video if collect_comments else 0,
+            num_channels=len(youtube_collector.MEDIA_CHANNELS),
+            naver_extend=naver_extend if collect_naver else False
+        )
+        
         col1, col2 = st.columns(2)
         
         with col1:
             if collect_naver:
-                # 네이버: 한 번의 API 호출 = 1건
-                # 100건씩 페이징하므로 (max/100)번 호출
-                naver_calls = (naver_max // 100 + 1) * num_keywords
-                naver_percent = (naver_calls / 25000) * 100
                 st.write(f"**네이버 API**")
-                st.write(f"- 약 {naver_calls:,}회 호출")
-                st.write(f"- 일일 한도 대비: {naver_percent:.1f}%")
+                st.write(f"- 최대 {plan['totals']['naver']:,}회 호출")
+                st.write(f"- 일일 한도 대비: {plan['percent']['naver']:.1f}%")
+                if naver_client_id:
+                    limiter = rate_limiter.get_limiter("naver", naver_client_id)
+                    st.write(f"- 오늘 남은 한도: {limiter.remaining():,}회")
         
         with col2:
             if collect_youtube:
-                # 유튜브: 검색 1회 = 100 units
-                youtube_units = 100 * num_keywords
-                
-                if collect_comments and youtube_max > 0:
-                    # 댓글 조회: 1개 영상당 1 unit
-                    youtube_units += youtube_max * num_keywords
-                
-                youtube_percent = (youtube_units / 10000) * 100
                 st.write(f"**유튜브 API**")
-                st.write(f"- 약 {youtube_units:,} units")
-                st.write(f"- 일일 한도 대비: {youtube_percent:.1f}%")
+                st.write(f"- 약 {plan['totals']['youtube']:,} units")
+                for method, units in plan['youtube'].items():
+                    st.write(f"  - {method}: {units:,} units")
+                st.write(f"- 일일 한도 대비: {plan['percent']['youtube']:.1f}%")
+                if youtube_api_key:
+                    limiter = rate_limiter.get_limiter("youtube", youtube_api_key)
+                    st.write(f"- 오늘 남은 한도: {limiter.remaining():,} units")
         
         st.markdown('</div>', unsafe_allow_html=True)
     
@@ -294,17 +382,63 @@ def main():
                 naver_max if collect_naver else 0,
                 youtube_max if collect_youtube else 0,
                 youtube_channel_filter if collect_youtube else True,
-                comments_per_video if collect_comments else 0
+                comments_per_video if collect_comments else 0,
+                naver_extend if collect_naver else False,
+                incremental,
+                youtube_engine if collect_youtube else "search",
+                save_to_store
             )
     
+    # 저장된 기록 조회
+    with st.expander("🗄️ 저장된 수집 기록 불러오기"):
+        show_store_history()
+    
+    # 저장된 기록 전문 검색
+    with st.expander("🔎 저장된 기록 검색"):
+        show_store_search()
+    
     # 결과 표시
     if st.session_state.collected_data is not None:
         display_results()
 
 
+class StreamlitReporter(pipeline.Reporter):
+    """수집 진행 상황을 Streamlit 화면에 표시"""
+    
+    def __init__(self, progress_bar, status_text, show_quota_usage):
+        self.progress_bar = progress_bar
+        self.status_text = status_text
+        self.show_quota_usage = show_quota_usage
+    
+    def keyword(self, keyword, index, total):
+        if total > 1:
+            st.markdown(f"**키워드 {index}/{total}: '{keyword}'**")
+    
+    def status(self, message):
+        self.status_text.text(message)
+        self.show_quota_usage()
+    
+    def success(self, message):
+        st.success(message)
+    
+    def info(self, message):
+        st.info(message)
+    
+    def warning(self, message):
+        st.warning(message)
+    
+    def error(self, message):
+        st.error(message)
+    
+    def step(self, done, total):
+        self.progress_bar.progress(done / total)
+        self.show_quota_usage()
+
+
 def run_collection(keywords, start_date, end_date, collect_naver, collect_youtube, 
                    collect_comments, naver_id, naver_secret, youtube_key,
-                   naver_max, youtube_max, youtube_filter, comments_max):
+                   naver_max, youtube_max, youtube_filter, comments_max, naver_extend=False,
+                   incremental=False, youtube_engine="search", save_to_store=False):
     """수집 실행 - 다중 키워드 지원"""
     
     st.markdown('<div class="section-header">📊 수집 진행 상황</div>', unsafe_allow_html=True)
@@ -313,155 +447,182 @@ def run_collection(keywords, start_date, end_date, collect_naver, collect_youtub
     if len(keywords) > 1:
         st.info(f"🔍 {len(keywords)}개의 키워드로 검색: {', '.join(keywords)}")
     
-    all_data = []
     stats = {}
     
     progress_bar = st.progress(0)
     status_text = st.empty()
+    quota_text = st.empty()
     
-    total_steps = len(keywords) * sum([collect_naver, collect_youtube, collect_comments])
-    current_step = 0
+    # 이번 실행의 실제 사용량 표시 (일일 누적 사용량 대비)
+    ledger = quota_ledger.get_ledger()
+    
+    def show_quota_usage():
+        parts = []
+        if collect_naver:
+            naver_used = rate_limiter.get_limiter("naver", naver_id).used_today()
+            parts.append(f"네이버 이번 실행 {ledger.total('naver'):,}회 · 오늘 {naver_used:,}/{settings.NAVER_DAILY_LIMIT:,}회")
+        if collect_youtube or collect_comments:
+            youtube_used = rate_limiter.get_limiter("youtube", youtube_key).used_today()
+            parts.append(f"유튜브 이번 실행 {ledger.total('youtube'):,} units · 오늘 {youtube_used:,}/{settings.YOUTUBE_DAILY_UNITS:,} units")
+        quota_text.caption("📈 " + " | ".join(parts))
+    
+    # Streamlit 화면 요소는 스크립트 실행 스레드에서만 갱신되므로 키워드는 순서대로 수집
+    reporter = StreamlitReporter(progress_bar, status_text, show_quota_usage)
     
     try:
-        for keyword_idx, keyword in enumerate(keywords, 1):
-            if len(keywords) > 1:
-                st.markdown(f"**키워드 {keyword_idx}/{len(keywords)}: '{keyword}'**")
-            
-            # 1. 네이버 뉴스 수집
-            if collect_naver:
-                status_text.text(f"📰 네이버 뉴스 수집 중... (키워드: {keyword})")
-                try:
-                    naver_df = naver_collector.collect_naver_news(
-                        naver_id, naver_secret, keyword, start_date, end_date, naver_max
-                    )
-                    if not naver_df.empty:
-                        all_data.append(naver_df)
-                    
-                    if keyword_idx == 1:
-                        stats['naver_news'] = len(naver_df)
-                    else:
-                        stats['naver_news'] = stats.get('naver_news', 0) + len(naver_df)
-                    
-                    st.success(f"✅ '{keyword}' 네이버 뉴스: {len(naver_df)}건")
-                except Exception as e:
-                    st.error(f"❌ '{keyword}' 네이버 뉴스 수집 실패: {str(e)}")
-                
-                current_step += 1
-                progress_bar.progress(current_step / total_steps)
-            
-            # 2. 유튜브 영상 수집
-            video_ids = []
-            if collect_youtube:
-                status_text.text(f"🎥 유튜브 영상 수집 중... (키워드: {keyword})")
-                try:
-                    youtube_df = youtube_collector.collect_youtube_videos(
-                        youtube_key, keyword, start_date, end_date, youtube_filter, youtube_max
-                    )
-                    if not youtube_df.empty:
-                        all_data.append(youtube_df)
-                        video_ids = youtube_df['video_id'].tolist()
-                    
-                    if keyword_idx == 1:
-                        stats['youtube_videos'] = len(youtube_df)
-                    else:
-                        stats['youtube_videos'] = stats.get('youtube_videos', 0) + len(youtube_df)
-                    
-                    st.success(f"✅ '{keyword}' 유튜브 영상: {len(youtube_df)}건")
-                except Exception as e:
-                    st.error(f"❌ '{keyword}' 유튜브 영상 수집 실패: {str(e)}")
-                
-                current_step += 1
-                progress_bar.progress(current_step / total_steps)
-            
-            # 3. 유튜브 댓글 수집
-            if collect_comments and video_ids:
-                status_text.text(f"💬 유튜브 댓글 수집 중... (키워드: {keyword})")
-                try:
-                    comments_df = youtube_collector.collect_youtube_comments(
-                        youtube_key, video_ids, comments_max
-                    )
-                    if not comments_df.empty:
-                        all_data.append(comments_df)
-                    
-                    if keyword_idx == 1:
-                        stats['youtube_comments'] = len(comments_df)
-                    else:
-                        stats['youtube_comments'] = stats.get('youtube_comments', 0) + len(comments_df)
-                    
-                    st.success(f"✅ '{keyword}' 유튜브 댓글: {len(comments_df)}건")
-                except Exception as e:
-                    st.error(f"❌ '{keyword}' 유튜브 댓글 수집 실패: {str(e)}")
-                
-                current_step += 1
-                progress_bar.progress(current_step / total_steps)
-            elif collect_comments and not video_ids:
-                st.warning(f"⚠️ '{keyword}': 수집된 영상이 없어 댓글을 수집할 수 없습니다.")
-                current_step += 1
-                progress_bar.progress(current_step / total_steps)
+        result, failures = pipeline.run_collection(
+            keywords, start_date, end_date,
+            collect_naver=collect_naver,
+            collect_youtube=collect_youtube,
+            collect_comments=collect_comments,
+            naver_id=naver_id,
+            naver_secret=naver_secret,
+            youtube_key=youtube_key,
+            naver_max=naver_max,
+            youtube_max=youtube_max,
+            youtube_filter=youtube_filter,
+            comments_max=comments_max,
+            naver_extend=naver_extend,
+            incremental=incremental,
+            youtube_engine=youtube_engine,
+            reporter=reporter
+        )
         
-        # 데이터 통합 및 중복 제거
-        if all_data:
-            combined_df = pd.concat(all_data, ignore_index=True)
-            
-            # 중복 제거
-            original_count = len(combined_df)
-            
-            # 각 타입별로 중복 제거 기준 다르게 적용
-            if 'type' in combined_df.columns:
-                deduplicated_dfs = []
-                
-                # 네이버 뉴스: link 기준
-                if 'naver_news' in combined_df['type'].values:
-                    naver_df = combined_df[combined_df['type'] == 'naver_news']
-                    if 'link' in naver_df.columns:
-                        naver_df = naver_df.drop_duplicates(subset=['link'], keep='first')
-                    deduplicated_dfs.append(naver_df)
-                
-                # 유튜브 영상: video_id 기준
-                if 'youtube_video' in combined_df['type'].values:
-                    youtube_df = combined_df[combined_df['type'] == 'youtube_video']
-                    if 'video_id' in youtube_df.columns:
-                        youtube_df = youtube_df.drop_duplicates(subset=['video_id'], keep='first')
-                    deduplicated_dfs.append(youtube_df)
-                
-                # 유튜브 댓글: comment_id 기준
-                if 'youtube_comment' in combined_df['type'].values:
-                    comments_df = combined_df[combined_df['type'] == 'youtube_comment']
-                    if 'comment_id' in comments_df.columns:
-                        comments_df = comments_df.drop_duplicates(subset=['comment_id'], keep='first')
-                    deduplicated_dfs.append(comments_df)
-                
-                combined_df = pd.concat(deduplicated_dfs, ignore_index=True)
-            
-            duplicate_count = original_count - len(combined_df)
+        if len(result):
+            counts = result.counts()
+            stats['naver_news'] = counts['naver_news']
+            stats['youtube_videos'] = counts['youtube_video']
+            stats['youtube_comments'] = counts['youtube_comment']
             
-            if duplicate_count > 0:
-                st.info(f"🔄 중복 제거: {duplicate_count}건 (최종 {len(combined_df)}건)")
-            
-            # 통계 업데이트
-            if 'type' in combined_df.columns:
-                stats['naver_news'] = len(combined_df[combined_df['type'] == 'naver_news'])
-                stats['youtube_videos'] = len(combined_df[combined_df['type'] == 'youtube_video'])
-                stats['youtube_comments'] = len(combined_df[combined_df['type'] == 'youtube_comment'])
-            
-            st.session_state.collected_data = combined_df
+            st.session_state.collected_data = result
             st.session_state.collection_stats = stats
+            st.session_state.exports = {}
             
             status_text.text("✅ 수집 완료!")
             progress_bar.progress(1.0)
-        else:
-            st.warning("⚠️ 수집된 데이터가 없습니다.")
+            
+            if save_to_store:
+                try:
+                    saved = storage.get_store().save(result)
+                    st.caption(f"🗄️ 로컬 DB에 저장: {sum(saved.values()):,}건")
+                except Exception as e:
+                    st.warning(f"⚠️ 로컬 DB 저장 실패: {str(e)}")
+            
+            cache = response_cache.get_cache()
+            if cache is not None:
+                cache_stats = cache.stats()
+                st.caption(f"💾 응답 캐시: 적중 {cache_stats['hits']:,}회 / 미적중 {cache_stats['misses']:,}회")
             
     except Exception as e:
         st.error(f"❌ 수집 중 오류 발생: {str(e)}")
 
 
+def show_store_history():
+    """로컬 DB에 누적된 기록을 기간/키워드로 조회하여 결과 화면에 불러오기"""
+    store = storage.get_store()
+    
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        history_keyword = st.selectbox(
+            "키워드",
+            options=["(전체)"] + store.keywords(),
+            key="history_keyword"
+        )
+    with col2:
+        history_start = st.date_input(
+            "시작일",
+            value=datetime.now() - timedelta(days=7),
+            key="history_start"
+        )
+    with col3:
+        history_end = st.date_input(
+            "종료일",
+            value=datetime.now(),
+            key="history_end"
+        )
+    
+    if st.button("불러오기", use_container_width=True, key="history_load"):
+        result = store.load_result(
+            history_start.strftime("%Y-%m-%d"),
+            history_end.strftime("%Y-%m-%d"),
+            keyword=None if history_keyword == "(전체)" else history_keyword
+        )
+        
+        if len(result):
+            counts = result.counts()
+            st.session_state.collected_data = result
+            st.session_state.collection_stats = {
+                'naver_news': counts['naver_news'],
+                'youtube_videos': counts['youtube_video'],
+                'youtube_comments': counts['youtube_comment'],
+            }
+            st.session_state.exports = {}
+            st.success(f"✅ 저장된 기록 {len(result):,}건을 불러왔습니다.")
+        else:
+            st.warning("⚠️ 조건에 맞는 저장된 기록이 없습니다.")
+
+
+def show_store_search():
+    """로컬 DB 전문 검색 (뉴스 제목/요약, 영상 제목/설명/태그, 댓글 본문)"""
+    store = storage.get_store()
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        search_text = st.text_input(
+            "검색어",
+            placeholder="예: 중대재해 추락 (공백으로 구분하면 모두 포함)",
+            help="단어 안의 부분 일치로 찾습니다 (대소문자, 문장부호 무시). 한두 글자 검색어도 색인으로 찾습니다",
+            key="search_text"
+        )
+    with col2:
+        search_order = st.radio(
+            "정렬",
+            options=["recent", "relevance"],
+            format_func=lambda x: {"recent": "최근 저장 순", "relevance": "관련도 순"}[x],
+            key="search_order"
+        )
+    
+    if not search_text.strip():
+        return
+    
+    results = {
+        source_type: store.search(source_type, search_text, limit=SEARCH_LIMIT, order=search_order)
+        for source_type in SOURCE_LABELS
+    }
+    
+    tabs = st.tabs([
+        f"{SOURCE_LABELS[source_type]} ({len(table):,}{'+' if len(table) >= SEARCH_LIMIT else ''})"
+        for source_type, table in results.items()
+    ])
+    for tab, table in zip(tabs, results.values()):
+        with tab:
+            if table.empty:
+                st.caption("검색 결과가 없습니다.")
+            else:
+                st.dataframe(table, use_container_width=True, hide_index=True)
+
+
+def deferred_export(exports, key, build):
+    """
+    다운로드 버튼을 누를 때 내보내기 파일을 만드는 함수 반환
+    
+    화면을 그릴 때마다 Excel/zip 파일을 만들지 않도록 st.download_button에 파일 내용 대신
+    넘긴다. 만든 파일은 exports에 보관하여 같은 키로 다시 누르면 재사용한다.
+    streamlit이 별도 스레드에서 호출하므로 화면 요소는 쓰지 않는다.
+    """
+    def data():
+        if key not in exports:
+            exports[key] = build()
+        return exports[key]
+    return data
+
+
 def display_results():
     """결과 표시"""
     
     st.markdown('<div class="section-header">📊 수집 결과</div>', unsafe_allow_html=True)
     
-    df = st.session_state.collected_data
+    result = st.session_state.collected_data
     stats = st.session_state.collection_stats
     
     # 통계 표시
@@ -469,7 +630,7 @@ def display_results():
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("총 수집 건수", f"{len(df):,}")
+        st.metric("총 수집 건수", f"{len(result):,}")
     
     with col2:
         if 'naver_news' in stats:
@@ -485,87 +646,82 @@ def display_results():
     
     st.markdown('</div>', unsafe_allow_html=True)
     
-    # 데이터 미리보기
+    # 데이터 미리보기 (소스 타입별)
     st.markdown("#### 📋 데이터 미리보기 (상위 10개)")
-    st.dataframe(df.head(10), use_container_width=True)
-    
-    # Excel 파일 생성
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"수집결과_{timestamp}.xlsx"
-    
-    # BytesIO 객체로 Excel 파일 생성
-    from io import BytesIO
-    output = BytesIO()
-    
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        # 네이버 뉴스 시트
-        if 'naver_news' in stats and stats['naver_news'] > 0:
-            naver_df = df[df['type'] == 'naver_news'].copy()
-            # 필요한 컬럼만 선택
-            naver_columns = ['title', 'description', 'link', 'originallink', 'pubDate']
-            naver_df = naver_df[[col for col in naver_columns if col in naver_df.columns]]
-            naver_df.to_excel(writer, sheet_name='네이버_뉴스', index=False)
-            
-            # 컬럼 폭 자동 조정
-            worksheet = writer.sheets['네이버_뉴스']
-            for idx, col in enumerate(naver_df.columns):
-                max_length = max(
-                    naver_df[col].astype(str).apply(len).max(),
-                    len(str(col))
-                )
-                worksheet.column_dimensions[chr(65 + idx)].width = min(max_length + 2, 50)
-        
-        # 유튜브 영상 시트
-        if 'youtube_videos' in stats and stats['youtube_videos'] > 0:
-            youtube_df = df[df['type'] == 'youtube_video'].copy()
-            # 필요한 컬럼만 선택
-            youtube_columns = ['title', 'description', 'channel_name', 'published_at', 
-                             'view_count', 'like_count', 'comment_count', 'tags', 'url', 'video_id']
-            youtube_df = youtube_df[[col for col in youtube_columns if col in youtube_df.columns]]
-            youtube_df.to_excel(writer, sheet_name='유튜브_영상', index=False)
-            
-            # 컬럼 폭 자동 조정
-            worksheet = writer.sheets['유튜브_영상']
-            for idx, col in enumerate(youtube_df.columns):
-                max_length = max(
-                    youtube_df[col].astype(str).apply(len).max(),
-                    len(str(col))
-                )
-                worksheet.column_dimensions[chr(65 + idx)].width = min(max_length + 2, 50)
-        
-        # 유튜브 댓글 시트
-        if 'youtube_comments' in stats and stats['youtube_comments'] > 0:
-            comments_df = df[df['type'] == 'youtube_comment'].copy()
-            # 필요한 컬럼만 선택
-            comments_columns = ['video_id', 'author', 'text', 'like_count', 'published_at']
-            comments_df = comments_df[[col for col in comments_columns if col in comments_df.columns]]
-            comments_df.to_excel(writer, sheet_name='유튜브_댓글', index=False)
-            
-            # 컬럼 폭 자동 조정
-            worksheet = writer.sheets['유튜브_댓글']
-            for idx, col in enumerate(comments_df.columns):
-                max_length = max(
-                    comments_df[col].astype(str).apply(len).max(),
-                    len(str(col))
-                )
-                worksheet.column_dimensions[chr(65 + idx)].width = min(max_length + 2, 50)
+    tables = result.tables()
+    if tables:
+        tabs = st.tabs([SOURCE_LABELS[source_type] for source_type in tables])
+        for tab, table in zip(tabs, tables.values()):
+            with tab:
+                st.dataframe(table.head(10), use_container_width=True, hide_index=True)
+    
+    # 유사 중복 뉴스 군집 (여러 언론사에 실린 같은 기사)
+    representatives_only = False
+    news = tables.get('naver_news')
+    if news is not None and len(news):
+        representatives = int(news['is_representative'].sum())
+        st.caption(
+            f"🧩 유사 중복 기사 군집 {representatives:,}개 · "
+            f"대표 기사를 제외한 중복 {len(news) - representatives:,}건"
+        )
+        representatives_only = st.checkbox(
+            "뉴스는 대표 기사만 내보내기",
+            value=False,
+            help="같은 기사가 여러 언론사에 실린 경우 군집마다 가장 먼저 게시된 기사 하나만 내보냅니다"
+        )
     
-    excel_data = output.getvalue()
+    # 내보내기 파일은 다운로드 버튼을 누를 때 만들고, 수집 결과·형식·대표 기사 여부마다 한 번만 만들어 재사용
+    exports = st.session_state.exports
+    if 'timestamp' not in exports:
+        exports['timestamp'] = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     # Excel 다운로드 버튼
     st.download_button(
         label="📥 Excel 다운로드",
-        data=excel_data,
-        file_name=filename,
+        data=deferred_export(
+            exports, ('xlsx', representatives_only),
+            lambda: exporters.build_excel(result, representatives_only=representatives_only)
+        ),
+        file_name=f"수집결과_{exports['timestamp']}.xlsx",
         mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         use_container_width=True,
         type="primary"
     )
     
+    # 분석용 형식 (소스 타입별 파일을 zip으로 묶어 다운로드)
+    st.markdown("#### 🗂️ 분석용 형식")
+    format_labels = {
+        'parquet': "Parquet",
+        'csv': "CSV (gzip)",
+        'jsonl': "JSONL",
+    }
+    export_format = st.radio(
+        "형식",
+        options=list(format_labels),
+        format_func=format_labels.get,
+        horizontal=True,
+        label_visibility="collapsed"
+    )
+    
+    # 파일은 버튼을 누른 뒤에 만들어지므로 pyarrow가 없는 경우는 미리 안내
+    if export_format == 'parquet' and exporters.pq is None:
+        st.error("❌ Parquet 내보내기에는 pyarrow가 필요합니다. (pip install pyarrow)")
+    else:
+        st.download_button(
+            label=f"📥 {format_labels[export_format]} 다운로드 (zip)",
+            data=deferred_export(
+                exports, (export_format, representatives_only),
+                lambda: exporters.build_archive(result, export_format, representatives_only=representatives_only)
+            ),
+            file_name=f"수집결과_{exports['timestamp']}_{export_format}.zip",
+            mime="application/zip",
+            use_container_width=True
+        )
+    
     # 데이터 타입별 분포
-    if 'type' in df.columns:
+    if tables:
         st.markdown("#### 📊 데이터 타입별 분포")
-        type_counts = df['type'].value_counts()
+        type_counts = pd.Series({source_type: len(table) for source_type, table in tables.items()})
         st.bar_chart(type_counts)
 
 
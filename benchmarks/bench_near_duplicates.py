@@ -0,0 +1,95 @@
+"""
+유사 중복 기사 군집화 벤치마크
+
+여러 언론사에 조금씩 다르게 실린 기사를 흉내 낸 합성 뉴스로 near_duplicates의
+군집화 시간을 건수별로 측정하고, 정답 군집과 비교한 결과를 출력한다.
+건수를 두 배로 늘릴 때 시간이 대략 두 배가 되면 (모든 쌍 비교처럼 네 배가 아니면)
+LSH가 비교 대상을 제대로 줄이고 있는 것이다.
+
+실행:
+    python benchmarks/bench_near_duplicates.py [--records 100000] [--repeat 1]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from near_duplicates import cluster_near_duplicates  # noqa: E402
+
+
+def make_corpus(size, seed=0):
+    """
+    통신사 기사 재배포와 비슷한 합성 뉴스 (제목 + 요약) 생성
+
+    기사 하나를 1~10개 언론사가 말머리, 기자 이름, 띄어쓰기만 바꿔 싣는다고 가정한다.
+
+    Returns:
+    --------
+    tuple
+        (문서 목록, 정답 군집 번호 배열)
+    """
+    rng = random.Random(seed)
+    words = [f"{syllable}{i}" for syllable in ("사고", "정부", "안전", "기업", "노동", "조사")
+             for i in range(2000)]
+    prefixes = ["", "", "[속보] ", "[단독] ", "(종합) "]
+    suffixes = ["", "", " 기자", " 연합뉴스", " 뉴스1"]
+
+    corpus, truth = [], []
+    story = 0
+    while len(corpus) < size:
+        title = " ".join(rng.choices(words, k=rng.randint(6, 12)))
+        summary = " ".join(rng.choices(words, k=rng.randint(15, 30)))
+        for _ in range(min(rng.choice([1, 1, 1, 2, 3, 5, 10]), size - len(corpus))):
+            text = f"{rng.choice(prefixes)}{title} {summary}{rng.choice(suffixes)}"
+            if rng.random() < 0.3:
+                text = text.replace(" ", "", 1)
+            corpus.append(text)
+            truth.append(story)
+        story += 1
+    return corpus, np.array(truth)
+
+
+def compare(labels, truth):
+    """정답 군집 수와 찾은 군집 수, 잘못 합쳐진 군집 수"""
+    found = pd.Series(truth).groupby(labels).nunique()
+    return {
+        '정답 군집': len(np.unique(truth)),
+        '찾은 군집': len(found),
+        '잘못 합친 군집': int((found > 1).sum()),
+    }
+
+
+def measure(label, func, repeat, records):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<28} {best:8.3f}s  {best / records * 1e6:8.2f} µs/건")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="유사 중복 기사 군집화 벤치마크")
+    parser.add_argument("--records", type=int, default=100000, help="최대 기사 수")
+    parser.add_argument("--repeat", type=int, default=1, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    corpus, truth = make_corpus(args.records)
+    print(f"말뭉치: {len(corpus):,}건, 평균 {sum(map(len, corpus)) / len(corpus):.0f}자")
+
+    for size in (args.records // 4, args.records // 2, args.records):
+        labels = measure(f"군집화 {size:,}건",
+                         lambda: cluster_near_duplicates(corpus[:size]), args.repeat, size)
+        print(f"{'':<28} {compare(labels, truth[:size])}")
+
+
+if __name__ == "__main__":
+    main()
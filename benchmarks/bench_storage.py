@@ -0,0 +1,81 @@
+"""
+로컬 저장소 벤치마크
+
+합성 댓글로 storage.ResultStore의 upsert(전문 검색 색인 포함)와 재수집 upsert,
+기간 조회, 전문 검색 시간을 측정한다. 임시 디렉터리에 새 DB 파일을 만들어 측정하므로
+데이터 디렉터리의 DB는 건드리지 않는다.
+
+실행:
+    python benchmarks/bench_storage.py [--records 500000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from storage import ResultStore  # noqa: E402
+
+
+def make_comments(size, seed=0):
+    """한국어 음절로 만든 단어 3~20개짜리 합성 댓글"""
+    rng = random.Random(seed)
+    syllables = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호사고안전재해중대노동"
+    start = pd.Timestamp("2025-01-01", tz="Asia/Seoul")
+
+    def word():
+        return "".join(rng.choice(syllables) for _ in range(rng.randint(1, 4)))
+
+    return pd.DataFrame({
+        'video_id': [f"v{i % 1000}" for i in range(size)],
+        'comment_id': [f"c{i}" for i in range(size)],
+        'author': "작성자",
+        'text': [" ".join(word() for _ in range(rng.randint(3, 20))) for _ in range(size)],
+        'like_count': 1,
+        'published_at': start + pd.to_timedelta(range(size), unit='min'),
+        'updated_at': start,
+    })
+
+
+def measure(label, func, records=None):
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    per_record = f"  {elapsed / records * 1e6:8.2f} µs/건" if records else ""
+    print(f"{label:<28} {elapsed:8.3f}s{per_record}")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 저장소 벤치마크")
+    parser.add_argument("--records", type=int, default=500000, help="댓글 수")
+    args = parser.parse_args()
+
+    comments = make_comments(args.records)
+    print(f"댓글: {len(comments):,}건, 평균 {comments['text'].str.len().mean():.0f}자")
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = ResultStore(os.path.join(directory, "bench.sqlite3"))
+        measure(f"저장 {len(comments):,}건", lambda: store.upsert('youtube_comment', comments, "벤치"),
+                len(comments))
+
+        # 좋아요 수만 바뀐 재수집 (검색 대상 컬럼이 그대로라 다시 색인하지 않음)
+        updated = comments.head(len(comments) // 5).assign(like_count=2)
+        measure(f"재수집 저장 {len(updated):,}건", lambda: store.upsert('youtube_comment', updated, "벤치"),
+                len(updated))
+
+        day = comments['published_at'].iloc[len(comments) // 2].strftime("%Y-%m-%d")
+        measure(f"기간 조회 ({day})", lambda: store.query('youtube_comment', start=day, end=day))
+        for text in ("사고", "중대재해", "가", "안전 사고"):
+            found = measure(f"검색 '{text}'", lambda: store.search('youtube_comment', text, limit=100))
+            print(f"{'':<28} {len(found)}건")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+텍스트 정규화 마이크로 벤치마크
+
+댓글 10만 건 규모의 합성 말뭉치로 레코드당 정리 비용을 측정한다.
+기존 방식(매번 컴파일되지 않은 re.sub + str.replace 연쇄)과 text_utils의
+clean_html(), clean_html_values(), clean_html_series()를 비교한다. 수집기처럼 API 응답 한 페이지(100건)씩
+정리하는 경우도 측정한다.
+
+실행:
+    python benchmarks/bench_text_utils.py [--records 100000] [--repeat 3]
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from text_utils import clean_html, clean_html_series, clean_html_values  # noqa: E402
+
+
+# 수집기가 한 번에 정리하는 API 응답 페이지 크기
+PAGE_SIZE = 100
+
+
+def legacy_clean_html(text):
+    """변경 전 수집기의 clean_html (비교용)"""
+    if not text:
+        return ""
+    text = re.sub(r'<[^>]+>', '', text)
+    text = text.replace('&quot;', '"')
+    text = text.replace('&#39;', "'")
+    text = text.replace('&amp;', '&')
+    text = text.replace('&lt;', '<')
+    text = text.replace('&gt;', '>')
+    text = text.replace('&nbsp;', ' ')
+    return text.strip()
+
+
+def make_corpus(size, seed=0):
+    """
+    댓글과 비슷한 합성 문자열 생성
+
+    대부분은 태그/엔티티가 없는 일반 문장이고, 일부에 태그, 이름 엔티티,
+    숫자 엔티티를 섞는다.
+    """
+    rng = random.Random(seed)
+    words = ["사고", "현장", "정부", "대책", "안전", "기업", "노동자", "책임", "조사", "발표",
+             "news", "video", "ㅋㅋㅋ", "진짜", "왜", "이번", "또", "결국"]
+    decorations = [
+        lambda s: s,
+        lambda s: s,
+        lambda s: s,
+        lambda s: f"<b>{s}</b>",
+        lambda s: f"{s} &quot;인용&quot;",
+        lambda s: f"{s} &#39;강조&#39; &#x27;더&#x27;",
+        lambda s: f"{s}&nbsp;&amp;&nbsp;{s}",
+    ]
+
+    corpus = []
+    for _ in range(size):
+        sentence = " ".join(rng.choice(words) for _ in range(rng.randint(3, 40)))
+        corpus.append(rng.choice(decorations)(sentence))
+    return corpus
+
+
+def measure(label, func, repeat, records):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<28} {best:8.3f}s  {best / records * 1e6:8.2f} µs/건")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="텍스트 정규화 벤치마크")
+    parser.add_argument("--records", type=int, default=100000, help="말뭉치 크기")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.records)
+    series = pd.Series(corpus)
+    print(f"말뭉치: {len(corpus):,}건, 평균 {sum(map(len, corpus)) / len(corpus):.0f}자")
+
+    measure("legacy clean_html", lambda: [legacy_clean_html(t) for t in corpus],
+            args.repeat, len(corpus))
+    measure("text_utils.clean_html", lambda: [clean_html(t) for t in corpus],
+            args.repeat, len(corpus))
+    measure("text_utils.clean_html_series", lambda: clean_html_series(series),
+            args.repeat, len(corpus))
+
+    pages = [corpus[start:start + PAGE_SIZE] for start in range(0, len(corpus), PAGE_SIZE)]
+    measure("clean_html, 페이지별", lambda: [[clean_html(t) for t in page] for page in pages],
+            args.repeat, len(corpus))
+    measure("clean_html_values, 페이지별", lambda: [clean_html_values(page) for page in pages],
+            args.repeat, len(corpus))
+
+    # 태그/엔티티가 없는 페이지 (대부분의 댓글 페이지)
+    plain = [t for t in corpus if '<' not in t and '&' not in t]
+    plain_pages = [plain[start:start + PAGE_SIZE] for start in range(0, len(plain), PAGE_SIZE)]
+    measure("clean_html, 일반 페이지별", lambda: [[clean_html(t) for t in page] for page in plain_pages],
+            args.repeat, len(plain))
+    measure("clean_html_values, 일반 페이지별", lambda: [clean_html_values(page) for page in plain_pages],
+            args.repeat, len(plain))
+
+    # 새 구현들의 결과가 같은지 확인
+    expected = [clean_html(t) for t in corpus]
+    assert clean_html_series(series).tolist() == expected
+    assert [t for page in pages for t in clean_html_values(page)] == expected
+
+
+if __name__ == "__main__":
+    main()
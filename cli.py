@@ -0,0 +1,314 @@
+"""
+뉴스/유튜브 수집 시스템 - 명령줄 실행기
+
+웹 앱 없이 수집 파이프라인(pipeline.py)을 실행하고 결과를 파일로 저장한다.
+cron 등에서 예약 실행하는 용도로, streamlit을 가져오지 않아 빠르게 시작한다.
+
+사용 예:
+    python cli.py -k 중대재해 -k 산업재해 --start 2025-11-01 --end 2025-11-07 \\
+        --source naver --source youtube --source comments --format xlsx --format parquet
+
+    python cli.py --config daily.json --incremental
+
+API 키는 환경변수 NAVER_CLIENT_ID, NAVER_CLIENT_SECRET, YOUTUBE_API_KEY
+(또는 현재 디렉터리의 .env 파일)에서 읽는다.
+
+설정 파일(JSON)에는 명령줄 옵션과 같은 이름의 키를 쓴다. 명령줄 옵션이 우선한다.
+    {"keywords": ["중대재해", "산업재해"], "sources": ["naver", "youtube"],
+     "naver_max": 500, "formats": ["parquet"], "output": "/data/argos"}
+
+종료 코드:
+    0  수집 성공
+    1  일부 키워드/소스 수집 실패 (성공한 결과는 저장)
+    2  인자 또는 설정 오류
+    3  전체 수집 실패 또는 결과 저장 실패
+"""
+import argparse
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+import exporters
+import pipeline
+import response_cache
+import settings
+import storage
+
+
+EXIT_OK = 0
+EXIT_PARTIAL = 1
+EXIT_USAGE = 2
+EXIT_FAILED = 3
+
+SOURCES = ('naver', 'youtube', 'comments')
+FORMATS = ('xlsx', 'parquet', 'csv', 'jsonl')
+
+# 명령줄과 설정 파일에 값이 없을 때 사용할 기본값 (웹 앱 기본값과 같음)
+DEFAULTS = {
+    'keywords': [],
+    'start': None,  # 종료일 30일 전
+    'end': None,  # 오늘
+    'sources': ['naver', 'youtube'],
+    'naver_max': 100,
+    'youtube_max': 50,
+    'comments_max': 100,
+    'channel_filter': True,
+    'engine': 'search',
+    'naver_extend': False,
+    'incremental': False,
+    'workers': 1,
+    'formats': ['xlsx'],
+    'output': '.',
+    'prefix': None,  # 수집결과_YYYYMMDD_HHMMSS
+    'representatives_only': False,
+    'cache': True,
+    'db': None,  # 지정하면 로컬 DB에 누적 저장
+    'verbose': False,
+}
+
+
+class UsageError(Exception):
+    """인자 또는 설정 오류"""
+
+
+class ConsoleReporter(pipeline.Reporter):
+    """수집 진행 상황을 표준 오류로 출력"""
+
+    def __init__(self, verbose=False):
+        self.verbose = verbose
+
+    def _print(self, message):
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}", file=sys.stderr, flush=True)
+
+    def keyword(self, keyword, index, total):
+        self._print(f"키워드 {index}/{total}: '{keyword}'")
+
+    def status(self, message):
+        if self.verbose:
+            self._print(message)
+
+    def success(self, message):
+        self._print(message)
+
+    def info(self, message):
+        self._print(message)
+
+    def warning(self, message):
+        self._print(message)
+
+    def error(self, message):
+        self._print(message)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="네이버 뉴스/유튜브 영상·댓글 수집 (명령줄 실행기)"
+    )
+    parser.add_argument("-k", "--keyword", dest="keywords", action="append",
+                        help="검색 키워드 (여러 번 지정 가능, 쉼표로 구분 가능)")
+    parser.add_argument("--start", help="시작일 (YYYY-MM-DD, 기본: 종료일 30일 전)")
+    parser.add_argument("--end", help="종료일 (YYYY-MM-DD, 기본: 오늘)")
+    parser.add_argument("-s", "--source", dest="sources", action="append", choices=SOURCES,
+                        help="수집 대상 (여러 번 지정 가능, 기본: naver, youtube)")
+    parser.add_argument("--naver-max", type=int, help="키워드당 최대 뉴스 수 (기본: 100)")
+    parser.add_argument("--youtube-max", type=int, help="키워드당 최대 영상 수 (기본: 50)")
+    parser.add_argument("--comments-max", type=int, help="영상당 최대 댓글 수 (기본: 100)")
+    parser.add_argument("--all-channels", dest="channel_filter", action="store_false", default=None,
+                        help="언론사 채널로 제한하지 않고 유튜브 전체에서 검색")
+    parser.add_argument("--engine", choices=("search", "uploads"),
+                        help="언론사 채널 수집 방식 (기본: search)")
+    parser.add_argument("--naver-extend", action="store_true", default=None,
+                        help="1,000건 상한에 걸리면 정확도순 검색으로 보충")
+    parser.add_argument("--incremental", action="store_true", default=None,
+                        help="키워드별 마지막 수집 이후에 게시된 항목만 수집")
+    parser.add_argument("-w", "--workers", type=int, help="동시에 수집할 키워드 수 (기본: 1)")
+    parser.add_argument("-f", "--format", dest="formats", action="append", choices=FORMATS,
+                        help="저장 형식 (여러 번 지정 가능, 기본: xlsx)")
+    parser.add_argument("-o", "--output", help="저장 디렉터리 (기본: 현재 디렉터리)")
+    parser.add_argument("--prefix", help="파일 이름 앞부분 (기본: 수집결과_YYYYMMDD_HHMMSS)")
+    parser.add_argument("--representatives-only", action="store_true", default=None,
+                        help="네이버 뉴스는 유사 중복 기사 군집별 대표 기사만 저장")
+    parser.add_argument("--no-cache", dest="cache", action="store_false", default=None,
+                        help="API 응답 캐시를 사용하지 않음")
+    parser.add_argument("--db", nargs="?", const=storage.DEFAULT_DB_PATH,
+                        help=f"수집 결과를 로컬 DB에 누적 저장 (경로 생략 시 {storage.DEFAULT_DB_PATH})")
+    parser.add_argument("-c", "--config", help="설정 파일 (JSON)")
+    parser.add_argument("-v", "--verbose", action="store_true", default=None,
+                        help="페이지 단위 진행 상황까지 출력")
+    return parser
+
+
+def load_options(args):
+    """
+    기본값 ← 설정 파일 ← 명령줄 순서로 옵션을 합침
+
+    Returns:
+    --------
+    dict
+        DEFAULTS와 같은 키를 가진 옵션
+    """
+    options = dict(DEFAULTS)
+
+    if args.config:
+        try:
+            with open(args.config, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        except (OSError, ValueError) as e:
+            raise UsageError(f"설정 파일을 읽을 수 없습니다: {args.config} ({e})")
+        if not isinstance(config, dict):
+            raise UsageError(f"설정 파일은 JSON 객체여야 합니다: {args.config}")
+        unknown = sorted(set(config) - set(DEFAULTS))
+        if unknown:
+            raise UsageError(f"설정 파일에 알 수 없는 항목이 있습니다: {', '.join(unknown)}")
+        options.update(config)
+
+    for key in DEFAULTS:
+        value = getattr(args, key, None)
+        if value is not None:
+            options[key] = value
+
+    # "중대재해, 산업재해"처럼 쉼표로 구분한 키워드도 허용 (웹 앱과 같음)
+    keywords = options['keywords']
+    if isinstance(keywords, str):
+        keywords = [keywords]
+    options['keywords'] = list(dict.fromkeys(
+        k.strip() for keyword in keywords for k in keyword.split(',') if k.strip()
+    ))
+    return options
+
+
+def validate(options, credentials):
+    """옵션과 API 키 검증 (오류가 있으면 UsageError)"""
+    errors = []
+
+    if not options['keywords']:
+        errors.append("검색 키워드를 지정해주세요. (-k/--keyword 또는 설정 파일의 keywords)")
+
+    try:
+        end = datetime.strptime(options['end'], "%Y-%m-%d") if options['end'] else datetime.now()
+        start = datetime.strptime(options['start'], "%Y-%m-%d") if options['start'] else end - timedelta(days=30)
+        options['start'] = start.strftime("%Y-%m-%d")
+        options['end'] = end.strftime("%Y-%m-%d")
+        if start > end:
+            errors.append("시작일이 종료일보다 늦을 수 없습니다.")
+    except (TypeError, ValueError):
+        errors.append(f"날짜 형식이 올바르지 않습니다 (YYYY-MM-DD): {options['start']} ~ {options['end']}")
+
+    unknown_sources = set(options['sources']) - set(SOURCES)
+    if unknown_sources:
+        errors.append(f"지원하지 않는 수집 대상입니다: {', '.join(sorted(unknown_sources))}")
+    elif not options['sources']:
+        errors.append("최소 하나의 수집 대상을 선택해주세요.")
+
+    unknown_formats = set(options['formats']) - set(FORMATS)
+    if unknown_formats:
+        errors.append(f"지원하지 않는 저장 형식입니다: {', '.join(sorted(unknown_formats))}")
+
+    if options['engine'] not in ("search", "uploads"):
+        errors.append(f"지원하지 않는 채널 수집 방식입니다: {options['engine']}")
+
+    for key in ('naver_max', 'youtube_max', 'comments_max', 'workers'):
+        if not isinstance(options[key], int) or options[key] < 1:
+            errors.append(f"{key}는 1 이상의 정수여야 합니다: {options[key]}")
+
+    if 'naver' in options['sources'] and not (credentials['naver_id'] and credentials['naver_secret']):
+        errors.append("네이버 API 키가 없습니다. (NAVER_CLIENT_ID, NAVER_CLIENT_SECRET 환경변수)")
+
+    if ({'youtube', 'comments'} & set(options['sources'])) and not credentials['youtube_key']:
+        errors.append("유튜브 API 키가 없습니다. (YOUTUBE_API_KEY 환경변수)")
+
+    if errors:
+        raise UsageError("\n".join(errors))
+
+
+def save_results(result, options):
+    """
+    수집 결과를 지정한 형식의 파일로 저장
+
+    Returns:
+    --------
+    list
+        저장한 파일 경로
+    """
+    output_dir = options['output']
+    prefix = options['prefix'] or f"수집결과_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+
+    if 'xlsx' in options['formats']:
+        path = os.path.join(output_dir, f"{prefix}.xlsx")
+        exporters.write_excel(result, path, representatives_only=options['representatives_only'])
+        paths.append(path)
+
+    analysis_formats = [fmt for fmt in options['formats'] if fmt != 'xlsx']
+    if analysis_formats:
+        paths.extend(exporters.export_results(
+            result, output_dir, analysis_formats, prefix,
+            representatives_only=options['representatives_only']
+        ))
+
+    return paths
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    credentials = settings.load_credentials()
+
+    try:
+        options = load_options(args)
+        validate(options, credentials)
+    except UsageError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return EXIT_USAGE
+
+    response_cache.configure(enabled=options['cache'])
+    reporter = ConsoleReporter(verbose=options['verbose'])
+    sources = set(options['sources'])
+
+    try:
+        result, failures = pipeline.run_collection(
+            options['keywords'], options['start'], options['end'],
+            collect_naver='naver' in sources,
+            collect_youtube='youtube' in sources,
+            collect_comments='comments' in sources,
+            naver_max=options['naver_max'],
+            youtube_max=options['youtube_max'],
+            youtube_filter=options['channel_filter'],
+            comments_max=options['comments_max'],
+            naver_extend=options['naver_extend'],
+            incremental=options['incremental'],
+            youtube_engine=options['engine'],
+            keyword_workers=options['workers'],
+            reporter=reporter,
+            **credentials
+        )
+    except Exception as e:
+        reporter.error(f"❌ 수집 중 오류 발생: {str(e)}")
+        return EXIT_FAILED
+
+    counts = result.counts()
+    reporter.info(
+        f"📊 뉴스 {counts['naver_news']:,}건 · 영상 {counts['youtube_video']:,}건 · "
+        f"댓글 {counts['youtube_comment']:,}건"
+    )
+
+    if len(result):
+        try:
+            for path in save_results(result, options):
+                reporter.info(f"💾 저장: {path}")
+            if options['db']:
+                saved = storage.get_store(options['db']).save(result)
+                reporter.info(f"🗄️ 로컬 DB 저장: {sum(saved.values()):,}건 ({options['db']})")
+        except Exception as e:
+            reporter.error(f"❌ 결과 저장 실패: {str(e)}")
+            return EXIT_FAILED
+
+    if failures:
+        return EXIT_PARTIAL if len(result) else EXIT_FAILED
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
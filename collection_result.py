@@ -0,0 +1,293 @@
+"""
+수집 결과 컨테이너 모듈
+
+네이버 뉴스, 유튜브 영상, 유튜브 댓글을 하나의 희소한 DataFrame으로 합치는 대신
+소스 타입별 테이블로 따로 보관한다. 각 테이블은 고유 키(link, video_id, comment_id)를
+인덱스로 가지며, 컬럼마다 명시적인 dtype(category, int64, 한국 시간 기준 tz-aware
+datetime64)을 사용한다.
+
+네이버 뉴스 테이블에는 여러 언론사에 실린 같은 기사를 묶은 유사 중복 군집
+(cluster_id)과 군집별 대표 기사 여부(is_representative)가 함께 붙는다.
+"""
+import threading
+
+import pandas as pd
+
+from near_duplicates import assign_clusters
+from time_utils import to_kst
+
+
+# 소스 타입별 고유 키 컬럼
+TABLE_KEYS = {
+    'naver_news': 'link',
+    'youtube_video': 'video_id',
+    'youtube_comment': 'comment_id',
+}
+
+# 소스 타입별 컬럼과 dtype
+SOURCE_SCHEMAS = {
+    'naver_news': {
+        'type': 'category',
+        'title': 'string',
+        'description': 'string',
+        'link': 'string',
+        'originallink': 'string',
+        'pubDate': 'datetime64[ns, Asia/Seoul]',
+        'source': 'string',
+        'author': 'string',
+        'keywords': 'string',
+        'cluster_id': 'int64',
+        'is_representative': 'bool',
+    },
+    'youtube_video': {
+        'type': 'category',
+        'video_id': 'string',
+        'title': 'string',
+        'description': 'string',
+        'channel_name': 'category',
+        'channel_id': 'category',
+        'published_at': 'datetime64[ns, Asia/Seoul]',
+        'url': 'string',
+        'view_count': 'int64',
+        'like_count': 'int64',
+        'comment_count': 'int64',
+        'tags': 'string',
+        'keywords': 'string',
+    },
+    'youtube_comment': {
+        'type': 'category',
+        'video_id': 'string',
+        'comment_id': 'string',
+        'author': 'string',
+        'text': 'string',
+        'like_count': 'int64',
+        'published_at': 'datetime64[ns, Asia/Seoul]',
+        'updated_at': 'datetime64[ns, Asia/Seoul]',
+        'keywords': 'string',
+    },
+}
+
+
+def typed_table(source_type, data):
+    """
+    레코드를 소스 타입의 컬럼과 dtype으로 정리
+
+    Parameters:
+    -----------
+    source_type : str
+        소스 타입 ("naver_news", "youtube_video", "youtube_comment")
+    data : pd.DataFrame or list
+        해당 소스의 DataFrame 또는 레코드 리스트
+
+    Returns:
+    --------
+    pd.DataFrame
+        SOURCE_SCHEMAS 순서의 컬럼만 남기고 dtype을 맞춘 DataFrame
+        (없는 컬럼은 결측값, 수치 컬럼의 결측값은 0, 대표 여부의 결측값은 True)
+    """
+    schema = SOURCE_SCHEMAS[source_type]
+    frame = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+    frame = frame.reindex(columns=list(schema))
+
+    columns = {}
+    for col, dtype in schema.items():
+        values = frame[col]
+        if col == 'type':
+            values = pd.Series(source_type, index=frame.index, dtype='category')
+        elif dtype == 'int64':
+            values = pd.to_numeric(values, errors='coerce').fillna(0).astype('int64')
+        elif dtype == 'bool':
+            values = values.astype('boolean').fillna(True).astype('bool')
+        elif dtype == 'datetime64[ns, Asia/Seoul]':
+            values = to_kst(values)
+        elif dtype == 'category':
+            values = values.astype('string').astype('category')
+        else:
+            values = values.astype(dtype)
+        columns[col] = values
+
+    return pd.DataFrame(columns, index=frame.index)
+
+
+class CollectionResult:
+    """
+    소스 타입별 수집 결과 테이블
+
+    수집 중에는 add()로 레코드를 고유 키 기준으로 누적하고, table()을 호출하면
+    그 사이 추가된 레코드만 typed DataFrame으로 변환하여 기존 테이블에 붙인다.
+    변환한 레코드(dict)는 버리므로 레코드와 테이블을 이중으로 들고 있지 않는다.
+    여러 키워드에서 나온 같은 항목은 한 번만 저장하고 keywords 컬럼에 키워드를 누적한다.
+    네이버 뉴스 테이블은 다시 만들 때마다 전체 기사를 유사 중복 군집으로 다시 묶는다.
+    키워드를 병렬로 수집할 수 있도록 add(), keys(), table()은 잠금 안에서 실행한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._keywords = {source_type: {} for source_type in TABLE_KEYS}  # 고유 키 → 키워드 목록
+        self._pending = {source_type: [] for source_type in TABLE_KEYS}
+        self._tables = {}
+        self._dirty = set()
+        self.duplicate_count = 0
+
+    def add(self, source_type, records, keyword=None):
+        """
+        레코드 추가
+
+        Parameters:
+        -----------
+        source_type : str
+            소스 타입
+        records : iterable
+            레코드(dict) 목록
+        keyword : str
+            레코드를 수집한 키워드
+
+        Returns:
+        --------
+        list
+            새로 추가된 항목의 고유 키 (이미 있던 항목은 키워드만 추가)
+        """
+        key = TABLE_KEYS[source_type]
+        added = []
+
+        with self._lock:
+            seen = self._keywords[source_type]
+            pending = self._pending[source_type]
+
+            changed = False
+            for record in records:
+                keywords = seen.get(record[key])
+                if keywords is None:
+                    seen[record[key]] = [keyword] if keyword else []
+                    pending.append(record)
+                    added.append(record[key])
+                else:
+                    self.duplicate_count += 1
+                    if keyword and keyword not in keywords:
+                        keywords.append(keyword)
+                        changed = True
+
+            # 새 항목이나 키워드가 없으면 테이블(뉴스 군집 포함)을 다시 만들 필요 없음
+            if added or changed:
+                self._dirty.add(source_type)
+        return added
+
+    def add_table(self, source_type, frame):
+        """
+        keywords 컬럼이 있는 테이블(저장소 조회 결과 등) 추가
+
+        Parameters:
+        -----------
+        source_type : str
+            소스 타입
+        frame : pd.DataFrame
+            소스 타입 컬럼과 쉼표로 구분한 keywords 컬럼을 가진 DataFrame
+
+        Returns:
+        --------
+        list
+            새로 추가된 항목의 고유 키
+        """
+        key = TABLE_KEYS[source_type]
+        added = []
+        columns = [col for col in frame.columns if col != 'keywords']
+        records = frame[columns].to_dict('records')
+        keyword_lists = [
+            [k.strip() for k in keywords.split(',') if k.strip()] if isinstance(keywords, str) else []
+            for keywords in frame['keywords'].tolist()
+        ]
+
+        with self._lock:
+            seen = self._keywords[source_type]
+            pending = self._pending[source_type]
+
+            changed = False
+            for record, names in zip(records, keyword_lists):
+                keywords = seen.get(record[key])
+                if keywords is None:
+                    seen[record[key]] = names
+                    pending.append(record)
+                    added.append(record[key])
+                else:
+                    self.duplicate_count += 1
+                    new_names = [name for name in names if name not in keywords]
+                    keywords.extend(new_names)
+                    changed = changed or bool(new_names)
+
+            if added or changed:
+                self._dirty.add(source_type)
+        return added
+
+    def keys(self, source_type):
+        """이미 수집한 고유 키 집합"""
+        with self._lock:
+            return set(self._keywords[source_type])
+
+    def table(self, source_type):
+        """
+        소스 타입 테이블
+
+        Returns:
+        --------
+        pd.DataFrame
+            고유 키를 인덱스로 하는 typed DataFrame
+        """
+        with self._lock:
+            return self._table(source_type)
+
+    def _table(self, source_type):
+        frame = self._tables.get(source_type)
+        if frame is None:
+            frame = typed_table(source_type, [])
+            frame.index = pd.Index([], dtype='string')
+
+        if source_type in self._dirty:
+            pending = self._pending[source_type]
+            if pending:
+                new = typed_table(source_type, pending)
+                new.index = pd.Index(new[TABLE_KEYS[source_type]].to_numpy(), dtype='string')
+                if not frame.empty:
+                    frame = pd.concat([frame, new])
+                    # 범주가 다른 category 컬럼은 합치면 object가 되므로 다시 변환
+                    for col, dtype in SOURCE_SCHEMAS[source_type].items():
+                        if dtype == 'category':
+                            frame[col] = frame[col].astype('category')
+                else:
+                    frame = new
+                # 외부에서 만든 레코드가 들어와도 고유 인덱스 유지
+                frame = frame[~frame.index.duplicated(keep='first')]
+                self._pending[source_type] = []
+
+            seen = self._keywords[source_type]
+            frame = frame.assign(keywords=pd.array(
+                [", ".join(seen[key]) for key in frame.index], dtype='string'
+            ))
+            if source_type == 'naver_news':
+                frame = assign_clusters(frame)
+            self._dirty.discard(source_type)
+            self._tables[source_type] = frame
+
+        return frame
+
+    def tables(self):
+        """
+        데이터가 있는 소스 타입별 테이블
+
+        Returns:
+        --------
+        dict
+            {소스 타입: 테이블}
+        """
+        return {
+            source_type: self.table(source_type)
+            for source_type, seen in self._keywords.items()
+            if seen
+        }
+
+    def counts(self):
+        """소스 타입별 건수"""
+        with self._lock:
+            return {source_type: len(seen) for source_type, seen in self._keywords.items()}
+
+    def __len__(self):
+        return sum(self.counts().values())
@@ -0,0 +1,436 @@
+"""
+수집 결과 내보내기 모듈
+
+수집 결과(CollectionResult 또는 DataFrame)를 소스 타입별 시트로 나누어 Excel 파일로 만든다.
+openpyxl의 write-only 모드로 행을 순서대로 기록하므로 댓글이 많은 데이터도
+워크북 전체를 메모리에 올리지 않고 만들 수 있다.
+
+분석용으로는 소스 타입별 Parquet(pyarrow 필요), gzip CSV, JSONL 파일을 만든다.
+세 형식 모두 청크 단위로 기록하며, DataFrame 대신 수집기 제너레이터처럼 레코드 묶음을
+생성하는 iterable을 넘기면 전체 결과를 모으지 않고 바로 파일로 기록한다.
+
+representatives_only를 지정하면 네이버 뉴스는 유사 중복 군집별 대표 기사만 내보낸다.
+"""
+import gzip
+import io
+import os
+import zipfile
+from contextlib import contextmanager
+from io import BytesIO
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
+
+from collection_result import SOURCE_SCHEMAS, CollectionResult, typed_table
+from near_duplicates import assign_clusters
+from time_utils import format_kst_series
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet 내보내기를 쓰지 않으면 없어도 됨
+    pa = None
+    pq = None
+
+
+# Excel 시트 한 장의 최대 행 수 (헤더 포함)
+EXCEL_MAX_ROWS = 1048576
+
+# 최대 컬럼 폭
+MAX_COLUMN_WIDTH = 50
+
+# 컬럼 폭 계산에 쓸 최대 행 수 (앞부분 절반 + 나머지에서 무작위 표본 절반)
+WIDTH_SAMPLE_ROWS = 2000
+
+# 행을 Excel 값으로 변환할 때 한 번에 처리할 행 수
+WRITE_CHUNK_ROWS = 10000
+
+# 분석용 형식에서 한 번에 기록할 행 수
+EXPORT_CHUNK_ROWS = 50000
+
+# JSONL 시각 문자열의 시간대 표기 (CSV의 tz-aware 시각 표기와 같음)
+KST_OFFSET = '+09:00'
+
+# 분석용 형식 → 파일 확장자
+EXPORT_FORMATS = {
+    'parquet': 'parquet',
+    'csv': 'csv.gz',
+    'jsonl': 'jsonl',
+}
+
+# 소스 타입별 (시트 이름, 내보낼 컬럼)
+EXPORT_SHEETS = {
+    'naver_news': ('네이버_뉴스', ['title', 'description', 'link', 'originallink', 'pubDate',
+                                   'keywords', 'cluster_id', 'is_representative']),
+    'youtube_video': ('유튜브_영상', ['title', 'description', 'channel_name', 'published_at',
+                                     'view_count', 'like_count', 'comment_count', 'tags', 'url',
+                                     'video_id', 'keywords']),
+    'youtube_comment': ('유튜브_댓글', ['video_id', 'author', 'text', 'like_count', 'published_at',
+                                       'keywords']),
+}
+
+
+def source_tables(data, representatives_only=False):
+    """
+    수집 결과를 소스 타입별 typed 테이블로 분리
+
+    Parameters:
+    -----------
+    data : CollectionResult or pd.DataFrame
+        수집 결과 컨테이너 또는 type 컬럼으로 소스를 구분하는 DataFrame
+    representatives_only : bool
+        네이버 뉴스를 유사 중복 군집별 대표 기사만 남길지 여부
+
+    Returns:
+    --------
+    dict
+        {소스 타입: 테이블} (데이터가 있는 타입만)
+    """
+    if isinstance(data, CollectionResult):
+        tables = data.tables()
+    elif data is None or data.empty or 'type' not in data.columns:
+        return {}
+    else:
+        tables = {}
+        for source_type, source_df in data.groupby('type', sort=False, observed=True):
+            if source_type in SOURCE_SCHEMAS:
+                tables[source_type] = typed_table(source_type, source_df)
+        # 군집을 계산하지 않은 DataFrame이면 여기서 묶음
+        if 'naver_news' in tables and 'cluster_id' not in data.columns:
+            tables['naver_news'] = assign_clusters(tables['naver_news'])
+
+    if representatives_only and 'naver_news' in tables:
+        news = tables['naver_news']
+        tables['naver_news'] = news[news['is_representative']]
+    return tables
+
+
+def select_export_frames(data, representatives_only=False):
+    """
+    수집 결과를 소스 타입별 Excel 시트용 DataFrame으로 분리
+
+    Returns:
+    --------
+    dict
+        {소스 타입: 내보낼 컬럼만 남긴 DataFrame} (데이터가 있는 타입만, EXPORT_SHEETS 순서)
+    """
+    tables = source_tables(data, representatives_only)
+    return {
+        source_type: tables[source_type][columns]
+        for source_type, (_, columns) in EXPORT_SHEETS.items()
+        if source_type in tables
+    }
+
+
+def column_widths(df, sample_rows=WIDTH_SAMPLE_ROWS):
+    """
+    컬럼별 표시 폭 계산 (헤더와 값 중 가장 긴 문자열 기준, 최대 MAX_COLUMN_WIDTH)
+
+    행이 sample_rows보다 많으면 앞부분과 나머지 행의 무작위 표본(항상 같은 표본)만 보고
+    계산하므로, 댓글이 많은 데이터도 모든 셀을 문자열로 바꾸지 않는다.
+
+    Returns:
+    --------
+    list
+        컬럼 순서대로의 폭
+    """
+    if len(df) > sample_rows:
+        head_rows = sample_rows // 2
+        rest = df.iloc[head_rows:].sample(n=sample_rows - head_rows, random_state=0)
+        df = pd.concat([df.iloc[:head_rows], rest])
+
+    widths = []
+    for col in df.columns:
+        values = df[col]
+        if isinstance(values.dtype, pd.StringDtype):
+            lengths = values.str.len()
+        else:
+            lengths = values.astype(str).str.len()
+        max_length = max(int(lengths.max()) if lengths.notna().any() else 0, len(str(col)))
+        widths.append(min(max_length + 2, MAX_COLUMN_WIDTH))
+    return widths
+
+
+def _iter_rows(df):
+    """DataFrame 행을 Excel에 쓸 수 있는 값 리스트로 변환하여 순서대로 생성 (결측값은 빈 셀)"""
+    for start in range(0, len(df), WRITE_CHUNK_ROWS):
+        chunk = df.iloc[start:start + WRITE_CHUNK_ROWS]
+        chunk = chunk.astype(object).where(chunk.notna(), None)
+        yield from chunk.itertuples(index=False, name=None)
+
+
+def _format_timestamps(df, with_offset=False):
+    """
+    tz-aware 시각 컬럼을 한국 시간 문자열로 변환
+
+    Excel은 시간대 정보를 저장할 수 없으므로 YYYY-MM-DD HH:MM:SS로, JSONL은 CSV와 같은
+    YYYY-MM-DD HH:MM:SS+09:00으로 기록한다 (with_offset=True).
+    """
+    formatted = {}
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.DatetimeTZDtype):
+            values = format_kst_series(df[col])
+            formatted[col] = values + KST_OFFSET if with_offset else values
+    return df.assign(**formatted) if formatted else df
+
+
+def _write_sheet(workbook, title, df, widths):
+    worksheet = workbook.create_sheet(title=title)
+
+    # write-only 모드에서는 행을 쓰기 전에 컬럼 폭을 지정해야 함
+    for idx, width in enumerate(widths, 1):
+        worksheet.column_dimensions[get_column_letter(idx)].width = width
+
+    worksheet.append(list(df.columns))
+    for row in _iter_rows(df):
+        worksheet.append(list(row))
+
+
+def write_excel(data, target, max_rows=EXCEL_MAX_ROWS, representatives_only=False):
+    """
+    수집 결과를 소스 타입별 시트로 나누어 Excel 파일로 저장
+
+    한 시트에 담을 수 없는 행 수는 "유튜브_댓글_2"처럼 번호를 붙인 시트로 이어서 기록한다.
+
+    Parameters:
+    -----------
+    data : CollectionResult or pd.DataFrame
+        수집 결과 (DataFrame은 type 컬럼으로 소스 구분)
+    target : str or file-like
+        저장할 파일 경로 또는 바이너리 파일 객체
+    max_rows : int
+        시트당 최대 행 수 (헤더 포함)
+    representatives_only : bool
+        네이버 뉴스를 유사 중복 군집별 대표 기사만 내보낼지 여부
+
+    Returns:
+    --------
+    dict
+        {시트 이름: 데이터 행 수}
+    """
+    workbook = Workbook(write_only=True)
+    rows_per_sheet = max_rows - 1
+    written = {}
+
+    for source_type, source_df in select_export_frames(data, representatives_only).items():
+        sheet_name = EXPORT_SHEETS[source_type][0]
+        source_df = _format_timestamps(source_df)
+        widths = column_widths(source_df)
+
+        for part, start in enumerate(range(0, len(source_df), rows_per_sheet), 1):
+            title = sheet_name if part == 1 else f"{sheet_name}_{part}"
+            part_df = source_df.iloc[start:start + rows_per_sheet]
+            _write_sheet(workbook, title, part_df, widths)
+            written[title] = len(part_df)
+
+    # 데이터가 없어도 열 수 있는 파일이 되도록 빈 시트 추가
+    if not written:
+        workbook.create_sheet(title='수집결과')
+
+    workbook.save(target)
+    return written
+
+
+def build_excel(data, max_rows=EXCEL_MAX_ROWS, representatives_only=False):
+    """
+    수집 결과 Excel 파일 내용 생성
+
+    Returns:
+    --------
+    bytes
+        xlsx 파일 내용
+    """
+    output = BytesIO()
+    write_excel(data, output, max_rows, representatives_only)
+    return output.getvalue()
+
+
+def _iter_chunks(source_type, data, chunk_rows):
+    """DataFrame 또는 레코드 묶음 iterable을 dtype을 맞춘 청크 단위로 생성"""
+    if isinstance(data, pd.DataFrame):
+        parts = (data.iloc[start:start + chunk_rows] for start in range(0, len(data), chunk_rows))
+    else:
+        parts = data
+
+    for part in parts:
+        if len(part):
+            yield typed_table(source_type, part)
+
+
+@contextmanager
+def _open_text(target, compress=False):
+    """경로 또는 바이너리 파일 객체를 UTF-8 텍스트 스트림으로 열기 (파일 객체는 닫지 않음)"""
+    if isinstance(target, (str, os.PathLike)):
+        opener = gzip.open if compress else open
+        with opener(target, 'wt', encoding='utf-8', newline='') as f:
+            yield f
+        return
+
+    stream = gzip.GzipFile(fileobj=target, mode='wb') if compress else target
+    wrapper = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+    try:
+        yield wrapper
+    finally:
+        wrapper.flush()
+        wrapper.detach()
+        if compress:
+            stream.close()
+
+
+def write_parquet(source_type, data, target, chunk_rows=EXPORT_CHUNK_ROWS):
+    """
+    소스 타입 데이터를 Parquet 파일로 저장 (청크마다 row group 하나)
+
+    Parameters:
+    -----------
+    source_type : str
+        소스 타입
+    data : pd.DataFrame or iterable
+        DataFrame 또는 레코드 리스트를 생성하는 iterable
+    target : str or file-like
+        저장할 파일 경로 또는 바이너리 파일 객체
+    chunk_rows : int
+        DataFrame을 나누어 기록할 행 수
+
+    Returns:
+    --------
+    int
+        기록한 행 수
+    """
+    if pq is None:
+        raise Exception("Parquet 내보내기에는 pyarrow가 필요합니다. (pip install pyarrow)")
+
+    written = 0
+    writer = None
+    try:
+        for chunk in _iter_chunks(source_type, data, chunk_rows):
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(target, table.schema, compression='snappy')
+            writer.write_table(table.cast(writer.schema))
+            written += len(chunk)
+
+        # 데이터가 없어도 스키마만 있는 파일 생성
+        if writer is None:
+            empty = pa.Table.from_pandas(typed_table(source_type, []), preserve_index=False)
+            writer = pq.ParquetWriter(target, empty.schema, compression='snappy')
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return written
+
+
+def write_csv(source_type, data, target, chunk_rows=EXPORT_CHUNK_ROWS):
+    """
+    소스 타입 데이터를 gzip 압축 CSV 파일로 저장 (파라미터는 write_parquet()와 같음)
+
+    Returns:
+    --------
+    int
+        기록한 행 수
+    """
+    written = 0
+    with _open_text(target, compress=True) as f:
+        for chunk in _iter_chunks(source_type, data, chunk_rows):
+            chunk.to_csv(f, header=(written == 0), index=False)
+            written += len(chunk)
+
+        if written == 0:
+            typed_table(source_type, []).to_csv(f, index=False)
+
+    return written
+
+
+def write_jsonl(source_type, data, target, chunk_rows=EXPORT_CHUNK_ROWS):
+    """
+    소스 타입 데이터를 JSON Lines 파일로 저장 (파라미터는 write_parquet()와 같음)
+
+    Returns:
+    --------
+    int
+        기록한 행 수
+    """
+    written = 0
+    with _open_text(target) as f:
+        for chunk in _iter_chunks(source_type, data, chunk_rows):
+            # 기본 ISO 형식은 UTC(...Z)로 기록되므로 CSV/Excel과 같은 한국 시간 문자열로 변환
+            _format_timestamps(chunk, with_offset=True).to_json(
+                f, orient='records', lines=True, force_ascii=False
+            )
+            written += len(chunk)
+
+    return written
+
+
+WRITERS = {
+    'parquet': write_parquet,
+    'csv': write_csv,
+    'jsonl': write_jsonl,
+}
+
+
+def export_results(data, output_dir, formats=('parquet', 'csv', 'jsonl'), prefix='수집결과',
+                   chunk_rows=EXPORT_CHUNK_ROWS, representatives_only=False):
+    """
+    수집 결과를 소스 타입별 분석용 파일로 저장
+
+    Parameters:
+    -----------
+    data : CollectionResult or pd.DataFrame
+        수집 결과 (DataFrame은 type 컬럼으로 소스 구분)
+    output_dir : str
+        저장할 디렉터리
+    formats : iterable
+        저장할 형식 ("parquet", "csv", "jsonl")
+    prefix : str
+        파일 이름 앞부분 (예: 수집결과_youtube_comment.parquet)
+    chunk_rows : int
+        한 번에 기록할 행 수
+    representatives_only : bool
+        네이버 뉴스를 유사 중복 군집별 대표 기사만 내보낼지 여부
+
+    Returns:
+    --------
+    list
+        저장한 파일 경로
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+
+    for source_type, source_df in source_tables(data, representatives_only).items():
+        for fmt in formats:
+            if fmt not in WRITERS:
+                raise Exception(f"지원하지 않는 내보내기 형식입니다: {fmt}")
+            path = os.path.join(output_dir, f"{prefix}_{source_type}.{EXPORT_FORMATS[fmt]}")
+            WRITERS[fmt](source_type, source_df, path, chunk_rows)
+            paths.append(path)
+
+    return paths
+
+
+def build_archive(data, fmt, prefix='수집결과', chunk_rows=EXPORT_CHUNK_ROWS,
+                  representatives_only=False):
+    """
+    소스 타입별 분석용 파일을 하나의 zip 파일 내용으로 생성 (다운로드용)
+
+    Returns:
+    --------
+    bytes
+        zip 파일 내용
+    """
+    if fmt not in WRITERS:
+        raise Exception(f"지원하지 않는 내보내기 형식입니다: {fmt}")
+
+    output = BytesIO()
+    # Parquet와 gzip CSV는 이미 압축되어 있으므로 JSONL만 압축
+    compression = zipfile.ZIP_DEFLATED if fmt == 'jsonl' else zipfile.ZIP_STORED
+
+    with zipfile.ZipFile(output, 'w', compression=compression) as archive:
+        for source_type, source_df in source_tables(data, representatives_only).items():
+            buffer = BytesIO()
+            WRITERS[fmt](source_type, source_df, buffer, chunk_rows)
+            archive.writestr(f"{prefix}_{source_type}.{EXPORT_FORMATS[fmt]}", buffer.getvalue())
+
+    return output.getvalue()
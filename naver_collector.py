@@ -3,29 +3,292 @@
 """
 import requests
 import pandas as pd
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import random
+import threading
 import time
-import re
 
+import rate_limiter
+import response_cache
+from settings import NAVER_RATE_LIMIT
+from text_utils import clean_html_values
+from time_utils import kst_timestamp, parse_naver_dates
 
-def clean_html(text):
-    """HTML 태그 및 특수문자 제거"""
-    if not text:
-        return ""
-    # HTML 태그 제거
-    text = re.sub(r'<[^>]+>', '', text)
-    # HTML 엔티티 변환
-    text = text.replace('&quot;', '"')
-    text = text.replace('&amp;', '&')
-    text = text.replace('&lt;', '<')
-    text = text.replace('&gt;', '>')
-    text = text.replace('&nbsp;', ' ')
-    return text.strip()
 
+NAVER_NEWS_URL = "https://openapi.naver.com/v1/search/news.json"
 
-def collect_naver_news(client_id, client_secret, query, start_date, end_date, max_results=1000):
+# 네이버 검색 API가 허용하는 최대 start 값
+NAVER_MAX_START = 1000
+
+# 재시도 설정
+MAX_RETRIES = 5
+BASE_BACKOFF = 0.5  # 초
+MAX_BACKOFF = 8.0  # 초
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+_session = None
+_session_lock = threading.Lock()
+_http_stats = {"requests": 0, "retries": 0}
+_stats_lock = threading.Lock()
+
+
+def _parse_items(items, start_dt, end_dt):
     """
-    네이버 뉴스 API를 사용하여 뉴스 기사 수집
+    API 응답 항목을 날짜 범위로 필터링하여 레코드로 변환
+    
+    페이지의 pubDate를 한 번에 한국 시간 기준 tz-aware 시각으로 변환하고,
+    날짜 범위는 마스크로 한 번에 거른다.
+    
+    Returns:
+    --------
+    tuple
+        (레코드 리스트, 페이지에서 가장 오래된 기사 시각, 가장 최신 기사 시각)
+    """
+    if not items:
+        return [], None, None
+    
+    pub_dates = parse_naver_dates(item.get("pubDate") for item in items)
+    
+    invalid = int(pub_dates.isna().sum())
+    if invalid:
+        print(f"pubDate를 해석할 수 없는 항목 {invalid}건을 제외했습니다.")
+    if invalid == len(items):
+        return [], None, None
+    
+    # 날짜 범위 확인 (NaT는 범위 밖으로 처리됨)
+    in_range = (pub_dates >= start_dt) & (pub_dates <= end_dt)
+    
+    # 제목/요약은 페이지 전체를 컬럼 단위로 정리
+    titles = clean_html_values(item.get("title", "") for item in items)
+    descriptions = clean_html_values(item.get("description", "") for item in items)
+    
+    records = [
+        {
+            "type": "naver_news",
+            "title": title,
+            "description": description,
+            "link": item.get("link", ""),
+            "originallink": item.get("originallink", ""),
+            "pubDate": pub_date,
+            "source": None,
+            "author": None
+        }
+        for item, title, description, pub_date, keep in zip(items, titles, descriptions, pub_dates, in_range)
+        if keep
+    ]
+    
+    return records, pub_dates.min(), pub_dates.max()
+
+
+def get_session():
+    """
+    keep-alive 연결을 재사용하는 프로세스 공용 세션 반환
+    
+    연결 풀 크기는 초당 호출 한도(동시 요청 수 상한)에 맞춘다.
+    """
+    global _session
+    
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=NAVER_RATE_LIMIT
+            )
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def get_http_stats():
+    """누적 요청/재시도 횟수 반환"""
+    with _stats_lock:
+        return dict(_http_stats)
+
+
+def _count(name):
+    with _stats_lock:
+        _http_stats[name] += 1
+
+
+def _backoff_delay(attempt):
+    """지수 백오프 + 지터 (full jitter)"""
+    return random.uniform(0, min(MAX_BACKOFF, BASE_BACKOFF * (2 ** attempt)))
+
+
+def _fetch_page(headers, params, limiter):
+    """
+    뉴스 검색 결과 한 페이지 요청
+    
+    호출 한도 초과(429), 서버 오류(5xx), 시간 초과/연결 오류는 지수 백오프 후
+    같은 페이지를 다시 요청하며, MAX_RETRIES번 재시도 후에도 실패하면 예외를 발생시킨다.
+    응답 캐시가 설정되어 있으면 캐시된 페이지는 API를 호출하지 않고 반환한다.
+    
+    Returns:
+    --------
+    list
+        응답 항목 리스트
+    """
+    cache = response_cache.get_cache()
+    if cache is not None:
+        cached = cache.get("naver.news", params)
+        if cached is not None:
+            return cached
+    
+    session = get_session()
+    last_error = None
+    
+    for attempt in range(MAX_RETRIES + 1):
+        if attempt > 0:
+            _count("retries")
+            print(f"{last_error}. 다시 시도 중... ({attempt}/{MAX_RETRIES})")
+            time.sleep(_backoff_delay(attempt - 1))
+        
+        # 초당 호출 한도 및 일일 할당량 확인 (필요한 만큼만 대기)
+        limiter.acquire(method="news")
+        _count("requests")
+        
+        try:
+            response = session.get(NAVER_NEWS_URL, headers=headers, params=params, timeout=10)
+            
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            last_error = f"요청 실패 ({type(e).__name__})"
+            continue
+            
+        except Exception as e:
+            raise Exception(f"네이버 API 호출 중 오류 발생: {str(e)}")
+        
+        if response.status_code == 200:
+            items = response.json().get("items", [])
+            if cache is not None:
+                cache.set("naver.news", params, items)
+            return items
+            
+        elif response.status_code in RETRY_STATUS_CODES:
+            last_error = f"API 오류 (status {response.status_code})"
+            continue
+            
+        else:
+            raise Exception(
+                f"네이버 API 호출 중 오류 발생: API 오류 (status {response.status_code}): {response.text}"
+            )
+    
+    raise Exception(f"네이버 API 호출 중 오류 발생: 재시도 {MAX_RETRIES}회 초과 ({last_error})")
+
+
+def _iter_pages(headers, query, max_results, start_dt, end_dt, limiter,
+                sort="date", max_workers=1):
+    """
+    100건 단위 페이지를 요청하여 날짜 범위 내 기사를 페이지별로 생성
+    
+    필요한 페이지 수만큼 묶어서(max_workers > 1이면 병렬로) 요청하고, 결과는 항상
+    페이지 순서대로 병합한다. sort="date"인 경우 start_dt 이전 기사가 나온 페이지
+    이후로는 더 볼 필요가 없으므로 남은 요청을 취소하고 중단한다. 병렬 요청 시에는
+    앞서 받은 페이지의 기사 간격으로 시작일까지 필요한 페이지 수를 추정하여
+    그만큼만 한 번에 보낸다.
+    
+    Yields:
+    -------
+    list
+        페이지별 레코드 리스트 (페이지 순서, 합계 max_results 이내)
+        
+    Returns:
+    --------
+    bool
+        start 상한에 걸려 기간 전체를 보지 못했는지 여부 (제너레이터 반환값)
+    """
+    collected = 0
+    next_start = 1
+    finished = False
+    newest = oldest = None
+    pages_done = 0
+    
+    while collected < max_results and next_start <= NAVER_MAX_START and not finished:
+        pages_needed = -(-(max_results - collected) // 100)
+        
+        if sort == "date" and max_workers > 1:
+            if newest is None:
+                pages_needed = 1  # 첫 페이지로 기사 간격 측정
+            elif newest > oldest:
+                per_page = (newest - oldest) / pages_done
+                pages_needed = min(pages_needed, -(-(oldest - start_dt) // per_page) + 1)
+        
+        starts = list(range(next_start, NAVER_MAX_START + 1, 100))[:pages_needed]
+        next_start = starts[-1] + 100
+        
+        # 시작일 이전 기사가 나온 페이지 번호 (이후 페이지는 요청하지 않음)
+        cutoff = [len(starts)]
+        cutoff_lock = threading.Lock()
+        
+        def fetch(idx, start):
+            if sort == "date" and idx > cutoff[0]:
+                return None, False
+            
+            params = {
+                "query": query,
+                "display": 100,
+                "start": start,
+                "sort": sort
+            }
+            items = _fetch_page(headers, params, limiter)
+            
+            records, page_oldest, page_newest = _parse_items(items, start_dt, end_dt)
+            if sort == "date" and (not items or (page_oldest is not None and page_oldest < start_dt)):
+                with cutoff_lock:
+                    cutoff[0] = min(cutoff[0], idx)
+            return items, (records, page_oldest, page_newest)
+        
+        if max_workers > 1 and len(starts) > 1:
+            workers = min(max_workers, NAVER_RATE_LIMIT, len(starts))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(fetch, idx, start) for idx, start in enumerate(starts)]
+                pages = [future.result() for future in futures]
+        else:
+            pages = []
+            for idx, start in enumerate(starts):
+                pages.append(fetch(idx, start))
+                if idx >= cutoff[0]:
+                    break
+        
+        for idx, (items, parsed) in enumerate(pages):
+            if idx > cutoff[0]:
+                break
+            if items is None:
+                continue
+            if not items:
+                finished = True  # 더 이상 결과가 없으면 중단
+                break
+            
+            records, page_oldest, page_newest = parsed
+            records = records[:max_results - collected]
+            collected += len(records)
+            if records:
+                yield records
+            
+            if page_oldest is not None:
+                if newest is None:
+                    newest = page_newest
+                pages_done += 1
+                oldest = page_oldest
+            
+            if idx == cutoff[0]:
+                finished = True  # 시작일 이전 기사까지 도달
+                break
+    
+    return not finished and collected < max_results
+
+
+def iter_naver_news(client_id, client_secret, query, start_date, end_date, max_results=1000,
+                    concurrent=False, max_workers=NAVER_RATE_LIMIT, extend_coverage=False,
+                    since=None, status=None):
+    """
+    네이버 뉴스 기사를 페이지 단위로 수집하는 제너레이터
+    
+    최신순으로 페이징하면서 시작일 이전 기사가 나오면 즉시 중단한다. 네이버 API는
+    start를 1000까지만 허용하고 날짜 조건 검색을 지원하지 않으므로, 기사가 많은
+    키워드는 기간 앞부분을 다 보지 못할 수 있다. 이 경우 status["truncated"]가
+    True가 되며, extend_coverage=True이면 정확도순 검색을 추가로 수행하여 기간 내
+    기사를 보충한다.
     
     Parameters:
     -----------
@@ -41,11 +304,22 @@ def collect_naver_news(client_id, client_secret, query, start_date, end_date, ma
         종료일 (YYYY-MM-DD)
     max_results : int
         최대 수집 건수
+    concurrent : bool
+        페이지 요청을 병렬로 보낼지 여부
+    max_workers : int
+        병렬 요청 시 최대 동시 요청 수 (초당 호출 한도 이내로 제한)
+    extend_coverage : bool
+        최신순 검색이 start 상한에 걸린 경우 정확도순 검색으로 보충할지 여부
+    since : str
+        증분 수집 워터마크 (YYYY-MM-DD HH:MM:SS). 지정하면 이 시각 이후(같은 시각 포함)
+        기사만 수집하고 워터마크 이전 기사에 도달하면 페이징을 중단
+    status : dict
+        수집 상태를 받을 딕셔너리 (수집이 끝나면 "truncated" 키가 채워짐)
         
-    Returns:
-    --------
-    pd.DataFrame
-        수집된 뉴스 데이터
+    Yields:
+    -------
+    list
+        페이지별 뉴스 레코드 리스트
     """
     
     headers = {
@@ -53,89 +327,101 @@ def collect_naver_news(client_id, client_secret, query, start_date, end_date, ma
         "X-Naver-Client-Secret": client_secret
     }
     
-    base_url = "https://openapi.naver.com/v1/search/news.json"
+    limiter = rate_limiter.get_limiter("naver", client_id)
+    workers = max_workers if concurrent else 1
     
-    # 날짜 변환
-    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-    end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+    # 날짜 변환 (한국 시간 기준, 종료일은 해당 일자 23:59:59까지 포함)
+    start_dt = kst_timestamp(start_date)
+    end_dt = kst_timestamp(f"{end_date} 23:59:59")
     
-    results = []
-    total_collected = 0
+    if since:
+        # 워터마크와 같은 초에 게시된 다른 기사도 받도록 이상 조건 (이미 받은 기사는 link로 중복 제거)
+        start_dt = max(start_dt, kst_timestamp(since))
     
-    # 100건씩 페이징하여 수집
-    for start in range(1, max_results + 1, 100):
-        if total_collected >= max_results:
+    seen_links = set()
+    collected = 0
+    
+    pages = _iter_pages(headers, query, max_results, start_dt, end_dt, limiter, max_workers=workers)
+    while True:
+        try:
+            records = next(pages)
+        except StopIteration as stop:
+            truncated = stop.value
             break
-            
-        params = {
-            "query": query,
-            "display": min(100, max_results - total_collected),
-            "start": start,
-            "sort": "date"
-        }
+        seen_links.update(record["link"] for record in records)
+        collected += len(records)
+        yield records
+    
+    if status is not None:
+        status["truncated"] = truncated
+    
+    if truncated:
+        print(f"'{query}': 검색 결과가 {NAVER_MAX_START}건 상한을 넘어 기간 일부가 누락되었습니다.")
         
-        try:
-            response = requests.get(base_url, headers=headers, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                items = data.get("items", [])
-                
-                if not items:
-                    break  # 더 이상 결과가 없으면 중단
-                
-                for item in items:
-                    try:
-                        # 날짜 파싱 (예: "Mon, 01 Nov 2025 10:30:00 +0900")
-                        pub_dt = datetime.strptime(item["pubDate"], "%a, %d %b %Y %H:%M:%S %z")
-                        pub_date_naive = pub_dt.replace(tzinfo=None)
-                        
-                        # 날짜 범위 확인
-                        if not (start_dt <= pub_date_naive <= end_dt):
-                            continue
-                        
-                        results.append({
-                            "type": "naver_news",
-                            "title": clean_html(item.get("title", "")),
-                            "description": clean_html(item.get("description", "")),
-                            "link": item.get("link", ""),
-                            "originallink": item.get("originallink", ""),
-                            "pubDate": pub_date_naive.strftime("%Y-%m-%d %H:%M:%S"),
-                            "source": None,
-                            "author": None
-                        })
-                        
-                        total_collected += 1
-                        
-                    except Exception as e:
-                        print(f"항목 처리 중 오류: {e}")
-                        continue
-                
-                # API 제한 준수를 위한 대기
-                time.sleep(0.1)
-                
-            elif response.status_code == 429:
-                print("API 호출 한도 초과. 잠시 대기 중...")
-                time.sleep(1)
-                continue
-                
-            else:
-                error_msg = f"API 오류 (status {response.status_code}): {response.text}"
-                raise Exception(error_msg)
-                
-        except requests.exceptions.Timeout:
-            print("요청 시간 초과. 다시 시도 중...")
-            time.sleep(1)
-            continue
-            
-        except Exception as e:
-            raise Exception(f"네이버 API 호출 중 오류 발생: {str(e)}")
+        if extend_coverage:
+            extra_pages = _iter_pages(
+                headers, query, max_results - collected, start_dt, end_dt, limiter,
+                sort="sim", max_workers=workers
+            )
+            for records in extra_pages:
+                new_records = [record for record in records if record["link"] not in seen_links]
+                seen_links.update(record["link"] for record in new_records)
+                if new_records:
+                    yield new_records
+
+
+def collect_naver_news(client_id, client_secret, query, start_date, end_date, max_results=1000,
+                       concurrent=False, max_workers=NAVER_RATE_LIMIT, extend_coverage=False,
+                       since=None):
+    """
+    네이버 뉴스 API를 사용하여 뉴스 기사 수집
+    
+    iter_naver_news()의 결과를 하나의 DataFrame으로 모은다. 검색 결과가 start 상한에
+    걸려 기간 일부를 보지 못한 경우 attrs["truncated"]가 True가 된다.
+    
+    Parameters:
+    -----------
+    client_id : str
+        네이버 API Client ID
+    client_secret : str
+        네이버 API Client Secret
+    query : str
+        검색 키워드
+    start_date : str
+        시작일 (YYYY-MM-DD)
+    end_date : str
+        종료일 (YYYY-MM-DD)
+    max_results : int
+        최대 수집 건수
+    concurrent : bool
+        페이지 요청을 병렬로 보낼지 여부
+    max_workers : int
+        병렬 요청 시 최대 동시 요청 수 (초당 호출 한도 이내로 제한)
+    extend_coverage : bool
+        최신순 검색이 start 상한에 걸린 경우 정확도순 검색으로 보충할지 여부
+    since : str
+        증분 수집 워터마크 (YYYY-MM-DD HH:MM:SS)
+        
+    Returns:
+    --------
+    pd.DataFrame
+        수집된 뉴스 데이터
+    """
+    status = {}
+    results = []
+    for records in iter_naver_news(client_id, client_secret, query, start_date, end_date,
+                                   max_results, concurrent, max_workers, extend_coverage,
+                                   since, status):
+        results.extend(records)
+    truncated = status.get("truncated", False)
     
     if not results:
-        return pd.DataFrame(columns=["type", "title", "description", "link", "originallink", 
-                                     "pubDate", "source", "author"])
+        df = pd.DataFrame(columns=["type", "title", "description", "link", "originallink", 
+                                   "pubDate", "source", "author"])
+    else:
+        df = pd.DataFrame(results)
     
-    df = pd.DataFrame(results)
+    df.attrs["truncated"] = truncated
     return df
 
 
@@ -153,14 +439,14 @@ def validate_api_key(client_id, client_secret):
         "X-Naver-Client-Secret": client_secret
     }
     
-    base_url = "https://openapi.naver.com/v1/search/news.json"
     params = {
         "query": "테스트",
         "display": 1
     }
     
     try:
-        response = requests.get(base_url, headers=headers, params=params, timeout=5)
+        rate_limiter.get_limiter("naver", client_id).acquire(method="news")
+        response = get_session().get(NAVER_NEWS_URL, headers=headers, params=params, timeout=5)
         
         if response.status_code == 200:
             return True, "✅ 네이버 API 키가 유효합니다."
@@ -0,0 +1,270 @@
+"""
+유사 중복 기사 군집화 모듈
+
+같은 통신사 기사가 여러 언론사에 다른 link로 실리면 link 기준 중복 제거로는 걸러지지
+않는다. 제목+요약의 문자 n-gram 집합에 MinHash 서명을 만들고, LSH(서명을 band로 나누어
+같은 버킷에 들어간 항목만 후보로 비교)로 후보 쌍을 찾아 군집으로 묶는다. 모든 쌍을
+비교하지 않으므로 10만 건 이상에서도 거의 선형 시간에 동작한다.
+
+n-gram 해시, MinHash, band 버킷, 연결 요소 계산은 모두 numpy 배열 연산으로 처리한다.
+"""
+import numpy as np
+import pandas as pd
+
+
+# 서명 길이 (해시 함수 수)
+NUM_PERM = 64
+
+# 문자 n-gram 길이 (공백/문장부호를 뺀 글자 기준)
+SHINGLE_SIZE = 4
+
+# 같은 군집으로 볼 추정 자카드 유사도 하한
+DEFAULT_THRESHOLD = 0.7
+
+# 해시 함수 난수 시드 (실행마다 같은 군집이 나오도록 고정)
+SEED = 1
+
+_MASK32 = np.uint64(0xFFFFFFFF)
+
+_word_chars = None
+
+
+def _word_char_table():
+    """BMP 코드 포인트별 글자/숫자 여부 (처음 사용할 때 한 번 계산)"""
+    global _word_chars
+    if _word_chars is None:
+        _word_chars = np.fromiter((chr(c).isalnum() for c in range(0x10000)), dtype=bool, count=0x10000)
+    return _word_chars
+
+
+def _shingle_hashes(texts, shingle_size):
+    """
+    문서별 문자 n-gram 해시
+
+    모든 문서를 소문자 UTF-32 코드 배열 하나로 이어 붙이고 글자/숫자가 아닌 문자를
+    지운다 (띄어쓰기, 문장부호만 다른 기사를 같게 취급). 문서마다 뒤에 0을
+    shingle_size - 1개 채워 문서 경계를 넘는 n-gram이 생기지 않게 하고, 문서의 각
+    글자에서 시작하는 n-gram의 다항식 해시를 한 번에 계산한다.
+
+    Returns:
+    --------
+    tuple
+        (n-gram 해시 배열 uint64, 문서별 시작 위치, n-gram이 있는 문서 마스크)
+    """
+    texts = [text.lower() if isinstance(text, str) else '' for text in texts]
+    raw_lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+    codes = np.frombuffer(''.join(texts).encode('utf-32-le'), dtype=np.uint32)
+
+    # 글자/숫자만 남김 (BMP 밖의 문자는 그대로 둠)
+    keep = np.ones(len(codes), dtype=bool)
+    in_bmp = codes < 0x10000
+    keep[in_bmp] = _word_char_table()[codes[in_bmp]]
+    kept_before = np.concatenate(([0], np.cumsum(keep)))
+    doc_ends = np.cumsum(raw_lengths)
+    lengths = kept_before[doc_ends] - kept_before[doc_ends - raw_lengths]
+    codes = codes[keep].astype(np.uint64)
+
+    # 문서마다 0을 shingle_size - 1개 덧붙인 배열에 글자 배치
+    doc_ids = np.repeat(np.arange(len(texts)), lengths)
+    positions = np.arange(len(codes)) + doc_ids * (shingle_size - 1)
+    padded = np.zeros(len(codes) + len(texts) * (shingle_size - 1), dtype=np.uint64)
+    padded[positions] = codes
+
+    windows = len(padded) - shingle_size + 1
+    hashes = np.zeros(max(windows, 0), dtype=np.uint64)
+    base = np.uint64(1000003)
+    for offset in range(shingle_size):
+        hashes = hashes * base + padded[offset:offset + windows]
+
+    shingle_starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    return hashes[positions], shingle_starts, lengths > 0
+
+
+def minhash_signatures(texts, num_perm=NUM_PERM, shingle_size=SHINGLE_SIZE, seed=SEED):
+    """
+    문서별 MinHash 서명 계산
+
+    Parameters:
+    -----------
+    texts : list
+        문서 문자열 목록
+    num_perm : int
+        서명 길이
+    shingle_size : int
+        문자 n-gram 길이
+    seed : int
+        해시 함수 난수 시드
+
+    Returns:
+    --------
+    tuple
+        (서명 배열 (문서 수 × num_perm, uint32), 서명이 있는 문서 마스크)
+        빈 문서는 서명이 없으며 다른 문서와 묶이지 않는다.
+    """
+    hashes, shingle_starts, valid = _shingle_hashes(texts, shingle_size)
+    signatures = np.full((len(texts), num_perm), np.iinfo(np.uint32).max, dtype=np.uint32)
+    if not valid.any():
+        return signatures, valid
+
+    # 32비트 치환: (a * x + b) mod 2^32 (a는 홀수이므로 일대일) 뒤에 xorshift로 상위 비트를 하위 비트에 섞음
+    # x는 32비트로 줄인 n-gram 해시
+    rng = np.random.default_rng(seed)
+    a = rng.integers(0, 2**32, size=num_perm, dtype=np.uint32) | np.uint32(1)
+    b = rng.integers(0, 2**32, size=num_perm, dtype=np.uint32)
+    x = ((hashes ^ (hashes >> np.uint64(32))) & _MASK32).astype(np.uint32)
+    starts = shingle_starts[valid]
+
+    # 해시 함수마다 같은 버퍼를 재사용하여 n-gram 수 크기의 임시 배열을 만들지 않음
+    permuted = np.empty(len(x), dtype=np.uint32)
+    shifted = np.empty(len(x), dtype=np.uint32)
+    for perm in range(num_perm):
+        np.multiply(x, a[perm], out=permuted)
+        np.add(permuted, b[perm], out=permuted)
+        np.right_shift(permuted, 15, out=shifted)
+        np.bitwise_xor(permuted, shifted, out=permuted)
+        signatures[valid, perm] = np.minimum.reduceat(permuted, starts)
+
+    return signatures, valid
+
+
+def lsh_params(threshold, num_perm=NUM_PERM):
+    """
+    임계 유사도에 맞는 (band 수, band당 행 수)
+
+    band 수 b, 행 수 r인 LSH에서 두 문서가 후보가 될 확률은 (1/b)^(1/r) 부근에서 급격히
+    오른다. 후보 쌍은 서명 비교로 다시 거르므로, 이 지점이 threshold 이하인 조합 중
+    가장 가까운 것을 골라 놓치는 쌍을 줄인다.
+    """
+    candidates = [(num_perm // rows, rows) for rows in range(1, num_perm + 1) if num_perm % rows == 0]
+    below = [br for br in candidates if (1 / br[0]) ** (1 / br[1]) <= threshold] or candidates[:1]
+    return max(below, key=lambda br: (1 / br[0]) ** (1 / br[1]))
+
+
+def _connected_components(n, left, right):
+    """간선 목록의 연결 요소 (각 원소의 라벨은 요소 안 가장 작은 위치)"""
+    labels = np.arange(n)
+    if len(left) == 0:
+        return labels
+
+    while True:
+        label_left, label_right = labels[left], labels[right]
+        low = np.minimum(label_left, label_right)
+        if np.array_equal(label_left, label_right):
+            break
+        # 두 끝의 대표를 더 작은 대표에 연결한 뒤 경로 압축
+        np.minimum.at(labels, label_left, low)
+        np.minimum.at(labels, label_right, low)
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+    return labels
+
+
+def cluster_near_duplicates(texts, threshold=DEFAULT_THRESHOLD, num_perm=NUM_PERM,
+                            shingle_size=SHINGLE_SIZE, seed=SEED):
+    """
+    유사 중복 문서 군집화
+
+    Parameters:
+    -----------
+    texts : list
+        문서 문자열 목록
+    threshold : float
+        같은 군집으로 묶을 추정 자카드 유사도 하한 (0~1)
+    num_perm, shingle_size, seed :
+        minhash_signatures() 참고
+
+    Returns:
+    --------
+    np.ndarray
+        문서별 군집 라벨 (군집 안 첫 문서의 위치)
+    """
+    n = len(texts)
+    signatures, valid = minhash_signatures(texts, num_perm, shingle_size, seed)
+    bands, rows = lsh_params(threshold, num_perm)
+    positions = np.flatnonzero(valid)
+
+    rng = np.random.default_rng(seed + 1)
+    weights = rng.integers(1, 2**63, size=rows, dtype=np.uint64) | np.uint64(1)
+
+    left, right = [], []
+    for band in range(bands):
+        # band의 행들을 64비트 값 하나로 묶어 버킷 키로 사용
+        band_rows = signatures[positions, band * rows:(band + 1) * rows].astype(np.uint64)
+        keys = (band_rows * weights).sum(axis=1)
+        _, first, inverse, counts = np.unique(
+            keys, return_index=True, return_inverse=True, return_counts=True
+        )
+        shared = counts[inverse] > 1
+        members = positions[shared]
+        heads = positions[first[inverse[shared]]]
+        not_head = members != heads
+        left.append(members[not_head])
+        right.append(heads[not_head])
+
+    left = np.concatenate(left) if left else np.empty(0, dtype=np.int64)
+    right = np.concatenate(right) if right else np.empty(0, dtype=np.int64)
+
+    if len(left):
+        # 같은 쌍이 여러 band에서 나오면 한 번만 확인
+        pairs = np.unique(left.astype(np.int64) * n + right)
+        left, right = pairs // n, pairs % n
+        # LSH 후보 중 서명 일치 비율(추정 자카드 유사도)이 임계값 이상인 쌍만 연결
+        similarity = (signatures[left] == signatures[right]).mean(axis=1)
+        close = similarity >= threshold
+        left, right = left[close], right[close]
+
+    return _connected_components(n, left, right)
+
+
+def assign_clusters(frame, columns=('title', 'description'), time_column='pubDate',
+                    threshold=DEFAULT_THRESHOLD):
+    """
+    DataFrame에 유사 중복 군집 컬럼 추가
+
+    군집마다 게시 시각이 가장 이른 항목(원문일 가능성이 가장 높음)을 대표로 표시한다.
+
+    Parameters:
+    -----------
+    frame : pd.DataFrame
+        뉴스 테이블
+    columns : tuple
+        비교할 텍스트 컬럼 (이어 붙여 한 문서로 취급)
+    time_column : str
+        대표 선정 기준 시각 컬럼
+    threshold : float
+        같은 군집으로 묶을 추정 자카드 유사도 하한
+
+    Returns:
+    --------
+    pd.DataFrame
+        cluster_id(1부터 시작, 행 순서대로 부여), is_representative 컬럼을 추가한 DataFrame
+    """
+    if frame.empty:
+        return frame.assign(
+            cluster_id=pd.Series(dtype='int64', index=frame.index),
+            is_representative=pd.Series(dtype='bool', index=frame.index),
+        )
+
+    parts = [frame[col].astype(object).where(frame[col].notna(), '').tolist()
+             for col in columns if col in frame.columns]
+    texts = [' '.join(values) for values in zip(*parts)] if parts else [''] * len(frame)
+
+    labels = cluster_near_duplicates(texts, threshold=threshold)
+    cluster_ids = pd.factorize(labels)[0].astype(np.int64) + 1
+
+    # 군집별로 가장 이른 게시 시각, 같으면 먼저 나온 행을 대표로
+    if time_column in frame.columns:
+        times = pd.to_datetime(frame[time_column], errors='coerce', utc=True)
+        nanoseconds = times.dt.tz_convert(None).to_numpy('datetime64[ns]').view(np.int64)
+        order_time = np.where(times.isna(), np.iinfo(np.int64).max, nanoseconds)
+    else:
+        order_time = np.zeros(len(frame), dtype=np.int64)
+    order = np.lexsort((np.arange(len(frame)), order_time, cluster_ids))
+    representative = np.zeros(len(frame), dtype=bool)
+    first_in_cluster = np.concatenate(([True], cluster_ids[order][1:] != cluster_ids[order][:-1]))
+    representative[order[first_in_cluster]] = True
+
+    return frame.assign(cluster_id=cluster_ids, is_representative=representative)
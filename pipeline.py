@@ -0,0 +1,263 @@
+"""
+수집 파이프라인 모듈
+
+키워드별 네이버 뉴스 → 유튜브 영상 → 유튜브 댓글 수집 순서, 증분 수집 워터마크,
+키워드 간 중복 제거를 담당한다. 같은 기사가 여러 언론사에 실린 유사 중복 뉴스는
+CollectionResult가 군집으로 묶는다. streamlit을 가져오지 않으므로 웹 앱(app.py)과
+명령줄 실행기(cli.py)가 함께 사용하며, 진행 상황은 Reporter를 통해 전달한다.
+"""
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from collection_result import CollectionResult
+import naver_collector
+import youtube_collector
+import quota_ledger
+import rate_limiter
+import watermarks
+
+
+class Reporter:
+    """
+    수집 진행 상황 출력 인터페이스
+
+    기본 구현은 아무것도 출력하지 않는다. 웹 앱과 명령줄 실행기는 이 클래스를
+    상속하여 화면이나 로그에 표시한다. 키워드를 병렬로 수집하면 여러 스레드에서
+    호출될 수 있다.
+    """
+
+    def keyword(self, keyword, index, total):
+        """키워드 수집 시작"""
+
+    def status(self, message):
+        """진행 중 상태 (페이지 단위로 자주 호출됨)"""
+
+    def success(self, message):
+        """소스 하나의 수집 완료"""
+
+    def info(self, message):
+        """참고 메시지"""
+
+    def warning(self, message):
+        """경고 메시지"""
+
+    def error(self, message):
+        """수집 실패 메시지"""
+
+    def step(self, done, total):
+        """전체 단계 중 완료한 단계 수"""
+
+
+def run_collection(keywords, start_date, end_date, collect_naver=True, collect_youtube=True,
+                   collect_comments=False, naver_id=None, naver_secret=None, youtube_key=None,
+                   naver_max=100, youtube_max=50, youtube_filter=True, comments_max=100,
+                   naver_extend=False, incremental=False, youtube_engine="search",
+                   keyword_workers=1, reporter=None):
+    """
+    여러 키워드의 뉴스/영상/댓글 수집
+
+    소스 하나의 수집이 실패해도 나머지 소스와 키워드는 계속 수집하고, 실패 내역을
+    함께 반환한다.
+
+    Parameters:
+    -----------
+    keywords : list
+        검색 키워드 목록
+    start_date : str
+        시작 날짜 (YYYY-MM-DD)
+    end_date : str
+        종료 날짜 (YYYY-MM-DD)
+    collect_naver, collect_youtube, collect_comments : bool
+        수집 대상
+    naver_id, naver_secret : str
+        네이버 API Client ID / Secret
+    youtube_key : str
+        유튜브 API 키
+    naver_max : int
+        키워드당 최대 뉴스 수
+    youtube_max : int
+        키워드당 최대 영상 수
+    youtube_filter : bool
+        언론사 채널만 수집할지 여부
+    comments_max : int
+        영상당 최대 댓글 수
+    naver_extend : bool
+        1,000건 상한에 걸릴 때 정확도순 검색으로 보충할지 여부
+    incremental : bool
+        키워드별 워터마크 이후에 게시된 항목만 수집할지 여부
+    youtube_engine : str
+        채널 수집 방식 ("search" 또는 "uploads")
+    keyword_workers : int
+        동시에 수집할 키워드 수 (1이면 호출한 스레드에서 순서대로 수집)
+    reporter : Reporter
+        진행 상황 출력 대상 (None이면 출력하지 않음)
+
+    Returns:
+    --------
+    tuple
+        (CollectionResult, 실패 목록)
+        실패 목록의 각 항목은 {'keyword', 'source', 'error'} dict
+    """
+    reporter = reporter or Reporter()
+
+    # 실행 전체에서 공유하는 수집 결과 (소스 타입별 테이블)
+    # 여러 키워드에서 나온 항목은 한 번만 저장하고 keywords에 키워드를 누적한다
+    result = CollectionResult()
+    failures = []
+
+    # 이번 실행의 실제 사용량 집계
+    quota_ledger.get_ledger().reset()
+
+    total_steps = len(keywords) * sum([collect_naver, collect_youtube, collect_comments])
+    progress = {'done': 0}
+    lock = threading.Lock()
+
+    def finish_step():
+        with lock:
+            progress['done'] += 1
+            done = progress['done']
+        reporter.step(done, total_steps)
+
+    def fail(keyword, source, label, error):
+        with lock:
+            failures.append({'keyword': keyword, 'source': source, 'error': str(error)})
+        reporter.error(f"❌ '{keyword}' {label} 수집 실패: {str(error)}")
+
+    def collect_keyword(keyword_idx, keyword):
+        reporter.keyword(keyword, keyword_idx, len(keywords))
+
+        # 1. 네이버 뉴스 수집
+        if collect_naver:
+            reporter.status(f"📰 네이버 뉴스 수집 중... (키워드: {keyword})")
+            try:
+                naver_since = watermarks.get_watermark('naver_news', keyword) if incremental else None
+                naver_status = {}
+                naver_records = []
+
+                # 페이지가 도착할 때마다 누적 건수 표시
+                for records in naver_collector.iter_naver_news(
+                    naver_id, naver_secret, keyword, start_date, end_date, naver_max,
+                    concurrent=True, extend_coverage=naver_extend, since=naver_since,
+                    status=naver_status
+                ):
+                    naver_records.extend(records)
+                    reporter.status(f"📰 네이버 뉴스 수집 중... (키워드: {keyword}, {len(naver_records)}건)")
+
+                if incremental and naver_records:
+                    # 건수 상한이나 API 상한에 걸려 워터마크까지 보지 못했으면 워터마크를 유지
+                    watermarks.advance_watermark(
+                        'naver_news', keyword, [record['pubDate'] for record in naver_records],
+                        complete=not naver_status.get("truncated") and len(naver_records) < naver_max
+                    )
+                naver_added = result.add('naver_news', naver_records, keyword)
+
+                reporter.success(f"✅ '{keyword}' 네이버 뉴스: {len(naver_records)}건 (신규 {len(naver_added)}건)")
+                if naver_status.get("truncated"):
+                    reporter.warning(f"⚠️ '{keyword}': 검색 결과가 1,000건 상한을 넘어 기간 앞부분 일부가 누락되었을 수 있습니다.")
+            except Exception as e:
+                fail(keyword, 'naver_news', "네이버 뉴스", e)
+
+            finish_step()
+
+        # 2. 유튜브 영상 수집
+        video_ids = []
+        youtube_records = []
+        if collect_youtube:
+            reporter.status(f"🎥 유튜브 영상 수집 중... (키워드: {keyword})")
+            try:
+                youtube_source = watermarks.watermark_source('youtube_video', youtube_filter)
+                youtube_since = watermarks.get_watermark(youtube_source, keyword) if incremental else None
+                youtube_usage = Counter()
+
+                # 앞선 키워드에서 이미 수집한 영상은 통계·댓글을 다시 요청하지 않음
+                known_video_ids = result.keys('youtube_video')
+
+                for records in youtube_collector.iter_youtube_videos(
+                    youtube_key, keyword, start_date, end_date, youtube_filter, youtube_max,
+                    since=youtube_since, engine=youtube_engine, usage=youtube_usage,
+                    known_video_ids=known_video_ids
+                ):
+                    youtube_records.extend(records)
+                    reporter.status(f"🎥 유튜브 영상 수집 중... (키워드: {keyword}, {len(youtube_records)}건)")
+
+                if incremental and youtube_records:
+                    watermarks.advance_watermark(
+                        youtube_source, keyword, [record['published_at'] for record in youtube_records],
+                        complete=len(youtube_records) < youtube_max
+                    )
+                # 병렬 수집 중 다른 키워드가 먼저 추가한 영상은 제외하고 이 키워드가 추가한 영상만 댓글 수집
+                video_ids = result.add('youtube_video', youtube_records, keyword)
+
+                youtube_units = sum(youtube_usage.values())
+                reporter.success(f"✅ '{keyword}' 유튜브 영상: {len(youtube_records)}건 (신규 {len(video_ids)}건, 사용 {youtube_units:,} units)")
+            except Exception as e:
+                fail(keyword, 'youtube_video', "유튜브 영상", e)
+
+            finish_step()
+
+        # 3. 유튜브 댓글 수집
+        if collect_comments and video_ids:
+            reporter.status(f"💬 유튜브 댓글 수집 중... (키워드: {keyword})")
+            try:
+                comment_records = []
+                comment_progress = [0, len(set(video_ids))]
+
+                def on_comment_progress(done, total):
+                    comment_progress[:] = [done, total]
+
+                # 영상 게시 시각으로 댓글 응답 캐시 유지 시간을 정함
+                published_at = {record['video_id']: record['published_at'] for record in youtube_records}
+
+                for records in youtube_collector.iter_youtube_comments(
+                    youtube_key, video_ids, comments_max,
+                    progress_callback=on_comment_progress, published_at=published_at
+                ):
+                    comment_records.extend(records)
+                    done, total = comment_progress
+                    reporter.status(f"💬 유튜브 댓글 수집 중... (키워드: {keyword}, 영상 {done}/{total}, {len(comment_records)}건)")
+
+                result.add('youtube_comment', comment_records, keyword)
+
+                reporter.success(f"✅ '{keyword}' 유튜브 댓글: {len(comment_records)}건")
+            except Exception as e:
+                fail(keyword, 'youtube_comment', "유튜브 댓글", e)
+
+            finish_step()
+        elif collect_comments and youtube_records:
+            reporter.info(f"ℹ️ '{keyword}': 모두 다른 키워드에서 이미 댓글을 수집한 영상입니다.")
+            finish_step()
+        elif collect_comments:
+            reporter.warning(f"⚠️ '{keyword}': 수집된 영상이 없어 댓글을 수집할 수 없습니다.")
+            finish_step()
+
+    try:
+        if keyword_workers > 1 and len(keywords) > 1:
+            with ThreadPoolExecutor(max_workers=min(keyword_workers, len(keywords))) as executor:
+                futures = [
+                    executor.submit(collect_keyword, keyword_idx, keyword)
+                    for keyword_idx, keyword in enumerate(keywords, 1)
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            for keyword_idx, keyword in enumerate(keywords, 1):
+                collect_keyword(keyword_idx, keyword)
+    finally:
+        # 블록 단위로 예약하고 남은 할당량은 다른 프로세스가 쓸 수 있도록 반환
+        rate_limiter.release_all()
+
+    if len(result):
+        if result.duplicate_count > 0:
+            reporter.info(f"🔄 키워드 간 중복: {result.duplicate_count}건 (한 번만 저장, 최종 {len(result)}건)")
+        news = result.table('naver_news')
+        representatives = int(news['is_representative'].sum())
+        if representatives < len(news):
+            reporter.info(
+                f"🧩 유사 중복 기사: 뉴스 {len(news):,}건 → 대표 기사 {representatives:,}건 "
+                f"({len(news) - representatives:,}건은 다른 언론사에 실린 같은 기사)"
+            )
+    else:
+        reporter.warning("⚠️ 수집된 데이터가 없습니다.")
+
+    return result, failures
@@ -0,0 +1,168 @@
+"""
+API 할당량 사용 기록 및 수집 비용 예측 모듈
+
+RateLimiter를 거치는 모든 호출은 서비스/메서드별 호출 수와 사용량(units)이
+QuotaLedger에 기록된다. plan_run()은 수집 조건으로 실행 전에 비용을 예측한다.
+"""
+import math
+import threading
+from collections import defaultdict
+from datetime import datetime
+
+from settings import NAVER_DAILY_LIMIT, YOUTUBE_DAILY_UNITS, YOUTUBE_UNIT_COSTS
+
+
+# 언론사 채널 하루 평균 업로드 수 추정치 (업로드 목록 방식 비용 예측용)
+UPLOADS_PER_CHANNEL_PER_DAY = 30
+
+DAILY_LIMITS = {
+    "naver": NAVER_DAILY_LIMIT,
+    "youtube": YOUTUBE_DAILY_UNITS,
+}
+
+
+class QuotaLedger:
+    """서비스/메서드별 호출 수와 사용량 기록"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = defaultdict(int)
+        self._units = defaultdict(int)
+
+    def record(self, service, method, units, calls=1):
+        """
+        호출 기록
+
+        Parameters:
+        -----------
+        service : str
+            서비스 이름 ("naver" 또는 "youtube")
+        method : str
+            API 메서드 이름 (예: "news", "search.list")
+        units : int
+            사용한 할당량
+        calls : int
+            HTTP 요청 수 (배치 요청은 하위 요청이 여러 개여도 1회)
+        """
+        with self._lock:
+            self._calls[(service, method)] += calls
+            self._units[(service, method)] += units
+
+    def snapshot(self):
+        """
+        현재까지의 기록
+
+        Returns:
+        --------
+        dict
+            {서비스: {메서드: {"calls": 호출 수, "units": 사용량}}}
+        """
+        with self._lock:
+            result = {}
+            for (service, method), units in self._units.items():
+                result.setdefault(service, {})[method] = {
+                    "calls": self._calls[(service, method)],
+                    "units": units,
+                }
+            return result
+
+    def total(self, service):
+        """서비스의 총 사용량"""
+        with self._lock:
+            return sum(units for (s, _), units in self._units.items() if s == service)
+
+    def reset(self):
+        """기록 초기화"""
+        with self._lock:
+            self._calls.clear()
+            self._units.clear()
+
+
+_ledger = QuotaLedger()
+
+
+def get_ledger():
+    """프로세스 공용 기록 반환"""
+    return _ledger
+
+
+def plan_run(num_keywords, start_date, end_date,
+             naver_max=0, youtube_max=0, channel_filter=True, engine="search",
+             comments_per_video=0, num_channels=10, naver_extend=False):
+    """
+    수집 실행 전 API 사용량 예측
+
+    수집기가 실제로 보내는 요청 단위(네이버 100건 페이지, search.list 50건 페이지,
+    videos.list 50개 묶음, commentThreads 100건 페이지)로 계산한 예상 사용량이다.
+    네이버는 시작일 이전 기사가 나오면, 댓글은 영상에 댓글이 더 없으면 일찍 멈추므로
+    실제 사용량은 대개 이보다 적다. 응답 캐시에서 가져온 요청은 포함하지 않는다.
+
+    Parameters:
+    -----------
+    num_keywords : int
+        키워드 수
+    start_date : str
+        시작일 (YYYY-MM-DD)
+    end_date : str
+        종료일 (YYYY-MM-DD)
+    naver_max : int
+        키워드당 네이버 최대 수집 건수 (0이면 수집 안 함)
+    youtube_max : int
+        키워드당 유튜브 최대 영상 수 (0이면 수집 안 함)
+    channel_filter : bool
+        언론사 채널만 수집할지 여부
+    engine : str
+        언론사 채널 수집 방식 ("search" 또는 "uploads")
+    comments_per_video : int
+        영상당 최대 댓글 수 (0이면 수집 안 함)
+    num_channels : int
+        언론사 채널 수
+    naver_extend : bool
+        정확도순 보충 검색 사용 여부
+
+    Returns:
+    --------
+    dict
+        {"naver": {메서드: 호출 수}, "youtube": {메서드: units}, "totals": {서비스: 합계},
+         "percent": {서비스: 일일 한도 대비 %}}
+    """
+    plan = {"naver": {}, "youtube": {}}
+
+    if naver_max:
+        pages = math.ceil(min(naver_max, 1000) / 100)
+        if naver_extend:
+            pages *= 2
+        plan["naver"]["news"] = pages * num_keywords
+
+    if youtube_max:
+        youtube = plan["youtube"]
+
+        if channel_filter and engine == "uploads":
+            # 채널 업로드 목록은 키워드 수와 무관하게 기간당 한 번만 조회
+            days = (datetime.strptime(end_date, "%Y-%m-%d")
+                    - datetime.strptime(start_date, "%Y-%m-%d")).days + 1
+            uploads = UPLOADS_PER_CHANNEL_PER_DAY * max(days, 1)
+            pages = math.ceil(uploads / 50) * num_channels
+            youtube["playlistItems.list"] = pages * YOUTUBE_UNIT_COSTS["playlistItems.list"]
+            youtube["videos.list"] = pages * YOUTUBE_UNIT_COSTS["videos.list"]
+        else:
+            if channel_filter:
+                # 첫 회차에 모든 채널을 한 페이지씩 조회, 이후 50건 단위로 추가 조회
+                pages = max(num_channels, math.ceil(youtube_max / 50))
+            else:
+                pages = math.ceil(youtube_max / 50)
+            youtube["search.list"] = pages * YOUTUBE_UNIT_COSTS["search.list"] * num_keywords
+            youtube["videos.list"] = (
+                math.ceil(youtube_max / 50) * YOUTUBE_UNIT_COSTS["videos.list"] * num_keywords
+            )
+
+        if comments_per_video:
+            pages = math.ceil(comments_per_video / 100) * youtube_max * num_keywords
+            youtube["commentThreads.list"] = pages * YOUTUBE_UNIT_COSTS["commentThreads.list"]
+
+    plan["totals"] = {service: sum(plan[service].values()) for service in ("naver", "youtube")}
+    plan["percent"] = {
+        service: plan["totals"][service] / DAILY_LIMITS[service] * 100
+        for service in ("naver", "youtube")
+    }
+    return plan
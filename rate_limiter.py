@@ -0,0 +1,218 @@
+"""
+API 호출 속도 제한 및 일일 할당량 관리 모듈
+
+네이버/유튜브 수집기의 모든 API 호출은 이 모듈의 RateLimiter를 거친다.
+인증 정보(API 키)별로 초당 호출 수는 토큰 버킷으로, 일일 사용량은
+로컬 파일에 기록하여 프로세스를 재시작해도 유지한다. 사용량 파일은 같은 데이터
+디렉터리를 쓰는 다른 프로세스(예: 명령줄 실행기와 스케줄러)와 잠금으로 공유한다.
+일일 사용량은 블록 단위로 미리 예약하므로 호출마다 파일을 읽고 쓰지 않고,
+쓰지 않은 예약분은 수집이 끝날 때나 프로세스가 종료될 때 돌려준다.
+"""
+import atexit
+import hashlib
+import os
+import threading
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import quota_ledger
+import settings
+import state_file
+
+
+# 서비스별 기본 한도
+SERVICE_LIMITS = {
+    "naver": {
+        "rate": settings.NAVER_RATE_LIMIT,
+        "daily_limit": settings.NAVER_DAILY_LIMIT,
+        "timezone": settings.NAVER_QUOTA_TIMEZONE,
+        "block": settings.NAVER_QUOTA_BLOCK,
+    },
+    "youtube": {
+        "rate": settings.YOUTUBE_RATE_LIMIT,
+        "daily_limit": settings.YOUTUBE_DAILY_UNITS,
+        "timezone": settings.YOUTUBE_QUOTA_TIMEZONE,
+        "block": settings.YOUTUBE_QUOTA_BLOCK,
+    },
+}
+
+DEFAULT_STATE_PATH = os.path.join(settings.DATA_DIR, "quota_usage.json")
+
+_registry_lock = threading.Lock()
+_limiters = {}
+
+
+class QuotaExceededError(Exception):
+    """일일 할당량을 초과하는 호출을 시도한 경우"""
+
+
+def credential_id(credential):
+    """인증 정보를 파일에 남기지 않도록 해시값으로 변환"""
+    return hashlib.sha256(credential.encode("utf-8")).hexdigest()[:16]
+
+
+class RateLimiter:
+    """
+    인증 정보 하나에 대한 초당 호출 제한 + 일일 할당량 관리
+
+    Parameters:
+    -----------
+    service : str
+        서비스 이름 ("naver" 또는 "youtube")
+    credential : str
+        API 키 또는 Client ID
+    rate : float
+        초당 최대 호출 수
+    daily_limit : int
+        일일 할당량 (호출 수 또는 units)
+    timezone : str
+        일일 할당량이 초기화되는 기준 시간대
+    burst : int
+        한 번에 연속으로 보낼 수 있는 최대 호출 수
+    state_path : str
+        일일 사용량 저장 파일 경로
+    block : int
+        사용량 파일에 한 번에 예약할 할당량 (1이면 호출마다 기록)
+    """
+
+    def __init__(self, service, credential, rate, daily_limit, timezone,
+                 burst=1, state_path=DEFAULT_STATE_PATH, block=1):
+        self.service = service
+        self.key = credential_id(credential)
+        self.rate = rate
+        self.daily_limit = daily_limit
+        self.burst = burst
+        self.state_path = state_path
+        self.block = max(1, block)
+        self._tz = ZoneInfo(timezone)
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._day = None
+        self._used = 0
+        self._reserved = 0
+        self._sync()
+
+    def _today(self):
+        return datetime.now(self._tz).strftime("%Y-%m-%d")
+
+    def _sync(self, delta=0, need=0):
+        """
+        파일에 사용량 증가분(음수면 반환분)을 반영하고 최신 사용량을 읽어옴
+
+        날짜가 바뀌었으면 전날 예약분은 버린다. need가 있으면 다른 프로세스가 쓴
+        사용량까지 포함하여 파일 잠금 안에서 남은 할당량을 확인하고, 예약분만으로
+        need를 채울 수 없으면 블록 단위로 더 예약한다. 남은 할당량이 블록보다 적으면
+        남은 만큼만 예약하고, 모자라는 양보다도 적으면 QuotaExceededError를 발생시킨다.
+        """
+        today = self._today()
+
+        with state_file.locked(self.state_path):
+            state = state_file.read_json(self.state_path)
+            entry = state.setdefault(self.service, {}).get(self.key, {})
+            used = entry.get("used", 0) if entry.get("date") == today else 0
+
+            if self._day != today:
+                self._day = today
+                self._reserved = 0
+                delta = max(delta, 0)
+
+            if need > self._reserved:
+                shortfall = need - self._reserved
+                available = self.daily_limit - used
+                if shortfall > available:
+                    self._used = used
+                    raise QuotaExceededError(
+                        f"{self.service} 일일 할당량 초과 "
+                        f"(사용 {used - self._reserved:,} / 한도 {self.daily_limit:,})"
+                    )
+                grant = min(max(self.block, shortfall), available)
+                delta += grant
+                self._reserved += grant
+
+            if delta:
+                used = max(0, used + delta)
+                state[self.service][self.key] = {"date": today, "used": used}
+                state_file.write_json(self.state_path, state)
+
+        self._used = used
+
+    def acquire(self, cost=1, calls=1, method=None):
+        """
+        호출을 위한 허가 획득 (필요한 만큼만 대기)
+
+        Parameters:
+        -----------
+        cost : int
+            이번 호출이 소모하는 할당량
+        calls : int
+            초당 호출 제한에 반영할 HTTP 요청 수 (배치 요청은 여러 호출을 묶어 1회)
+        method : str
+            사용 기록(quota_ledger)에 남길 API 메서드 이름
+
+        Returns:
+        --------
+        float
+            대기한 시간 (초)
+        """
+        with self._lock:
+            # 예약분이 남아 있으면 파일을 읽고 쓰지 않음
+            if self._reserved < cost or self._day != self._today():
+                self._sync(need=cost)
+            self._reserved -= cost
+            quota_ledger.get_ledger().record(self.service, method or "other", cost, calls)
+
+            # 토큰 버킷 보충 후 토큰 예약 (부족하면 음수가 되어 대기 시간으로 환산)
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            self._tokens -= calls
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def used_today(self):
+        """오늘 사용한 할당량 (다른 프로세스가 예약만 하고 아직 쓰지 않은 양 포함)"""
+        with self._lock:
+            self._sync()
+            return self._used - self._reserved
+
+    def remaining(self):
+        """오늘 남은 할당량"""
+        return max(0, self.daily_limit - self.used_today())
+
+    def release(self):
+        """쓰지 않은 예약분을 사용량 파일에 돌려줌"""
+        with self._lock:
+            if self._reserved:
+                self._sync(-self._reserved)
+                self._reserved = 0
+
+
+def get_limiter(service, credential):
+    """
+    서비스/인증 정보별 공유 RateLimiter 반환
+
+    같은 인증 정보로 호출하는 모든 코드가 하나의 버킷과 사용량을 공유한다.
+    """
+    registry_key = (service, credential_id(credential))
+
+    with _registry_lock:
+        limiter = _limiters.get(registry_key)
+        if limiter is None:
+            limiter = RateLimiter(service, credential, **SERVICE_LIMITS[service])
+            _limiters[registry_key] = limiter
+        return limiter
+
+
+@atexit.register
+def release_all():
+    """이 프로세스의 모든 RateLimiter가 쓰지 않은 예약분 반환"""
+    with _registry_lock:
+        limiters = list(_limiters.values())
+
+    for limiter in limiters:
+        limiter.release()
@@ -0,0 +1,238 @@
+"""
+API 응답 로컬 캐시 모듈
+
+같은 키워드/기간으로 다시 수집할 때 동일한 API 요청에 할당량을 또 쓰지 않도록
+응답을 SQLite 파일에 저장한다. 캐시 키는 엔드포인트와 정규화된 요청 파라미터로
+만들며, 엔드포인트별 TTL과 용량 기준 LRU 정리를 적용한다.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import settings
+from time_utils import kst_timestamp
+
+
+DEFAULT_CACHE_PATH = os.path.join(settings.DATA_DIR, "response_cache.sqlite3")
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+# 엔드포인트별 캐시 유지 시간 (초)
+CACHE_TTLS = {
+    "naver.news": 30 * 60,
+    "youtube.search.list": 30 * 60,
+    "youtube.videos.list": 6 * 60 * 60,
+    "youtube.commentThreads.list": 30 * 60,  # 게시 시각을 모르는 영상 (comment_thread_ttl 참고)
+    "youtube.playlistItems.list": 30 * 60,
+}
+DEFAULT_TTL = 60 * 60
+
+# 댓글 스레드 캐시 유지 시간: 게시된 지 RECENT_VIDEO_AGE가 지나지 않은 영상은 댓글이
+# 계속 달리므로 짧게, 오래된 영상은 댓글이 거의 바뀌지 않으므로 길게 유지
+RECENT_VIDEO_AGE = 48 * 60 * 60
+COMMENT_TTL_RECENT = 30 * 60
+COMMENT_TTL_OLD = 24 * 60 * 60
+
+# 캐시 키에서 제외할 파라미터 (인증 정보, 응답 형식)
+IGNORED_PARAMS = {"key", "alt"}
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def make_key(endpoint, params):
+    """엔드포인트와 정규화된 파라미터로 캐시 키 생성"""
+    normalized = {
+        k: str(v) for k, v in params.items()
+        if k not in IGNORED_PARAMS and v is not None
+    }
+    payload = json.dumps([endpoint, normalized], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def comment_thread_ttl(published_at, now=None):
+    """
+    영상 게시 시각에 따른 commentThreads.list 캐시 유지 시간
+
+    Parameters:
+    -----------
+    published_at : str or pd.Timestamp or None
+        영상 게시 시각 (없거나 해석할 수 없으면 최근 영상으로 취급)
+    now : float
+        현재 시각 (epoch 초, 기본: time.time())
+
+    Returns:
+    --------
+    int
+        유지 시간 (초)
+    """
+    try:
+        published = kst_timestamp(published_at).timestamp()
+    except (TypeError, ValueError):
+        return COMMENT_TTL_RECENT
+    if published != published:  # NaT
+        return COMMENT_TTL_RECENT
+
+    age = (time.time() if now is None else now) - published
+    return COMMENT_TTL_OLD if age >= RECENT_VIDEO_AGE else COMMENT_TTL_RECENT
+
+
+class ResponseCache:
+    """
+    SQLite 기반 API 응답 캐시
+
+    Parameters:
+    -----------
+    path : str
+        캐시 파일 경로
+    max_bytes : int
+        캐시 최대 용량 (초과 시 가장 오래 사용되지 않은 항목부터 삭제)
+    ttls : dict
+        엔드포인트별 유지 시간 (초), 지정하지 않으면 CACHE_TTLS 사용
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES, ttls=None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = dict(CACHE_TTLS, **(ttls or {}))
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                body TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)"
+        )
+        self._conn.commit()
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    def get(self, endpoint, params):
+        """
+        캐시된 응답 조회
+
+        Returns:
+        --------
+        dict or None
+            캐시된 응답 (없거나 만료된 경우 None)
+        """
+        key = make_key(endpoint, params)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, size, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or row[2] < now:
+                if row is not None:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._conn.commit()
+                    self._total_bytes -= row[1]
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+
+        return json.loads(row[0])
+
+    def set(self, endpoint, params, value, ttl=None):
+        """응답 저장 (ttl을 지정하지 않으면 엔드포인트별 기본값 사용)"""
+        key = make_key(endpoint, params)
+        body = json.dumps(value, ensure_ascii=False)
+        size = len(body.encode("utf-8"))
+        now = time.time()
+        ttl = ttl if ttl is not None else self.ttls.get(endpoint, DEFAULT_TTL)
+
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, endpoint, body, size, now + ttl, now)
+            )
+            self._total_bytes += size - (old[0] if old else 0)
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """최대 용량을 넘으면 가장 오래 사용되지 않은 항목부터 삭제"""
+        while self._total_bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_access LIMIT 100"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                break
+
+            for key, size in rows:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total_bytes -= size
+                if self._total_bytes <= self.max_bytes:
+                    break
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._total_bytes = 0
+
+    def stats(self):
+        """캐시 적중/미적중 횟수 및 저장 현황"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": entries,
+                "bytes": self._total_bytes,
+            }
+
+
+def configure(enabled=True, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    수집기가 사용할 프로세스 공용 캐시 설정
+
+    Parameters:
+    -----------
+    enabled : bool
+        캐시 사용 여부
+    path : str
+        캐시 파일 경로
+    max_bytes : int
+        캐시 최대 용량
+    """
+    global _default_cache
+
+    with _default_lock:
+        if not enabled:
+            _default_cache = None
+        elif _default_cache is None or _default_cache.path != path:
+            _default_cache = ResponseCache(path, max_bytes)
+        else:
+            _default_cache.max_bytes = max_bytes
+        return _default_cache
+
+
+def get_cache():
+    """공용 캐시 반환 (비활성화된 경우 None)"""
+    return _default_cache
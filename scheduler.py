@@ -0,0 +1,536 @@
+"""
+키워드 모니터링 스케줄러
+
+감시 키워드 목록을 계속 실행되는 프로세스에서 주기적으로 수집한다. 키워드/소스마다
+폴링 간격을 따로 두고, 최근 폴링에서 나온 신규 항목 수(시간당 신규 건수의 지수 이동
+평균)에 맞추어 간격을 조정한다. 속보성 키워드는 짧은 간격으로, 조용한 키워드는 긴
+간격으로 폴링하므로 할당량이 뉴스가 실제로 나오는 곳에 쓰인다.
+
+할당량은 서비스별로 관리한다. 남은 일일 할당량을 할당량 초기화 시각까지 남은 시간으로
+나눈 속도를 넘지 않도록 전체 폴링 간격을 같은 비율로 늘리고, 한 번의 폴링 비용보다
+남은 할당량이 적으면 초기화 시각까지 폴링을 미룬다.
+
+실행:
+    python scheduler.py -k 중대재해 -k 산업재해 -s naver -s youtube --engine uploads -o ./monitor
+
+API 키는 명령줄 실행기(cli.py)와 같이 환경변수 또는 .env 파일에서 읽는다.
+새로 수집한 항목은 소스 타입별/날짜별 JSONL 파일에 이어서 기록하고, --db를 지정하면
+로컬 DB(storage.py)에도 누적 저장한다.
+"""
+import argparse
+import math
+import os
+import signal
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import exporters
+import naver_collector
+import youtube_collector
+import quota_ledger
+import rate_limiter
+import response_cache
+import settings
+import storage
+import watermarks
+from collection_result import TABLE_KEYS
+from time_utils import format_kst_series, to_kst
+
+
+# 폴링 간격 (초)
+DEFAULT_MIN_INTERVAL = 5 * 60
+DEFAULT_MAX_INTERVAL = 6 * 60 * 60
+DEFAULT_INITIAL_INTERVAL = 30 * 60
+
+# 한 번의 폴링에서 기대하는 신규 항목 수 (시간당 신규 건수로 간격을 정하는 기준)
+DEFAULT_TARGET_NEW = 5
+
+# 시간당 신규 건수 지수 이동 평균의 가중치 (클수록 최근 폴링을 크게 반영)
+RATE_SMOOTHING = 0.5
+
+# 조용해진 키워드의 간격은 폴링마다 최대 이 배율까지만 늘림
+MAX_GROWTH = 2.0
+
+# 수동 실행 등을 위해 남겨 둘 일일 할당량 비율
+DEFAULT_QUOTA_RESERVE = 0.1
+
+# 첫 폴링(워터마크가 없을 때)에서 살펴볼 기간 (일)
+DEFAULT_LOOKBACK_DAYS = 1
+
+# 최대 수집 건수에 걸린 폴링은 상한을 이 배수로 늘려 기존 워터마크까지 다시 조회
+BACKFILL_FACTOR = 10
+
+# 스케줄러 워터마크 이름 앞에 붙이는 구분자 (빠진 구간을 건너뛰므로 수동 증분 수집과 따로 관리)
+WATERMARK_NAMESPACE = 'scheduler'
+
+# 소스별 (소스 타입, 게시 시각 컬럼)
+SOURCE_TYPES = {
+    'naver': ('naver_news', 'pubDate'),
+    'youtube': ('youtube_video', 'published_at'),
+}
+
+SOURCES = {
+    'naver': ('naver', settings.NAVER_QUOTA_TIMEZONE),
+    'youtube': ('youtube', settings.YOUTUBE_QUOTA_TIMEZONE),
+}
+
+
+class PollTask:
+    """
+    키워드/소스 하나의 폴링 상태
+
+    Attributes:
+    -----------
+    keyword : str
+        검색 키워드
+    source : str
+        "naver" 또는 "youtube"
+    interval : float
+        신규 항목 추세로 정한 폴링 간격 (초, 할당량 조정 전)
+    next_run : float
+        다음 폴링 시각 (time.time() 기준)
+    rate : float
+        시간당 신규 건수의 지수 이동 평균 (첫 폴링 전에는 None)
+    cost : float
+        폴링 한 번에 쓰는 할당량 (실측값의 이동 평균, 첫 폴링 전에는 예상값)
+    delivered : dict
+        이미 신규 항목으로 넘긴 항목의 고유 키 → 게시 시각 (워터마크 이후 항목만 보관)
+    """
+
+    def __init__(self, keyword, source, interval, cost):
+        self.keyword = keyword
+        self.source = source
+        self.interval = interval
+        self.cost = cost
+        self.next_run = 0.0
+        self.last_run = None
+        self.rate = None
+        self.polls = 0
+        self.total_new = 0
+        self.failures = 0
+        self.delivered = {}
+
+
+class MonitorScheduler:
+    """
+    감시 키워드 적응형 폴링 스케줄러
+
+    폴링은 한 스레드에서 하나씩 실행한다. 네이버 페이지 요청과 유튜브 채널별 검색은
+    수집기 안에서 이미 병렬로 보내므로, 폴링을 겹치지 않게 하여 실측 사용량을 폴링별로
+    정확히 기록한다.
+
+    Parameters:
+    -----------
+    keywords : list
+        감시 키워드 목록
+    sources : iterable
+        폴링할 소스 ("naver", "youtube")
+    naver_id, naver_secret : str
+        네이버 API Client ID / Secret
+    youtube_key : str
+        유튜브 API 키
+    naver_max : int
+        폴링 한 번의 최대 뉴스 수
+    youtube_max : int
+        폴링 한 번의 최대 영상 수
+    youtube_filter : bool
+        언론사 채널만 수집할지 여부
+    youtube_engine : str
+        채널 수집 방식 ("search" 또는 "uploads")
+    min_interval, max_interval, initial_interval : float
+        폴링 간격 범위와 첫 간격 (초)
+    target_new : float
+        폴링 한 번에 기대하는 신규 항목 수
+    quota_reserve : float
+        스케줄러가 쓰지 않고 남겨 둘 일일 할당량 비율
+    lookback_days : int
+        워터마크가 없는 키워드의 첫 폴링에서 살펴볼 기간 (일)
+    on_items : callable
+        신규 항목이 있을 때 호출할 함수 on_items(source_type, keyword, df)
+    log : callable
+        로그 출력 함수
+    """
+
+    def __init__(self, keywords, sources=('naver', 'youtube'), naver_id=None, naver_secret=None,
+                 youtube_key=None, naver_max=100, youtube_max=50, youtube_filter=True,
+                 youtube_engine="search", min_interval=DEFAULT_MIN_INTERVAL,
+                 max_interval=DEFAULT_MAX_INTERVAL, initial_interval=DEFAULT_INITIAL_INTERVAL,
+                 target_new=DEFAULT_TARGET_NEW, quota_reserve=DEFAULT_QUOTA_RESERVE,
+                 lookback_days=DEFAULT_LOOKBACK_DAYS, on_items=None, log=print):
+        self.naver_id = naver_id
+        self.naver_secret = naver_secret
+        self.youtube_key = youtube_key
+        self.naver_max = naver_max
+        self.youtube_max = youtube_max
+        self.youtube_filter = youtube_filter
+        self.youtube_engine = youtube_engine
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_new = target_new
+        self.quota_reserve = quota_reserve
+        self.lookback_days = lookback_days
+        self.on_items = on_items
+        self.log = log
+
+        initial_interval = min(max(initial_interval, min_interval), max_interval)
+        self.tasks = [
+            PollTask(keyword, source, initial_interval, self._estimate_cost(source))
+            for keyword in keywords
+            for source in sources
+        ]
+
+    def _credential(self, source):
+        return self.naver_id if source == 'naver' else self.youtube_key
+
+    def _limiter(self, source):
+        service, _ = SOURCES[source]
+        return rate_limiter.get_limiter(service, self._credential(source))
+
+    def _estimate_cost(self, source):
+        """폴링 한 번의 예상 할당량 (quota_ledger.plan_run 기준)"""
+        today = datetime.now().strftime("%Y-%m-%d")
+        start = (datetime.now() - timedelta(days=self.lookback_days)).strftime("%Y-%m-%d")
+
+        if source == 'naver':
+            plan = quota_ledger.plan_run(1, start, today, naver_max=self.naver_max)
+            return max(plan['totals']['naver'], 1)
+
+        plan = quota_ledger.plan_run(
+            1, start, today, youtube_max=self.youtube_max, channel_filter=self.youtube_filter,
+            engine=self.youtube_engine, num_channels=len(youtube_collector.MEDIA_CHANNELS)
+        )
+        return max(plan['totals']['youtube'], 1)
+
+    def _seconds_until_reset(self, source):
+        """서비스의 일일 할당량이 초기화될 때까지 남은 시간 (초)"""
+        _, timezone = SOURCES[source]
+        now = datetime.now(ZoneInfo(timezone))
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), now.tzinfo)
+        return max((midnight - now).total_seconds(), 1.0)
+
+    def _budget_scale(self, source):
+        """
+        할당량 속도에 맞추기 위한 폴링 간격 배율
+
+        현재 간격대로 폴링할 때의 할당량 사용 속도가 (남은 할당량 - 예비분) /
+        초기화까지 남은 시간을 넘으면 그 비율만큼 모든 간격을 늘린다. 키워드 사이의
+        간격 비율은 그대로 유지된다.
+        """
+        limiter = self._limiter(source)
+        budget = limiter.remaining() - limiter.daily_limit * self.quota_reserve
+        if budget <= 0:
+            return math.inf
+
+        demand = sum(task.cost / task.interval for task in self.tasks if task.source == source)
+        allowed = budget / self._seconds_until_reset(source)
+        return max(1.0, demand / allowed)
+
+    def _schedule(self, task, now):
+        """할당량을 반영하여 다음 폴링 시각 결정"""
+        scale = self._budget_scale(task.source)
+        limiter = self._limiter(task.source)
+
+        if math.isinf(scale) or limiter.remaining() < task.cost:
+            # 할당량 초기화 직후에 다시 시도
+            task.next_run = now + self._seconds_until_reset(task.source) + 60
+        else:
+            task.next_run = now + task.interval * scale
+
+    def _adapt(self, task, new_count, elapsed, saturated):
+        """
+        신규 항목 수에 맞추어 폴링 간격 조정
+
+        Parameters:
+        -----------
+        task : PollTask
+            폴링한 작업
+        new_count : int
+            이번 폴링의 신규 항목 수
+        elapsed : float
+            이번 폴링이 다룬 기간 (초)
+        saturated : bool
+            최대 수집 건수에 도달하여 놓친 항목이 있을 수 있는지 여부
+        """
+        rate = new_count / max(elapsed, 1.0) * 3600
+        task.rate = rate if task.rate is None else RATE_SMOOTHING * rate + (1 - RATE_SMOOTHING) * task.rate
+
+        if saturated:
+            # 한 번에 다 받지 못할 만큼 빠른 키워드는 바로 최소 간격으로
+            interval = self.min_interval
+        elif task.rate > 0:
+            interval = self.target_new / task.rate * 3600
+        else:
+            interval = self.max_interval
+
+        interval = min(interval, task.interval * MAX_GROWTH)
+        task.interval = min(max(interval, self.min_interval), self.max_interval)
+
+    def _fetch(self, task, since, max_results):
+        """
+        키워드/소스 하나를 워터마크 이후로 최신순 수집
+
+        Returns:
+        --------
+        tuple
+            (수집 DataFrame, 최대 수집 건수나 API 상한에 걸렸는지 여부)
+        """
+        today = datetime.now().strftime("%Y-%m-%d")
+        start = (datetime.now() - timedelta(days=self.lookback_days)).strftime("%Y-%m-%d")
+
+        if task.source == 'naver':
+            df = naver_collector.collect_naver_news(
+                self.naver_id, self.naver_secret, task.keyword, start, today, max_results,
+                concurrent=True, since=since
+            )
+            return df, df.attrs.get('truncated', False) or len(df) >= max_results
+
+        # 새 업로드를 바로 보도록 프로세스 내 업로드 목록 보관분은 쓰지 않음
+        df = youtube_collector.collect_youtube_videos(
+            self.youtube_key, task.keyword, start, today, self.youtube_filter, max_results,
+            since=since, engine=self.youtube_engine, use_memo=False
+        )
+        return df, len(df) >= max_results
+
+    def _collect(self, task):
+        """
+        키워드/소스 하나를 워터마크 이후로 수집
+
+        최대 수집 건수에 걸리면 상한을 BACKFILL_FACTOR배로 늘려 기존 워터마크까지 한 번 더
+        조회한다. 그래도 다 받지 못하면 (네이버 start 상한에 걸린 경우 포함) 빠진 구간은
+        포기하고 워터마크를 받은 항목 중 가장 오래된 게시 시각까지만 옮긴다. 워터마크와 같은
+        시각의 항목은 다음 폴링에서 다시 조회되므로, 이미 넘긴 항목은 결과에서 뺀다.
+
+        Returns:
+        --------
+        tuple
+            (소스 타입, 신규 항목 DataFrame, 최대 수집 건수 도달 여부)
+        """
+        source_type, time_column = SOURCE_TYPES[task.source]
+        max_results = self.naver_max if task.source == 'naver' else self.youtube_max
+        source = watermarks.watermark_source(source_type, self.youtube_filter, WATERMARK_NAMESPACE)
+        since = watermarks.get_watermark(source, task.keyword)
+
+        df, saturated = self._fetch(task, since, max_results)
+        capped = saturated
+        if saturated and not df.attrs.get('truncated', False):
+            df, capped = self._fetch(task, since, max_results * BACKFILL_FACTOR)
+
+        watermark = watermarks.advance_watermark(
+            source, task.keyword, df[time_column], complete=not capped, skip_gap=True
+        )
+        if capped and watermark != since:
+            self.log(f"⚠️ '{task.keyword}' {task.source}: 최대 수집 건수에 걸려 "
+                     f"{since or '조회 기간 시작'} ~ {watermark} 사이 일부를 건너뜁니다.")
+
+        return source_type, self._new_items(task, source_type, df, time_column, watermark), saturated
+
+    def _new_items(self, task, source_type, df, time_column, watermark):
+        """이전 폴링에서 넘기지 않은 항목만 남기고, 워터마크 이전 항목은 기록에서 지움"""
+        if df.empty:
+            return df
+
+        keys = df[TABLE_KEYS[source_type]]
+        fresh = df[~keys.isin(task.delivered.keys())]
+
+        task.delivered.update(zip(keys, format_kst_series(to_kst(df[time_column]))))
+        if watermark:
+            task.delivered = {
+                key: value for key, value in task.delivered.items() if value and value >= watermark
+            }
+        return fresh
+
+    def poll(self, task):
+        """
+        작업 하나를 폴링하고 간격과 다음 폴링 시각을 갱신
+
+        Returns:
+        --------
+        int
+            신규 항목 수 (실패하면 0)
+        """
+        now = time.time()
+        elapsed = now - task.last_run if task.last_run else self.lookback_days * 86400
+        limiter = self._limiter(task.source)
+        used_before = limiter.used_today()
+
+        try:
+            source_type, df, saturated = self._collect(task)
+        except Exception as e:
+            # 실패한 작업은 간격을 늘려 재시도 (다른 작업은 계속 폴링)
+            task.failures += 1
+            task.interval = min(task.interval * MAX_GROWTH, self.max_interval)
+            self._schedule(task, time.time())
+            self.log(f"❌ '{task.keyword}' {task.source} 폴링 실패: {str(e)} "
+                     f"(다음 폴링 {self._format_time(task.next_run)})")
+            return 0
+
+        # 캐시 적중 등으로 실제 사용량은 예상과 다르므로 실측값으로 비용 갱신
+        used = max(limiter.used_today() - used_before, 0)
+        task.cost = max(RATE_SMOOTHING * used + (1 - RATE_SMOOTHING) * task.cost, 1.0)
+
+        task.polls += 1
+        task.total_new += len(df)
+        task.last_run = now
+        self._adapt(task, len(df), elapsed, saturated)
+        self._schedule(task, time.time())
+
+        if len(df) and self.on_items is not None:
+            self.on_items(source_type, task.keyword, df)
+
+        self.log(
+            f"✅ '{task.keyword}' {task.source}: 신규 {len(df)}건, 사용 {used:,}, "
+            f"시간당 {task.rate:.1f}건 → 간격 {task.interval / 60:.0f}분 "
+            f"(다음 폴링 {self._format_time(task.next_run)})"
+        )
+        return len(df)
+
+    def _format_time(self, timestamp):
+        return datetime.fromtimestamp(timestamp).strftime("%m-%d %H:%M:%S")
+
+    def run(self, stop_event=None, max_polls=None):
+        """
+        폴링 반복 실행
+
+        Parameters:
+        -----------
+        stop_event : threading.Event
+            설정되면 대기 중이던 폴링을 멈추고 반환
+        max_polls : int
+            이 횟수만큼 폴링한 뒤 반환 (None이면 stop_event가 설정될 때까지)
+
+        Returns:
+        --------
+        int
+            실행한 폴링 수
+        """
+        stop_event = stop_event or threading.Event()
+        polls = 0
+
+        while not stop_event.is_set() and (max_polls is None or polls < max_polls):
+            task = min(self.tasks, key=lambda t: t.next_run)
+            wait = task.next_run - time.time()
+            if wait > 0:
+                # 대기 중에도 종료 요청에 바로 반응
+                if stop_event.wait(wait):
+                    break
+            self.poll(task)
+            polls += 1
+
+        return polls
+
+
+def append_jsonl(output_dir):
+    """
+    신규 항목을 소스 타입별/날짜별 JSONL 파일에 이어서 기록하는 on_items 함수 생성
+
+    Returns:
+    --------
+    callable
+        on_items(source_type, keyword, df)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    def on_items(source_type, keyword, df):
+        path = os.path.join(output_dir, f"{source_type}_{datetime.now().strftime('%Y%m%d')}.jsonl")
+        with open(path, 'ab') as f:
+            exporters.write_jsonl(source_type, df.assign(keywords=keyword), f)
+
+    return on_items
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="감시 키워드 적응형 폴링 스케줄러")
+    parser.add_argument("-k", "--keyword", dest="keywords", action="append", required=True,
+                        help="감시 키워드 (여러 번 지정 가능, 쉼표로 구분 가능)")
+    parser.add_argument("-s", "--source", dest="sources", action="append", choices=tuple(SOURCES),
+                        help="폴링할 소스 (여러 번 지정 가능, 기본: naver, youtube)")
+    parser.add_argument("--naver-max", type=int, default=100, help="폴링당 최대 뉴스 수 (기본: 100)")
+    parser.add_argument("--youtube-max", type=int, default=50, help="폴링당 최대 영상 수 (기본: 50)")
+    parser.add_argument("--all-channels", dest="channel_filter", action="store_false",
+                        help="언론사 채널로 제한하지 않고 유튜브 전체에서 검색")
+    parser.add_argument("--engine", choices=("search", "uploads"), default="search",
+                        help="언론사 채널 수집 방식 (기본: search, 할당량 절약은 uploads)")
+    parser.add_argument("--min-interval", type=float, default=DEFAULT_MIN_INTERVAL / 60,
+                        help="최소 폴링 간격 (분)")
+    parser.add_argument("--max-interval", type=float, default=DEFAULT_MAX_INTERVAL / 60,
+                        help="최대 폴링 간격 (분)")
+    parser.add_argument("--initial-interval", type=float, default=DEFAULT_INITIAL_INTERVAL / 60,
+                        help="첫 폴링 간격 (분)")
+    parser.add_argument("--target-new", type=float, default=DEFAULT_TARGET_NEW,
+                        help="폴링 한 번에 기대하는 신규 항목 수")
+    parser.add_argument("--quota-reserve", type=float, default=DEFAULT_QUOTA_RESERVE,
+                        help="남겨 둘 일일 할당량 비율 (0~1)")
+    parser.add_argument("--lookback-days", type=int, default=DEFAULT_LOOKBACK_DAYS,
+                        help="워터마크가 없는 키워드의 첫 폴링 기간 (일)")
+    parser.add_argument("-o", "--output", default="monitor", help="신규 항목 JSONL 저장 디렉터리")
+    parser.add_argument("--db", nargs="?", const=storage.DEFAULT_DB_PATH,
+                        help=f"신규 항목을 로컬 DB에도 누적 저장 (경로 생략 시 {storage.DEFAULT_DB_PATH})")
+    args = parser.parse_args(argv)
+
+    keywords = list(dict.fromkeys(
+        k.strip() for keyword in args.keywords for k in keyword.split(',') if k.strip()
+    ))
+    sources = args.sources or list(SOURCES)
+    credentials = settings.load_credentials()
+
+    errors = []
+    if not keywords:
+        errors.append("감시 키워드를 지정해주세요.")
+    if 'naver' in sources and not (credentials['naver_id'] and credentials['naver_secret']):
+        errors.append("네이버 API 키가 없습니다. (NAVER_CLIENT_ID, NAVER_CLIENT_SECRET 환경변수)")
+    if 'youtube' in sources and not credentials['youtube_key']:
+        errors.append("유튜브 API 키가 없습니다. (YOUTUBE_API_KEY 환경변수)")
+    if not 0 < args.min_interval <= args.max_interval:
+        errors.append("폴링 간격은 0 < 최소 간격 <= 최대 간격이어야 합니다.")
+    if errors:
+        for error in errors:
+            print(f"오류: {error}", file=sys.stderr)
+        return 2
+
+    def log(message):
+        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}", file=sys.stderr, flush=True)
+
+    sinks = [append_jsonl(args.output)]
+    if args.db:
+        store = storage.get_store(args.db)
+        sinks.append(lambda source_type, keyword, df: store.upsert(source_type, df, keyword))
+
+    def on_items(source_type, keyword, df):
+        for sink in sinks:
+            sink(source_type, keyword, df)
+
+    # 검색 응답 캐시(30분)는 최소 폴링 간격보다 길어 새 항목을 가리므로 사용하지 않음
+    response_cache.configure(enabled=False)
+
+    scheduler = MonitorScheduler(
+        keywords, sources,
+        naver_max=args.naver_max,
+        youtube_max=args.youtube_max,
+        youtube_filter=args.channel_filter,
+        youtube_engine=args.engine,
+        min_interval=args.min_interval * 60,
+        max_interval=args.max_interval * 60,
+        initial_interval=args.initial_interval * 60,
+        target_new=args.target_new,
+        quota_reserve=args.quota_reserve,
+        lookback_days=args.lookback_days,
+        on_items=on_items,
+        log=log,
+        **credentials
+    )
+
+    stop_event = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop_event.set())
+
+    log(f"🔁 감시 시작: 키워드 {len(keywords)}개 × 소스 {len(sources)}개")
+    polls = scheduler.run(stop_event)
+    log(f"⏹️ 감시 종료: 폴링 {polls}회")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
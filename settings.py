@@ -0,0 +1,57 @@
+"""
+수집 시스템 공통 설정값
+"""
+import os
+
+
+# 로컬 상태 파일(호출량, 캐시 등) 저장 디렉터리
+DATA_DIR = os.environ.get("ARGOS_DATA_DIR", os.path.join(os.path.expanduser("~"), ".argos_k"))
+
+# 네이버 검색 API 한도
+NAVER_DAILY_LIMIT = 25000
+NAVER_RATE_LIMIT = 10  # 초당 최대 호출 수
+
+# 유튜브 Data API 한도
+YOUTUBE_DAILY_UNITS = 10000
+YOUTUBE_RATE_LIMIT = 10  # 초당 최대 호출 수
+
+# 유튜브 API 메서드별 할당량 비용 (units)
+YOUTUBE_UNIT_COSTS = {
+    "search.list": 100,
+    "videos.list": 1,
+    "commentThreads.list": 1,
+    "playlistItems.list": 1,
+    "channels.list": 1,
+}
+
+# 일일 한도 초기화 기준 시간대
+NAVER_QUOTA_TIMEZONE = "Asia/Seoul"
+YOUTUBE_QUOTA_TIMEZONE = "America/Los_Angeles"
+
+# 사용량 파일에 한 번에 예약하는 할당량 (쓰지 않은 양은 수집이 끝나면 반환)
+NAVER_QUOTA_BLOCK = 100
+YOUTUBE_QUOTA_BLOCK = 500
+
+
+def load_credentials():
+    """
+    환경변수(또는 현재 디렉터리의 .env 파일)에서 API 키 읽기
+
+    명령줄 실행기와 스케줄러처럼 화면 입력 없이 실행하는 경우에 사용한다.
+
+    Returns:
+    --------
+    dict
+        {"naver_id", "naver_secret", "youtube_key"} (없는 값은 None)
+    """
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:  # python-dotenv가 없으면 환경변수만 사용
+        pass
+
+    return {
+        'naver_id': os.environ.get("NAVER_CLIENT_ID"),
+        'naver_secret': os.environ.get("NAVER_CLIENT_SECRET"),
+        'youtube_key': os.environ.get("YOUTUBE_API_KEY"),
+    }
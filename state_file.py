@@ -0,0 +1,79 @@
+"""
+여러 프로세스가 함께 쓰는 JSON 상태 파일 모듈
+
+일일 할당량 사용량, 증분 수집 워터마크처럼 웹 앱, 명령줄 실행기, 스케줄러가
+같은 데이터 디렉터리에서 동시에 읽고 고치는 작은 상태 파일을 다룬다.
+읽기-수정-쓰기는 옆에 둔 잠금 파일(<경로>.lock)의 배타 잠금 안에서 하고,
+쓰기는 같은 디렉터리의 고유한 임시 파일에 기록한 뒤 교체하므로 다른 프로세스의
+갱신을 덮어쓰거나 반쯤 쓴 파일을 읽지 않는다.
+"""
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+# 같은 프로세스 안의 스레드끼리도 순서대로 잠금 파일을 잡도록 함
+_thread_lock = threading.RLock()
+
+
+@contextmanager
+def locked(path):
+    """
+    상태 파일의 읽기-수정-쓰기 구간을 다른 스레드/프로세스와 직렬화
+
+    Parameters:
+    -----------
+    path : str
+        상태 파일 경로 (잠금은 path + ".lock" 파일에 건다)
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    with _thread_lock:
+        with open(f"{path}.lock", "a+b") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def read_json(path):
+    """상태 파일 읽기 (없거나 손상된 파일은 빈 dict)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def write_json(path, state):
+    """상태 파일을 고유한 임시 파일에 기록한 뒤 한 번에 교체"""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
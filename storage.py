@@ -0,0 +1,553 @@
+"""
+수집 결과 로컬 저장소 모듈
+
+수집 결과를 SQLite 파일에 소스 타입별 테이블로 누적 저장한다. 각 테이블은 고유 키
+(link, video_id, comment_id)에 유일 인덱스, 게시 시각에 일반 인덱스를 두며, 같은 키의
+항목은 INSERT ... ON CONFLICT DO UPDATE로 갱신한다. 항목별 검색 키워드는 소스 타입별
+키워드 테이블(키워드, 고유 키)에 따로 두어 키워드 조회도 인덱스를 탄다.
+
+시각은 워터마크와 같은 한국 시간 문자열(YYYY-MM-DD HH:MM:SS)로 저장하므로 문자열
+비교만으로 기간 조회가 된다.
+
+뉴스 제목/본문 요약, 영상 제목/설명/태그, 댓글 본문은 단어를 두 글자씩 겹쳐 자른 토큰
+(바이그램)으로 바꾸어 원본 테이블의 search_text 컬럼에 두고, 이 컬럼을 FTS5 전문 검색
+인덱스(unicode61 토크나이저)에 색인한다. "사고"처럼 두 글자인 한국어 검색어도 인덱스로
+찾는다. 인덱스는 원본 테이블을 내용으로 쓰는 external content 테이블이다. 트리거는 바뀐
+행을 색인 대기 테이블에 적어 두기만 하고, upsert가 끝날 때 대기 행을 한 문장으로 색인한다
+(FTS5는 문장마다 메모리의 색인을 디스크에 내려 쓰므로, 트리거에서 행마다 색인하면
+수집 건수만큼 작은 세그먼트가 생겨 몇 배 느려진다).
+"""
+import os
+import re
+import sqlite3
+import threading
+
+import pandas as pd
+
+import settings
+from collection_result import SOURCE_SCHEMAS, TABLE_KEYS, CollectionResult, typed_table
+from time_utils import format_kst, format_kst_series, kst_timestamp
+
+
+DEFAULT_DB_PATH = os.path.join(settings.DATA_DIR, "collected.sqlite3")
+
+# 소스 타입별 게시 시각 컬럼 (기간 조회 기준)
+TIME_COLUMNS = {
+    'naver_news': 'pubDate',
+    'youtube_video': 'published_at',
+    'youtube_comment': 'published_at',
+}
+
+# 테이블에 저장하지 않는 컬럼 (type은 테이블로 구분, keywords는 키워드 테이블에 저장,
+# 유사 중복 군집은 load_result()로 불러올 때 불러온 기사끼리 다시 계산)
+DERIVED_COLUMNS = ('type', 'keywords', 'cluster_id', 'is_representative')
+
+# 소스 타입별 전문 검색 대상 컬럼
+SEARCH_COLUMNS = {
+    'naver_news': ('title', 'description'),
+    'youtube_video': ('title', 'description', 'tags'),
+    'youtube_comment': ('text',),
+}
+
+# 검색 대상 컬럼을 바이그램 토큰으로 바꾸어 저장하는 컬럼
+SEARCH_TEXT_COLUMN = 'search_text'
+
+# 검색 토큰을 만드는 단어 (글자/숫자의 연속, 공백과 문장부호는 단어 경계)
+_WORD_PATTERN = re.compile(r'[^\W_]+')
+
+# 단어 안의 각 글자에서 시작하는 두 글자 (단어 마지막 글자는 한 글자)
+_BIGRAM_PATTERN = re.compile(r'(?=([^\W_]{1,2}))')
+
+# 한 번에 executemany로 기록할 행 수
+UPSERT_CHUNK_ROWS = 5000
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def _stored_columns(source_type):
+    return [col for col in SOURCE_SCHEMAS[source_type] if col not in DERIVED_COLUMNS]
+
+
+def _keyword_table(source_type):
+    return f"{source_type}_keywords"
+
+
+def _search_table(source_type):
+    return f"{source_type}_search"
+
+
+def _pending_table(source_type):
+    return f"{source_type}_search_pending"
+
+
+def _bigrams(text):
+    """
+    문자열을 단어별 두 글자 토큰으로 분리
+
+    단어의 마지막 글자는 한 글자 토큰으로 남겨 한 글자 검색어도 접두어 검색으로 찾는다.
+    예: "중대재해 발생" → ["중대", "대재", "재해", "해", "발생", "생"]
+    """
+    return _BIGRAM_PATTERN.findall(text.lower())
+
+
+def _search_text(*values):
+    """검색 대상 컬럼 값들의 바이그램 토큰 문자열 (값이 모두 없으면 None)"""
+    texts = [value for value in values if isinstance(value, str)]
+    if not texts:
+        return None
+    # 컬럼 사이는 공백으로 이어 단어 경계로 취급
+    return " ".join(_bigrams(" ".join(texts)))
+
+
+def _match_phrase(term):
+    """
+    검색어 하나를 색인과 같은 토큰의 FTS5 구문(phrase)으로 변환
+
+    검색어의 마지막 단어는 문서에서 단어 중간일 수 있으므로 마지막 글자의 한 글자 토큰을
+    빼고, 마지막 단어가 한 글자면 그 글자로 시작하는 토큰을 접두어로 찾는다.
+
+    Returns:
+    --------
+    str or None
+        MATCH 구문 (글자/숫자가 없는 검색어는 None)
+    """
+    words = _WORD_PATTERN.findall(term.lower())
+    if not words:
+        return None
+
+    tokens = _bigrams(" ".join(words[:-1]))
+    last = words[-1]
+    if len(last) == 1:
+        return '"' + " ".join(tokens + [last]) + '" *'
+    tokens.extend(last[i:i + 2] for i in range(len(last) - 1))
+    return '"' + " ".join(tokens) + '"'
+
+
+def _time_bound(value, end=False):
+    """기간 조회 경계를 한국 시간 문자열로 변환 (날짜만 있는 종료일은 그날 끝까지)"""
+    if value is None:
+        return None
+    if end and isinstance(value, str) and len(value.strip()) == 10:
+        value = f"{value.strip()} 23:59:59"
+    return format_kst(kst_timestamp(value))
+
+
+class ResultStore:
+    """
+    SQLite 기반 수집 결과 저장소
+
+    Parameters:
+    -----------
+    path : str
+        데이터베이스 파일 경로
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+        for source_type, key in TABLE_KEYS.items():
+            schema = SOURCE_SCHEMAS[source_type]
+            columns = ", ".join(
+                f'"{col}" {"INTEGER" if schema[col] == "int64" else "TEXT"}'
+                for col in _stored_columns(source_type)
+            )
+            time_col = TIME_COLUMNS[source_type]
+            keyword_table = _keyword_table(source_type)
+
+            # FTS5 external content가 rowid로 원본 행을 찾으므로 VACUUM에도 바뀌지 않는 id 사용
+            self._conn.execute(
+                f'CREATE TABLE IF NOT EXISTS {source_type} '
+                f'(id INTEGER PRIMARY KEY, {columns}, "{SEARCH_TEXT_COLUMN}" TEXT)'
+            )
+            self._conn.execute(
+                f'CREATE UNIQUE INDEX IF NOT EXISTS idx_{source_type}_{key} ON {source_type} ("{key}")'
+            )
+            self._conn.execute(
+                f'CREATE INDEX IF NOT EXISTS idx_{source_type}_{time_col} ON {source_type} ("{time_col}")'
+            )
+            self._conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {keyword_table} (
+                    keyword TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    PRIMARY KEY (keyword, key)
+                ) WITHOUT ROWID
+            """)
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{keyword_table}_key ON {keyword_table} (key)"
+            )
+
+            self._create_search_index(source_type)
+
+        # 영상별 댓글 조회
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_youtube_comment_video_id ON youtube_comment (video_id)"
+        )
+        self._conn.commit()
+
+    def _create_search_index(self, source_type):
+        """전문 검색 인덱스와 색인 대기 트리거 생성"""
+        search_table = _search_table(source_type)
+        pending_table = _pending_table(source_type)
+        columns = SEARCH_COLUMNS[source_type]
+
+        self._conn.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {search_table} USING fts5(
+                {SEARCH_TEXT_COLUMN}, content='{source_type}', content_rowid='rowid', tokenize='unicode61'
+            )
+        """)
+        # indexed: 대기 행의 이전 내용이 인덱스에 있는지 (있으면 search_text가 색인된 내용)
+        self._conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {pending_table} (
+                id INTEGER PRIMARY KEY,
+                indexed INTEGER NOT NULL,
+                {SEARCH_TEXT_COLUMN} TEXT
+            )
+        """)
+        # 한 행이 여러 번 바뀌어도 처음 기록(인덱스에 있는 내용)만 남김
+        self._conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {search_table}_insert AFTER INSERT ON {source_type} BEGIN
+                INSERT OR IGNORE INTO {pending_table} (id, indexed, {SEARCH_TEXT_COLUMN})
+                VALUES (new.rowid, 0, NULL);
+            END
+        """)
+        self._conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {search_table}_delete AFTER DELETE ON {source_type} BEGIN
+                INSERT OR IGNORE INTO {pending_table} (id, indexed, {SEARCH_TEXT_COLUMN})
+                VALUES (old.rowid, 1, old.{SEARCH_TEXT_COLUMN});
+            END
+        """)
+        # 조회수 갱신처럼 검색 대상 컬럼이 그대로인 upsert는 다시 색인하지 않음
+        self._conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {search_table}_update AFTER UPDATE ON {source_type}
+            WHEN old.{SEARCH_TEXT_COLUMN} IS NOT new.{SEARCH_TEXT_COLUMN} BEGIN
+                INSERT OR IGNORE INTO {pending_table} (id, indexed, {SEARCH_TEXT_COLUMN})
+                VALUES (old.rowid, 1, old.{SEARCH_TEXT_COLUMN});
+            END
+        """)
+
+        # 다른 도구로 고친 행 등 색인하지 못한 대기 행 반영
+        self._flush_search_index(source_type)
+
+    def _flush_search_index(self, source_type):
+        """색인 대기 행을 전문 검색 인덱스에 한 번에 반영 (이전 내용 삭제 후 현재 내용 색인)"""
+        search_table = _search_table(source_type)
+        pending_table = _pending_table(source_type)
+
+        if self._conn.execute(f"SELECT 1 FROM {pending_table} LIMIT 1").fetchone() is None:
+            return
+        self._conn.execute(f"""
+            INSERT INTO {search_table} ({search_table}, rowid, {SEARCH_TEXT_COLUMN})
+            SELECT 'delete', id, {SEARCH_TEXT_COLUMN} FROM {pending_table} WHERE indexed
+        """)
+        self._conn.execute(f"""
+            INSERT INTO {search_table} (rowid, {SEARCH_TEXT_COLUMN})
+            SELECT t.rowid, t.{SEARCH_TEXT_COLUMN} FROM {pending_table} p JOIN {source_type} t ON t.rowid = p.id
+        """)
+        self._conn.execute(f"DELETE FROM {pending_table}")
+
+    def _upsert_sql(self, source_type):
+        """고유 키 충돌 시 갱신하는 INSERT 문"""
+        schema = SOURCE_SCHEMAS[source_type]
+        key = TABLE_KEYS[source_type]
+        columns = _stored_columns(source_type) + [SEARCH_TEXT_COLUMN]
+
+        updates = []
+        for col in columns:
+            if col == key:
+                continue
+            if schema.get(col) == 'int64':
+                # 조회수 등은 통계를 받지 못한 재수집(0)으로 줄어들지 않도록 큰 값 유지
+                updates.append(f'"{col}" = MAX("{col}", excluded."{col}")')
+            else:
+                updates.append(f'"{col}" = COALESCE(excluded."{col}", "{col}")')
+
+        quoted = ", ".join(f'"{col}"' for col in columns)
+        return (
+            f'INSERT INTO {source_type} ({quoted}) '
+            f'VALUES ({", ".join("?" for _ in columns)}) '
+            f'ON CONFLICT ("{key}") DO UPDATE SET {", ".join(updates)}'
+        )
+
+    def upsert(self, source_type, data, keyword=None):
+        """
+        레코드를 고유 키 기준으로 추가하거나 갱신
+
+        Parameters:
+        -----------
+        source_type : str
+            소스 타입 ("naver_news", "youtube_video", "youtube_comment")
+        data : pd.DataFrame or list
+            수집기가 반환한 DataFrame/레코드 리스트 또는 CollectionResult 테이블
+        keyword : str
+            레코드를 수집한 키워드 (data의 keywords 컬럼과 함께 저장)
+
+        Returns:
+        --------
+        int
+            기록한 행 수
+        """
+        frame = typed_table(source_type, data)
+        if frame.empty:
+            return 0
+
+        key = TABLE_KEYS[source_type]
+        frame = frame[frame[key].notna()].drop_duplicates(subset=key, keep='last')
+        columns = _stored_columns(source_type)
+
+        values = {}
+        for col in columns:
+            if isinstance(frame[col].dtype, pd.DatetimeTZDtype):
+                values[col] = format_kst_series(frame[col])
+            else:
+                values[col] = frame[col].astype(object).where(frame[col].notna(), None)
+        rows = list(zip(*(values[col].tolist() for col in columns)))
+        search_values = list(zip(*(values[col].tolist() for col in SEARCH_COLUMNS[source_type])))
+        item_keys = values[key].tolist()
+
+        keyword_rows = []
+        for item_key, keywords in zip(frame[key].tolist(), frame['keywords'].tolist()):
+            names = [k.strip() for k in keywords.split(',')] if isinstance(keywords, str) else []
+            if keyword:
+                names.append(keyword)
+            keyword_rows.extend((name, item_key) for name in dict.fromkeys(names) if name)
+
+        sql = self._upsert_sql(source_type)
+        with self._lock, self._conn:
+            # 값이 없는 검색 대상 컬럼은 저장된 값이 유지되므로(COALESCE) 색인 내용도 저장된 값으로 계산
+            incomplete = [i for i, row in enumerate(search_values) if None in row]
+            if incomplete:
+                stored = self._stored_search_values(source_type, [item_keys[i] for i in incomplete])
+                for i in incomplete:
+                    previous = stored.get(item_keys[i])
+                    if previous:
+                        search_values[i] = tuple(
+                            new if new is not None else old for new, old in zip(search_values[i], previous)
+                        )
+            rows = [row + (_search_text(*texts),) for row, texts in zip(rows, search_values)]
+
+            for start in range(0, len(rows), UPSERT_CHUNK_ROWS):
+                self._conn.executemany(sql, rows[start:start + UPSERT_CHUNK_ROWS])
+            self._conn.executemany(
+                f"INSERT OR IGNORE INTO {_keyword_table(source_type)} (keyword, key) VALUES (?, ?)",
+                keyword_rows
+            )
+            self._flush_search_index(source_type)
+
+        return len(rows)
+
+    def _stored_search_values(self, source_type, keys):
+        """고유 키별로 저장된 검색 대상 컬럼 값"""
+        key = TABLE_KEYS[source_type]
+        names = ", ".join(f'"{col}"' for col in SEARCH_COLUMNS[source_type])
+        stored = {}
+        # SQLite의 바인딩 변수 수 제한 안에서 나누어 조회
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            cursor = self._conn.execute(
+                f'SELECT "{key}", {names} FROM {source_type} '
+                f'WHERE "{key}" IN ({", ".join("?" for _ in chunk)})',
+                chunk
+            )
+            stored.update((row[0], row[1:]) for row in cursor)
+        return stored
+
+    def save(self, result):
+        """
+        CollectionResult 전체 저장
+
+        Returns:
+        --------
+        dict
+            {소스 타입: 기록한 행 수}
+        """
+        return {
+            source_type: self.upsert(source_type, table)
+            for source_type, table in result.tables().items()
+        }
+
+    def query(self, source_type, start=None, end=None, keyword=None, limit=None):
+        """
+        기간/키워드로 저장된 항목 조회 (최신 게시 순)
+
+        Parameters:
+        -----------
+        source_type : str
+            소스 타입
+        start : str
+            게시 시각 하한 (YYYY-MM-DD 또는 YYYY-MM-DD HH:MM:SS, 한국 시간)
+        end : str
+            게시 시각 상한 (날짜만 지정하면 그날 끝까지)
+        keyword : str
+            이 키워드로 수집된 항목만 조회
+        limit : int
+            최대 행 수
+
+        Returns:
+        --------
+        pd.DataFrame
+            CollectionResult 테이블과 같은 형식 (고유 키 인덱스, keywords 컬럼 포함)
+        """
+        key = TABLE_KEYS[source_type]
+        time_col = TIME_COLUMNS[source_type]
+        conditions, params = self._filters(source_type, start, end, keyword)
+
+        sql = f"SELECT {self._select_columns(source_type)} FROM {source_type} t"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += f' ORDER BY t."{time_col}" DESC'
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+
+        return self._read_table(source_type, sql, params)
+
+    def _select_columns(self, source_type):
+        """
+        저장 컬럼과 항목별 키워드(쉼표로 이어 붙임)를 읽는 SELECT 컬럼
+
+        search_text는 색인용이므로 읽지 않는다.
+        """
+        columns = ", ".join(f't."{col}"' for col in _stored_columns(source_type))
+        return (
+            f"{columns}, (SELECT group_concat(keyword, ', ') FROM {_keyword_table(source_type)} k "
+            f'WHERE k.key = t."{TABLE_KEYS[source_type]}") AS keywords'
+        )
+
+    def _read_table(self, source_type, sql, params):
+        """SELECT 결과를 CollectionResult 테이블 형식으로 변환"""
+        with self._lock:
+            frame = pd.read_sql_query(sql, self._conn, params=params)
+
+        table = typed_table(source_type, frame)
+        table.index = pd.Index(table[TABLE_KEYS[source_type]].to_numpy(), dtype='string')
+        return table
+
+    def _filters(self, source_type, start=None, end=None, keyword=None):
+        """기간/키워드 조건 (원본 테이블 별칭 t 기준)"""
+        key = TABLE_KEYS[source_type]
+        time_col = TIME_COLUMNS[source_type]
+        keyword_table = _keyword_table(source_type)
+
+        conditions = []
+        params = []
+        if start is not None:
+            conditions.append(f't."{time_col}" >= ?')
+            params.append(_time_bound(start))
+        if end is not None:
+            conditions.append(f't."{time_col}" <= ?')
+            params.append(_time_bound(end, end=True))
+        if keyword and conditions:
+            # 기간이 있으면 게시 시각 인덱스로 범위를 먼저 좁히고 키워드는 기본 키로 확인
+            conditions.append(
+                f'EXISTS (SELECT 1 FROM {keyword_table} k WHERE k.keyword = ? AND k.key = t."{key}")'
+            )
+            params.append(keyword)
+        elif keyword:
+            conditions.append(f't."{key}" IN (SELECT key FROM {keyword_table} WHERE keyword = ?)')
+            params.append(keyword)
+
+        return conditions, params
+
+    def search(self, source_type, text, start=None, end=None, keyword=None, limit=100,
+               order="recent"):
+        """
+        전문 검색
+
+        공백으로 나눈 검색어를 모두 포함하는 항목을 찾는다. 검색어는 단어 안의 부분 일치로
+        찾으며 대소문자와 문장부호는 구분하지 않는다. 검색어도 색인과 같은 바이그램 토큰으로
+        나누어 찾으므로 "사고"처럼 두 글자, "가"처럼 한 글자 검색어도 인덱스를 쓴다.
+
+        기본 정렬은 최근 저장 순이다. 인덱스에서 결과를 순서대로 읽다가 limit에서 멈추므로
+        흔한 검색어도 빠르다. 관련도 순(order="relevance")은 일치하는 항목 전체의
+        점수(bm25)를 계산하므로 일치 건수에 비례하여 느려진다.
+
+        Parameters:
+        -----------
+        source_type : str
+            소스 타입
+        text : str
+            검색어 (공백으로 구분한 검색어는 AND 조건)
+        start, end, keyword :
+            query()와 같은 기간/키워드 조건
+        limit : int
+            최대 행 수
+        order : str
+            "recent" (최근 저장 순) 또는 "relevance" (관련도 순)
+
+        Returns:
+        --------
+        pd.DataFrame
+            CollectionResult 테이블과 같은 형식
+        """
+        search_table = _search_table(source_type)
+        phrases = [phrase for phrase in map(_match_phrase, dict.fromkeys(text.split())) if phrase]
+
+        if not phrases:
+            table = typed_table(source_type, [])
+            table.index = pd.Index([], dtype='string')
+            return table
+
+        conditions, params = [f"{search_table} MATCH ?"], [" ".join(phrases)]
+        filters, filter_params = self._filters(source_type, start, end, keyword)
+        conditions.extend(filters)
+        params.extend(filter_params)
+
+        sql = (
+            f"SELECT {self._select_columns(source_type)} "
+            f"FROM {search_table} f JOIN {source_type} t ON t.rowid = f.rowid "
+            f"WHERE {' AND '.join(conditions)}"
+        )
+        if order == "relevance":
+            sql += " ORDER BY f.rank"
+        else:
+            # 인덱스의 rowid 역순으로 읽으면 정렬 없이 limit에서 멈춤
+            sql += " ORDER BY f.rowid DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+
+        return self._read_table(source_type, sql, params)
+
+    def load_result(self, start=None, end=None, keyword=None, limit=None):
+        """
+        기간/키워드로 조회한 항목을 CollectionResult로 반환 (화면 표시, 내보내기용)
+        """
+        result = CollectionResult()
+        for source_type in TABLE_KEYS:
+            result.add_table(source_type, self.query(source_type, start, end, keyword, limit))
+        return result
+
+    def keywords(self):
+        """저장된 키워드 목록 (모든 소스 타입 합산)"""
+        sql = " UNION ".join(f"SELECT DISTINCT keyword FROM {_keyword_table(t)}" for t in TABLE_KEYS)
+        with self._lock:
+            return sorted(row[0] for row in self._conn.execute(sql).fetchall())
+
+    def counts(self):
+        """소스 타입별 저장 건수"""
+        with self._lock:
+            return {
+                source_type: self._conn.execute(f"SELECT COUNT(*) FROM {source_type}").fetchone()[0]
+                for source_type in TABLE_KEYS
+            }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def get_store(path=DEFAULT_DB_PATH):
+    """경로별 공용 저장소 반환"""
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = ResultStore(path)
+            _stores[path] = store
+        return store
@@ -0,0 +1,13 @@
+"""
+테스트 공통 설정
+
+모듈들이 import 시점에 데이터 디렉터리(할당량, 워터마크, 캐시 파일 경로)를 정하므로,
+테스트 모듈을 불러오기 전에 임시 디렉터리를 데이터 디렉터리로 지정한다.
+"""
+import os
+import sys
+import tempfile
+
+os.environ["ARGOS_DATA_DIR"] = tempfile.mkdtemp(prefix="argos-test-")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+from near_duplicates import assign_clusters, cluster_near_duplicates
+
+
+BASE = (
+    "고용노동부는 17일 경기도 화성시 배터리 공장 화재 사고와 관련해 중대재해처벌법 위반 여부를 "
+    "조사하고 있다고 밝혔다. 이번 사고로 작업자 여러 명이 숨지거나 다쳤다."
+)
+
+
+def test_identical_texts_share_a_cluster():
+    labels = cluster_near_duplicates([BASE, BASE, BASE])
+    assert len(set(labels)) == 1
+
+
+def test_near_identical_texts_share_a_cluster():
+    # 말머리, 기자 이름, 띄어쓰기, 문장부호만 다른 재배포 기사
+    texts = [
+        BASE,
+        "[속보] " + BASE + " 연합뉴스",
+        BASE.replace(" ", "", 3).replace(".", "!") + " 홍길동 기자",
+    ]
+    labels = cluster_near_duplicates(texts)
+    assert labels[0] == labels[1] == labels[2]
+
+
+def test_unrelated_texts_stay_apart():
+    texts = [
+        BASE,
+        "서울시는 내년부터 시내버스 노선을 개편하고 심야 버스 운행을 늘린다고 발표했다.",
+        "프로야구 한국시리즈 1차전에서 홈팀이 연장 접전 끝에 승리를 거뒀다.",
+        "",
+    ]
+    labels = cluster_near_duplicates(texts)
+    assert len(set(labels)) == len(texts)
+
+
+def test_assign_clusters_marks_the_earliest_article():
+    frame = pd.DataFrame({
+        'title': ["[단독] 공장 화재", "공장 화재", "버스 노선 개편"],
+        'description': [BASE, BASE, "서울시는 내년부터 시내버스 노선을 개편한다."],
+        'pubDate': pd.to_datetime(
+            ["2025-01-01 10:05", "2025-01-01 09:00", "2025-01-01 11:00"]
+        ).tz_localize("Asia/Seoul"),
+    })
+
+    clustered = assign_clusters(frame)
+
+    assert clustered['cluster_id'].tolist() == [1, 1, 2]
+    assert clustered['is_representative'].tolist() == [False, True, True]
+    assert clustered['cluster_id'].dtype == np.int64
@@ -0,0 +1,85 @@
+import pandas as pd
+import pytest
+
+import naver_collector
+import pipeline
+import watermarks
+
+
+def articles(*published):
+    return [
+        {
+            'title': f"기사 {i}",
+            'description': "",
+            'link': f"https://news.example.com/{i}",
+            'originallink': "",
+            'pubDate': pd.Timestamp(value, tz="Asia/Seoul"),
+        }
+        for i, value in enumerate(published)
+    ]
+
+
+@pytest.fixture
+def fake_naver(monkeypatch):
+    """iter_naver_news 대신 주어진 기사를 최신순으로 돌려주는 수집기"""
+    calls = []
+    state = {'records': [], 'truncated': False}
+
+    def iter_naver_news(client_id, client_secret, query, start_date, end_date, max_results=1000,
+                        concurrent=False, extend_coverage=False, since=None, status=None):
+        calls.append(since)
+        cutoff = pd.Timestamp(since, tz="Asia/Seoul") if since else None
+        records = [record for record in state['records'] if cutoff is None or record['pubDate'] >= cutoff]
+        if status is not None:
+            status["truncated"] = state['truncated']
+        yield records[:max_results]
+
+    monkeypatch.setattr(naver_collector, "iter_naver_news", iter_naver_news)
+    watermarks.reset_watermarks()
+    yield state, calls
+    watermarks.reset_watermarks()
+
+
+def run(naver_max):
+    result, failures = pipeline.run_collection(
+        ["화재"], "2025-01-01", "2025-01-02", collect_youtube=False,
+        naver_id="id", naver_secret="secret", naver_max=naver_max, incremental=True
+    )
+    assert failures == []
+    return result
+
+
+def test_complete_run_moves_the_watermark_to_the_newest_article(fake_naver):
+    state, _ = fake_naver
+    state['records'] = articles("2025-01-01 12:00", "2025-01-01 11:00", "2025-01-01 10:00")
+
+    run(naver_max=10)
+
+    assert watermarks.get_watermark('naver_news', "화재") == "2025-01-01 12:00:00"
+
+
+def test_capped_run_keeps_the_watermark(fake_naver):
+    state, calls = fake_naver
+    state['records'] = articles("2025-01-01 10:00")
+    run(naver_max=10)
+
+    # 최대 수집 건수에 걸려 10:00 ~ 11:00 사이를 보지 못함
+    state['records'] = articles("2025-01-01 13:00", "2025-01-01 12:00", "2025-01-01 11:00",
+                                "2025-01-01 10:30", "2025-01-01 10:00")
+    run(naver_max=2)
+    assert watermarks.get_watermark('naver_news', "화재") == "2025-01-01 10:00:00"
+
+    # 같은 구간을 다시 조회하고 (워터마크 포함) 다 받으면 최신 기사로 이동
+    run(naver_max=10)
+    assert calls[-1] == "2025-01-01 10:00:00"
+    assert watermarks.get_watermark('naver_news', "화재") == "2025-01-01 13:00:00"
+
+
+def test_truncated_run_keeps_the_watermark(fake_naver):
+    state, _ = fake_naver
+    state['records'] = articles("2025-01-01 12:00", "2025-01-01 11:00")
+    state['truncated'] = True
+
+    run(naver_max=10)
+
+    assert watermarks.get_watermark('naver_news', "화재") is None
@@ -0,0 +1,71 @@
+import multiprocessing
+
+from rate_limiter import QuotaExceededError, RateLimiter
+
+
+CALLS_PER_PROCESS = 300
+BLOCK = 100
+
+
+def acquire_many(state_path, daily_limit):
+    """별도 프로세스에서 할당량을 하나씩 획득하고 (성공 수, 한도 초과 수) 반환"""
+    limiter = RateLimiter("naver", "shared-key", rate=1e6, daily_limit=daily_limit,
+                          timezone="Asia/Seoul", burst=10**6, state_path=state_path, block=BLOCK)
+    granted = refused = 0
+    for _ in range(CALLS_PER_PROCESS):
+        try:
+            limiter.acquire()
+            granted += 1
+        except QuotaExceededError:
+            refused += 1
+    limiter.release()
+    return granted, refused
+
+
+def run_processes(state_path, daily_limit, processes=2):
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes) as pool:
+        return pool.starmap(acquire_many, [(state_path, daily_limit)] * processes)
+
+
+def reader(state_path, daily_limit):
+    return RateLimiter("naver", "shared-key", rate=1e6, daily_limit=daily_limit,
+                       timezone="Asia/Seoul", state_path=state_path)
+
+
+def test_processes_sharing_a_state_file_do_not_lose_updates(tmp_path):
+    state_path = str(tmp_path / "quota_usage.json")
+
+    results = run_processes(state_path, daily_limit=10**6)
+
+    assert results == [(CALLS_PER_PROCESS, 0)] * 2
+    assert reader(state_path, 10**6).used_today() == 2 * CALLS_PER_PROCESS
+
+
+def test_processes_sharing_a_state_file_stop_at_the_daily_limit(tmp_path):
+    state_path = str(tmp_path / "quota_usage.json")
+    daily_limit = CALLS_PER_PROCESS + CALLS_PER_PROCESS // 2
+
+    results = run_processes(state_path, daily_limit)
+    granted = sum(granted for granted, _ in results)
+
+    # 다른 프로세스가 예약해 둔 블록만큼은 먼저 멈출 수 있지만 한도는 넘지 않음
+    assert daily_limit - BLOCK < granted <= daily_limit
+    assert sum(refused for _, refused in results) == 2 * CALLS_PER_PROCESS - granted
+    assert reader(state_path, daily_limit).used_today() == granted
+
+
+def test_unused_reservation_is_returned_on_release(tmp_path):
+    state_path = str(tmp_path / "quota_usage.json")
+    limiter = RateLimiter("naver", "shared-key", rate=1e6, daily_limit=1000,
+                          timezone="Asia/Seoul", burst=10**6, state_path=state_path, block=BLOCK)
+
+    for _ in range(3):
+        limiter.acquire()
+
+    assert limiter.used_today() == 3
+    assert reader(state_path, 1000).used_today() == BLOCK
+
+    limiter.release()
+
+    assert reader(state_path, 1000).used_today() == 3
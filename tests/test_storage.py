@@ -0,0 +1,94 @@
+import pandas as pd
+import pytest
+
+from storage import ResultStore
+
+
+def news(link, title, description, published="2025-01-01 09:00"):
+    return {
+        'title': title,
+        'description': description,
+        'link': link,
+        'originallink': '',
+        'pubDate': pd.Timestamp(published, tz="Asia/Seoul"),
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResultStore(str(tmp_path / "store.sqlite3"))
+    yield store
+    store.close()
+
+
+def links(table):
+    return sorted(table['link'].tolist())
+
+
+def test_upsert_updates_rows_on_the_unique_key(store):
+    store.upsert('naver_news', [news("l1", "공장 화재", "작업자 부상")], keyword="화재")
+    store.upsert('naver_news', [news("l1", "공장 화재 (종합)", "작업자 부상")], keyword="공장")
+
+    table = store.query('naver_news')
+
+    assert store.counts()['naver_news'] == 1
+    assert table.loc["l1", 'title'] == "공장 화재 (종합)"
+    assert set(table.loc["l1", 'keywords'].split(", ")) == {"화재", "공장"}
+    assert links(store.query('naver_news', keyword="공장")) == ["l1"]
+
+
+def test_search_matches_two_character_terms(store):
+    store.upsert('naver_news', [
+        news("l1", "중대재해 사고 발생", "공장에서 작업자 추락"),
+        news("l2", "회사 고객 안내", "코로나-19 대응"),
+    ])
+
+    assert links(store.search('naver_news', "사고")) == ["l1"]
+    assert links(store.search('naver_news', "재해")) == ["l1"]
+    assert links(store.search('naver_news', "중대재해")) == ["l1"]
+    # 단어 경계를 넘는 "사 고"는 "사고"와 일치하지 않음
+    assert links(store.search('naver_news', "고객")) == ["l2"]
+    assert links(store.search('naver_news', "회사고객")) == []
+
+
+def test_search_terms_are_anded_and_ignore_case_and_punctuation(store):
+    store.upsert('youtube_video', [{
+        'video_id': "v1",
+        'title': "KOSHA 안전 교육",
+        'description': "산업 안전보건공단",
+        'channel_name': "채널",
+        'channel_id': "c1",
+        'published_at': pd.Timestamp("2025-01-01 09:00", tz="Asia/Seoul"),
+        'url': "https://example.com/v1",
+        'tags': "안전,교육",
+    }])
+
+    assert store.search('youtube_video', "kosha 보건")['video_id'].tolist() == ["v1"]
+    assert store.search('youtube_video', "안전 없는말").empty
+    assert store.search('youtube_video', "!!!").empty
+
+
+def test_search_matches_single_characters(store):
+    store.upsert('naver_news', [news("l1", "사고", ""), news("l2", "고객", ""), news("l3", "회의", "")])
+
+    assert links(store.search('naver_news', "고")) == ["l1", "l2"]
+
+
+def test_search_follows_changed_and_kept_text(store):
+    store.upsert('naver_news', [news("l1", "공장 화재", "작업자 부상")])
+    store.upsert('naver_news', [news("l1", "공장 폭발", None)])
+
+    assert store.search('naver_news', "화재").empty
+    assert links(store.search('naver_news', "폭발")) == ["l1"]
+    # 새 레코드에 없는 요약은 저장된 값이 남으므로 계속 검색됨
+    assert links(store.search('naver_news', "부상")) == ["l1"]
+
+
+def test_search_filters_by_period(store):
+    store.upsert('naver_news', [
+        news("l1", "화재 발생", "", "2025-01-01 09:00"),
+        news("l2", "화재 진압", "", "2025-01-03 09:00"),
+    ])
+
+    assert links(store.search('naver_news', "화재", start="2025-01-02")) == ["l2"]
+    assert links(store.search('naver_news', "화재", end="2025-01-01")) == ["l1"]
@@ -0,0 +1,130 @@
+"""
+텍스트 정규화 모듈
+
+네이버/유튜브 수집기가 공통으로 쓰는 HTML 태그 제거 및 엔티티 변환 함수.
+레코드 하나씩 처리하는 clean_html()과 컬럼 전체를 한 번에 처리하는
+clean_html_values() / clean_html_series() / clean_columns()를 제공하며,
+수집기는 API 응답 페이지 단위로 clean_html_values()를 쓴다.
+"""
+import html
+import re
+
+import pandas as pd
+
+
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# 자주 나오는 엔티티는 str.replace로 바로 변환 (&amp;는 이중 변환을 막기 위해 마지막에 처리)
+_COMMON_ENTITIES = (
+    ('&quot;', '"'),
+    ('&#39;', "'"),
+    ('&#x27;', "'"),
+    ('&apos;', "'"),
+    ('&lt;', '<'),
+    ('&gt;', '>'),
+    ('&nbsp;', ' '),
+)
+
+
+def _decode_entities(text):
+    """HTML 엔티티 변환 (드문 엔티티만 html.unescape로 처리)"""
+    for entity, char in _COMMON_ENTITIES:
+        if entity in text:
+            text = text.replace(entity, char)
+
+    if '&' not in text:
+        return text
+    if text.count('&') == text.count('&amp;'):
+        return text.replace('&amp;', '&')
+    return html.unescape(text).replace('\xa0', ' ')
+
+
+def clean_html(text):
+    """
+    HTML 태그 제거 및 엔티티 변환
+
+    &quot;, &#39;, &#x27; 등 이름/숫자 엔티티를 모두 변환하며, &nbsp;는 일반 공백으로 바꾼다.
+    태그나 엔티티가 없는 문자열은 정규식을 거치지 않는다.
+
+    Parameters:
+    -----------
+    text : str
+        원본 문자열
+
+    Returns:
+    --------
+    str
+        정리된 문자열 (None이나 빈 값이면 "")
+    """
+    if not text:
+        return ""
+    if '<' in text:
+        text = _TAG_RE.sub('', text)
+    if '&' in text:
+        text = _decode_entities(text)
+    return text.strip()
+
+
+def clean_html_values(values):
+    """
+    문자열 컬럼 전체의 HTML 태그 제거 및 엔티티 변환
+
+    수집기가 API 응답 한 페이지의 제목/설명/댓글 컬럼을 한 번에 정리할 때 쓴다.
+    값을 이어 붙인 문자열에서 태그('<')와 엔티티('&') 포함 여부를 한 번에 확인하여,
+    둘 다 없는 컬럼(대부분의 댓글 페이지)은 strip만 하고, 있으면 값마다 clean_html()을
+    적용한다. 결과는 항상 값마다 clean_html()을 적용한 것과 같다.
+
+    Parameters:
+    -----------
+    values : iterable
+        문자열 목록 (None 등 문자열이 아닌 값은 "")
+
+    Returns:
+    --------
+    list
+        정리된 문자열 리스트
+    """
+    texts = [value if isinstance(value, str) else "" for value in values]
+
+    joined = "".join(texts)
+    if '<' in joined or '&' in joined:
+        return [clean_html(text) for text in texts]
+    return [text.strip() for text in texts]
+
+
+def clean_html_series(values):
+    """
+    컬럼 전체의 HTML 태그 제거 및 엔티티 변환 (clean_html_values()의 Series 버전)
+
+    Parameters:
+    -----------
+    values : pd.Series
+        문자열 컬럼
+
+    Returns:
+    --------
+    pd.Series
+        정리된 문자열 컬럼 (결측값은 "", 인덱스와 이름 유지)
+    """
+    cleaned = clean_html_values(values.tolist())
+    return pd.Series(cleaned, index=values.index, dtype=object, name=values.name)
+
+
+def clean_columns(df, columns):
+    """
+    DataFrame의 여러 문자열 컬럼을 한 번에 정리
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        대상 DataFrame
+    columns : list
+        정리할 컬럼 (없는 컬럼은 건너뜀)
+
+    Returns:
+    --------
+    pd.DataFrame
+        지정한 컬럼을 정리한 새 DataFrame
+    """
+    cleaned = {col: clean_html_series(df[col]) for col in columns if col in df.columns}
+    return df.assign(**cleaned) if cleaned else df.copy()
@@ -0,0 +1,132 @@
+"""
+시각 변환 모듈
+
+수집 결과의 시각은 모두 한국 시간(Asia/Seoul) 기준 tz-aware 값으로 다룬다.
+API 응답의 시각 문자열은 페이지 단위로 한 번에 변환하고, 문자열 형식
+(YYYY-MM-DD HH:MM:SS)은 워터마크 저장이나 내보내기처럼 꼭 필요한 곳에서만 만든다.
+"""
+import numpy as np
+import pandas as pd
+
+
+KST = "Asia/Seoul"
+
+# 워터마크, 내보내기에 쓰는 한국 시간 문자열 형식
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# 네이버 검색 API pubDate 형식 (예: "Mon, 03 Nov 2025 10:30:00 +0900")
+NAVER_DATE_FORMAT = "%a, %d %b %Y %H:%M:%S %z"
+
+
+def parse_naver_dates(values):
+    """
+    네이버 pubDate 문자열 목록을 한 번에 변환
+
+    Returns:
+    --------
+    pd.DatetimeIndex
+        한국 시간 기준 tz-aware 시각 (해석할 수 없는 값은 NaT)
+    """
+    parsed = pd.to_datetime(list(values), format=NAVER_DATE_FORMAT, errors='coerce', utc=True)
+    return parsed.tz_convert(KST)
+
+
+def parse_youtube_timestamps(values):
+    """
+    유튜브 API의 UTC 시각 문자열(예: "2025-11-03T01:30:00Z") 목록을 한 번에 변환
+
+    Returns:
+    --------
+    pd.DatetimeIndex
+        한국 시간 기준 tz-aware 시각 (빈 값이나 해석할 수 없는 값은 NaT)
+    """
+    values = [value or None for value in values]
+    parsed = pd.to_datetime(values, format='ISO8601', errors='coerce', utc=True)
+    return parsed.tz_convert(KST)
+
+
+def kst_timestamp(value):
+    """
+    한국 시간 문자열(YYYY-MM-DD 또는 YYYY-MM-DD HH:MM:SS)을 tz-aware 시각으로 변환
+
+    Returns:
+    --------
+    pd.Timestamp
+        한국 시간 기준 tz-aware 시각
+    """
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is None:
+        return timestamp.tz_localize(KST)
+    return timestamp.tz_convert(KST)
+
+
+def to_kst(values):
+    """
+    시각 컬럼을 한국 시간 기준 tz-aware datetime64로 변환
+
+    tz-aware 값은 한국 시간으로 바꾸고, 문자열이나 naive 값은 한국 시간으로 간주한다.
+
+    Parameters:
+    -----------
+    values : pd.Series
+        시각 컬럼 (Timestamp, datetime, 한국 시간 문자열 혼용 가능)
+
+    Returns:
+    --------
+    pd.Series
+        한국 시간 기준 tz-aware datetime64 컬럼 (해석할 수 없는 값은 NaT)
+    """
+    if isinstance(values.dtype, pd.DatetimeTZDtype):
+        return values.dt.tz_convert(KST)
+    if pd.api.types.is_datetime64_dtype(values):
+        return values.dt.tz_localize(KST)
+
+    try:
+        converted = pd.to_datetime(values, errors='coerce')
+    except (TypeError, ValueError):
+        converted = None
+
+    if converted is None or not pd.api.types.is_datetime64_any_dtype(converted):
+        # 시간대가 있는 값과 없는 값이 섞인 경우 값마다 변환
+        parsed = [
+            kst_timestamp(value) if pd.notna(value) and value != '' else pd.NaT
+            for value in values
+        ]
+        converted = pd.Series(pd.to_datetime(parsed, utc=True), index=values.index)
+
+    if converted.dt.tz is None:
+        return converted.dt.tz_localize(KST)
+    return converted.dt.tz_convert(KST)
+
+
+def format_kst(value):
+    """
+    시각을 한국 시간 문자열(YYYY-MM-DD HH:MM:SS)로 변환 (문자열은 그대로 반환)
+
+    Returns:
+    --------
+    str or None
+        한국 시간 문자열 (값이 없으면 None)
+    """
+    if value is None or pd.isna(value):
+        return None
+    if isinstance(value, str):
+        return value
+    return kst_timestamp(value).strftime(TIMESTAMP_FORMAT)
+
+
+def format_kst_series(values):
+    """
+    tz-aware 시각 컬럼을 한국 시간 문자열 컬럼으로 변환 (NaT는 None)
+
+    dt.strftime()은 값마다 형식 문자열을 해석하므로, 초 단위 numpy datetime64의
+    ISO 문자열 변환을 사용한다 (수십만 행 저장/내보내기에서 10배 이상 빠름).
+
+    Returns:
+    --------
+    pd.Series
+        문자열 컬럼
+    """
+    local = values.dt.tz_convert(KST).dt.tz_localize(None).to_numpy().astype('datetime64[s]')
+    formatted = [text.replace('T', ' ') for text in np.datetime_as_string(local, unit='s').tolist()]
+    return pd.Series(formatted, index=values.index, dtype=object).where(values.notna(), None)
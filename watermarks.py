@@ -0,0 +1,133 @@
+"""
+키워드별 수집 워터마크 관리 모듈
+
+증분 수집 시 키워드/소스별로 마지막으로 수집한 가장 최신 게시 시각을 저장해 두고,
+다음 수집에서는 그 이후에 게시된 항목만 가져오도록 한다.
+시각은 수집 결과와 같은 한국 시간 문자열(YYYY-MM-DD HH:MM:SS)로 저장한다.
+워터마크와 같은 시각에 게시된 항목도 다시 조회하므로(이상 조건), 경계의 항목은
+고유 키 기준 중복 제거로 걸러야 한다.
+워터마크 파일은 같은 데이터 디렉터리를 쓰는 다른 프로세스와 잠금으로 공유한다.
+"""
+import os
+
+import pandas as pd
+
+import settings
+import state_file
+from time_utils import format_kst, to_kst
+
+
+DEFAULT_WATERMARK_PATH = os.path.join(settings.DATA_DIR, "watermarks.json")
+
+
+def watermark_source(source_type, channel_filter=True, namespace=None):
+    """
+    소스 타입의 워터마크 이름
+
+    유튜브 영상은 언론사 채널 필터 여부에 따라 검색 범위가 다르므로 워터마크를 따로 관리한다.
+    namespace를 지정하면 "<namespace>:<이름>"을 쓴다. 빠진 구간을 건너뛰며 워터마크를
+    옮기는 스케줄러가 수동 증분 수집(웹 앱, 명령줄 실행기)의 워터마크를 옮기지 않도록
+    구분할 때 사용한다.
+    """
+    name = source_type
+    if source_type == 'youtube_video' and not channel_filter:
+        name = 'youtube_video_all'
+    return f"{namespace}:{name}" if namespace else name
+
+
+def get_watermark(source, keyword, path=DEFAULT_WATERMARK_PATH):
+    """
+    키워드/소스의 워터마크 조회
+
+    Parameters:
+    -----------
+    source : str
+        수집 소스 (예: "naver_news", "youtube_video")
+    keyword : str
+        검색 키워드
+
+    Returns:
+    --------
+    str or None
+        마지막으로 수집한 최신 게시 시각 (없으면 None)
+    """
+    with state_file.locked(path):
+        return state_file.read_json(path).get(source, {}).get(keyword)
+
+
+def update_watermark(source, keyword, value, path=DEFAULT_WATERMARK_PATH):
+    """
+    워터마크 갱신 (기존 값보다 최신인 경우에만 반영)
+
+    value는 한국 시간 문자열이나 시각(Timestamp/datetime)을 받으며, 저장할 때만
+    문자열로 변환한다.
+
+    Returns:
+    --------
+    str or None
+        갱신 후 워터마크
+    """
+    value = format_kst(value)
+    if not value:
+        return get_watermark(source, keyword, path)
+
+    with state_file.locked(path):
+        state = state_file.read_json(path)
+        current = state.get(source, {}).get(keyword)
+
+        # 같은 형식의 문자열이므로 사전순 비교 = 시간순 비교
+        if current is None or value > current:
+            state.setdefault(source, {})[keyword] = value
+            state_file.write_json(path, state)
+            current = value
+
+        return current
+
+
+def reset_watermarks(keyword=None, path=DEFAULT_WATERMARK_PATH):
+    """워터마크 초기화 (keyword를 지정하면 해당 키워드만)"""
+    with state_file.locked(path):
+        state = state_file.read_json(path)
+        if keyword is None:
+            state = {}
+        else:
+            for marks in state.values():
+                marks.pop(keyword, None)
+        state_file.write_json(path, state)
+
+
+def advance_watermark(source, keyword, published, complete, skip_gap=False,
+                      path=DEFAULT_WATERMARK_PATH):
+    """
+    수집한 항목의 게시 시각으로 워터마크 갱신
+
+    수집기는 최신순으로 가져오므로, 최대 수집 건수나 API 상한에 걸려 중간에 멈추면
+    가장 오래된 수집 항목과 기존 워터마크 사이를 보지 못한 것이다. 이 경우
+    (complete=False) 워터마크를 옮기지 않고 다음 증분 수집에서 그 구간을 다시 조회한다.
+    skip_gap=True면 그 구간을 포기하고 가장 오래된 수집 항목까지만 옮긴다 (받은 항목
+    사이는 빠짐없이 수집했으므로, 같은 구간을 계속 다시 조회하지 않아야 할 때 사용).
+
+    Parameters:
+    -----------
+    source : str
+        워터마크 이름 (watermark_source() 참고)
+    keyword : str
+        검색 키워드
+    published : iterable
+        수집한 항목의 게시 시각
+    complete : bool
+        기존 워터마크(없으면 조회 기간 시작)까지 빠짐없이 수집했는지 여부
+    skip_gap : bool
+        다 수집하지 못했을 때 워터마크를 가장 오래된 수집 항목으로 옮길지 여부
+
+    Returns:
+    --------
+    str or None
+        갱신 후 워터마크
+    """
+    published = to_kst(pd.Series(list(published), dtype=object))
+    if complete:
+        return update_watermark(source, keyword, published.max(), path)
+    if skip_gap:
+        return update_watermark(source, keyword, published.min(), path)
+    return get_watermark(source, keyword, path)
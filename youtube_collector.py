@@ -3,68 +3,329 @@
 """
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 import pandas as pd
-from datetime import datetime
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
-import re
+from urllib.parse import urlparse, parse_qsl
 
+import rate_limiter
+import response_cache
+from settings import YOUTUBE_UNIT_COSTS
+from text_utils import clean_html_values
+from time_utils import kst_timestamp, parse_youtube_timestamps
 
-def clean_html(text):
-    """HTML 태그 및 특수문자 제거"""
-    if not text:
-        return ""
-    # HTML 태그 제거
-    text = re.sub(r'<[^>]+>', '', text)
-    # HTML 엔티티 변환
-    text = text.replace('&quot;', '"')
-    text = text.replace('&#39;', "'")
-    text = text.replace('&amp;', '&')
-    text = text.replace('&lt;', '<')
-    text = text.replace('&gt;', '>')
-    text = text.replace('&nbsp;', ' ')
-    return text.strip()
 
+_clients = {}
+_client_build_seconds = {}
+_clients_lock = threading.Lock()
+_thread_local = threading.local()
+_usage_lock = threading.Lock()
 
-def convert_utc_to_kst(utc_time_str):
+# 배치 HTTP 요청 하나에 묶을 최대 하위 요청 수
+BATCH_SIZE = 50
+
+# 채널 업로드 목록 프로세스 내 보관 시간 (초)과 최대 보관 수 (채널 x 기간)
+UPLOADS_MEMO_TTL = 30 * 60
+UPLOADS_MEMO_MAX_ENTRIES = 200
+_uploads_memo = {}
+_uploads_lock = threading.Lock()
+
+
+def _thread_http():
+    """
+    스레드별 HTTP 연결 반환
+    
+    클라이언트가 공유하는 httplib2.Http는 스레드 안전하지 않으므로, 병렬 요청 시
+    스레드마다 별도의 연결로 실행한다.
     """
-    UTC 시간을 한국 시간대(KST, UTC+9)로 변환
+    http = getattr(_thread_local, 'http', None)
+    if http is None:
+        http = build_http()
+        _thread_local.http = http
+    return http
+
+
+def get_youtube_client(api_key):
+    """
+    API 키별 유튜브 클라이언트 반환 (프로세스 내에서 재사용)
+    
+    discovery 문서는 라이브러리에 포함된 정적 문서를 사용하므로 네트워크 요청이 없다.
     
     Parameters:
     -----------
-    utc_time_str : str
-        UTC 시간 문자열 (ISO 8601 형식, 예: "2025-11-25T10:30:00Z")
+    api_key : str
+        유튜브 API 키
+        
+    Returns:
+    --------
+    googleapiclient.discovery.Resource
+        유튜브 API 클라이언트
+    """
+    with _clients_lock:
+        youtube = _clients.get(api_key)
+        
+        if youtube is None:
+            started = time.perf_counter()
+            youtube = build('youtube', 'v3', developerKey=api_key,
+                            static_discovery=True, cache_discovery=False)
+            _client_build_seconds[rate_limiter.credential_id(api_key)] = time.perf_counter() - started
+            _clients[api_key] = youtube
+        
+        return youtube
+
+
+def get_client_build_seconds():
+    """
+    클라이언트 생성에 걸린 시간 (초)
     
     Returns:
     --------
-    str
-        한국 시간대 문자열 (YYYY-MM-DD HH:MM:SS)
+    dict
+        API 키 해시값을 키로 하는 생성 소요 시간
+    """
+    with _clients_lock:
+        return dict(_client_build_seconds)
+
+
+def _execute(request, limiter, method, use_cache=True, usage=None):
     """
-    if not utc_time_str:
-        return ""
+    할당량 비용만큼 RateLimiter를 거친 뒤 API 요청 실행
     
-    try:
-        from datetime import datetime as dt, timedelta
-        
-        # UTC 시간 파싱 (Z 또는 +00:00 제거)
-        utc_time_str = utc_time_str.replace('Z', '+00:00')
+    응답 캐시가 설정되어 있으면 같은 메서드/파라미터의 캐시된 응답을 먼저 사용한다.
+    
+    Parameters:
+    -----------
+    request : googleapiclient.http.HttpRequest
+        실행할 API 요청
+    limiter : rate_limiter.RateLimiter or None
+        호출 제한기 (None이면 제한 없이 실행)
+    method : str
+        YOUTUBE_UNIT_COSTS의 메서드 이름 (예: "search.list")
+    use_cache : bool
+        응답 캐시 사용 여부 (키 검증처럼 실제 호출이 필요한 경우 False)
+    usage : collections.Counter
+        실제로 호출한 경우 메서드별 사용 units를 누적할 카운터
+    """
+    cache = response_cache.get_cache() if use_cache else None
+    endpoint = f"youtube.{method}"
+    params = dict(parse_qsl(urlparse(request.uri).query))
+    
+    if cache is not None:
+        cached = cache.get(endpoint, params)
+        if cached is not None:
+            return cached
+    
+    if limiter is not None:
+        limiter.acquire(YOUTUBE_UNIT_COSTS[method], method=method)
+    if usage is not None:
+        with _usage_lock:
+            usage[method] += YOUTUBE_UNIT_COSTS[method]
+    response = request.execute(http=_thread_http())
+    
+    if cache is not None:
+        cache.set(endpoint, params, response)
+    return response
+
+
+def _execute_batch(youtube, limiter, method, requests, usage=None, ttls=None):
+    """
+    같은 메서드의 여러 요청을 배치 HTTP 요청으로 묶어 실행
+    
+    캐시된 응답이 있는 요청은 제외하고, 나머지를 BATCH_SIZE개씩 하나의 multipart
+    요청으로 보낸다. 하위 요청별 오류(예: commentsDisabled)는 개별적으로 반환되며,
+    배치 요청 자체가 실패하면 개별 요청으로 나누어 다시 실행한다.
+    
+    Parameters:
+    -----------
+    youtube : googleapiclient.discovery.Resource
+        유튜브 API 클라이언트
+    limiter : rate_limiter.RateLimiter or None
+        호출 제한기
+    method : str
+        YOUTUBE_UNIT_COSTS의 메서드 이름
+    requests : list
+        (요청 식별자, HttpRequest) 리스트
+    usage : collections.Counter
+        메서드별 사용 units를 누적할 카운터
+    ttls : dict
+        요청 식별자별 캐시 유지 시간 (초, 없는 요청은 엔드포인트 기본값)
         
-        # ISO 8601 형식 파싱
-        if '+' in utc_time_str or utc_time_str.endswith('00:00'):
-            # 타임존 정보가 있는 경우
-            utc_time = dt.fromisoformat(utc_time_str.replace('Z', '+00:00'))
-            # naive datetime으로 변환 (UTC 기준)
-            utc_time = utc_time.replace(tzinfo=None)
+    Returns:
+    --------
+    dict
+        요청 식별자를 키로 하는 (응답, HttpError 또는 None)
+    """
+    cache = response_cache.get_cache()
+    endpoint = f"youtube.{method}"
+    results = {}
+    pending = []
+    
+    for key, request in requests:
+        params = dict(parse_qsl(urlparse(request.uri).query))
+        cached = cache.get(endpoint, params) if cache is not None else None
+        if cached is not None:
+            results[key] = (cached, None)
         else:
-            utc_time = dt.fromisoformat(utc_time_str)
+            pending.append((key, request, params))
+    
+    for i in range(0, len(pending), BATCH_SIZE):
+        chunk = pending[i:i + BATCH_SIZE]
+        cost = YOUTUBE_UNIT_COSTS[method] * len(chunk)
+        
+        # 할당량은 하위 요청 수만큼, 초당 호출 제한은 HTTP 요청 1회로 계산
+        if limiter is not None:
+            limiter.acquire(cost, calls=1, method=method)
+        if usage is not None:
+            with _usage_lock:
+                usage[method] += cost
         
-        # 한국 시간 = UTC + 9시간
-        kst_time = utc_time + timedelta(hours=9)
+        chunk_results = {}
         
-        return kst_time.strftime("%Y-%m-%d %H:%M:%S")
+        def callback(request_id, response, exception):
+            chunk_results[request_id] = (response, exception)
+        
+        batch = youtube.new_batch_http_request(callback=callback)
+        for idx, (key, request, params) in enumerate(chunk):
+            batch.add(request, request_id=str(idx))
+        
+        try:
+            batch.execute(http=_thread_http())
+        except Exception as e:
+            print(f"배치 요청 실패, 개별 요청으로 재시도합니다: {e}")
+            chunk_results = {}
+            for idx, (key, request, params) in enumerate(chunk):
+                try:
+                    # 할당량은 이미 반영했으므로 초당 호출 제한만 적용
+                    if limiter is not None:
+                        limiter.acquire(0, method=method)
+                    chunk_results[str(idx)] = (request.execute(http=_thread_http()), None)
+                except HttpError as he:
+                    chunk_results[str(idx)] = (None, he)
+        
+        for idx, (key, request, params) in enumerate(chunk):
+            response, exception = chunk_results.get(str(idx), (None, None))
+            if exception is None and response is not None and cache is not None:
+                cache.set(endpoint, params, response, ttl=(ttls or {}).get(key))
+            results[key] = (response, exception)
     
-    except Exception as e:
-        # 파싱 실패 시 원본 반환
-        return utc_time_str
+    return results
+
+
+def _search_page(youtube, limiter, usage, query, published_after, published_before,
+                 page_size, channel_id=None, page_token=None):
+    """
+    search.list 한 페이지 요청 (페이지당 100 units)
+    
+    Returns:
+    --------
+    tuple
+        (검색 결과 항목 리스트, 다음 페이지 토큰)
+    """
+    params = {
+        'q': query,
+        'part': 'id,snippet',
+        'type': 'video',
+        'publishedAfter': published_after,
+        'publishedBefore': published_before,
+        'maxResults': page_size,
+        'order': 'date'
+    }
+    if channel_id:
+        params['channelId'] = channel_id
+    if page_token:
+        params['pageToken'] = page_token
+    
+    response = _execute(youtube.search().list(**params), limiter, 'search.list', usage=usage)
+    return response.get('items', []), response.get('nextPageToken')
+
+
+def _search_channels_concurrently(youtube, limiter, usage, query, published_after,
+                                  published_before, channel_tokens, executor):
+    """
+    여러 언론사 채널의 search.list 페이지를 병렬로 요청
+    
+    할당량 초과(403)가 발생하면 아직 시작하지 않은 요청은 취소하고 예외를 발생시킨다.
+    
+    Parameters:
+    -----------
+    channel_tokens : list
+        (채널 이름, 페이지 토큰) 리스트
+    executor : ThreadPoolExecutor
+        요청을 실행할 스레드 풀 (배분 회차마다 같은 풀을 써서 스레드별 연결을 재사용)
+        
+    Returns:
+    --------
+    dict
+        채널 이름을 키로 하는 (검색 결과 항목 리스트, 다음 페이지 토큰)
+    """
+    cancelled = threading.Event()
+    
+    def fetch(channel_name, page_token):
+        if cancelled.is_set():
+            return [], None
+        
+        try:
+            return _search_page(
+                youtube, limiter, usage, query, published_after, published_before,
+                50, MEDIA_CHANNELS[channel_name], page_token
+            )
+        except HttpError as e:
+            if e.resp.status == 403:
+                raise Exception("유튜브 API 할당량 초과. 내일 다시 시도해주세요.")
+            print(f"{channel_name} 검색 중 오류: {e}")
+            return [], None
+    
+    pages = {}
+    if not channel_tokens:
+        return pages
+    
+    futures = {
+        executor.submit(fetch, channel_name, page_token): channel_name
+        for channel_name, page_token in channel_tokens
+    }
+    try:
+        for future in as_completed(futures):
+            pages[futures[future]] = future.result()
+    except Exception:
+        cancelled.set()
+        for future in futures:
+            future.cancel()
+        raise
+    
+    return pages
+
+
+def _video_records(items, channel_names):
+    """
+    search.list 결과 항목들을 영상 레코드로 변환
+    
+    게시 시각과 제목/설명은 항목 전체를 한 번에 한국 시간 기준 tz-aware 시각과
+    정리된 문자열로 변환한다.
+    """
+    published = parse_youtube_timestamps(item['snippet'].get('publishedAt') for item in items)
+    titles = clean_html_values(item['snippet'].get('title', '') for item in items)
+    descriptions = clean_html_values(item['snippet'].get('description', '') for item in items)
+    
+    records = []
+    for item, channel_name, published_at, title, description in zip(
+        items, channel_names, published, titles, descriptions
+    ):
+        video_id = item['id']['videoId']
+        snippet = item['snippet']
+        records.append({
+            'type': 'youtube_video',
+            'video_id': video_id,
+            'title': title,
+            'description': description,
+            'channel_name': channel_name,
+            'channel_id': snippet.get('channelId', ''),
+            'published_at': published_at,
+            'url': f"https://www.youtube.com/watch?v={video_id}"
+        })
+    return records
 
 
 # 주요 언론사 채널 ID 목록
@@ -82,7 +343,7 @@ MEDIA_CHANNELS = {
 }
 
 
-def get_video_statistics(youtube, video_ids):
+def get_video_statistics(youtube, video_ids, limiter=None, usage=None):
     """
     영상 ID 리스트로 상세 통계 정보 가져오기
     
@@ -92,6 +353,10 @@ def get_video_statistics(youtube, video_ids):
         유튜브 API 클라이언트
     video_ids : list
         영상 ID 리스트
+    limiter : rate_limiter.RateLimiter
+        API 키별 호출 제한기
+    usage : collections.Counter
+        메서드별 사용 units를 누적할 카운터
         
     Returns:
     --------
@@ -103,192 +368,510 @@ def get_video_statistics(youtube, video_ids):
     
     stats_dict = {}
     
-    # 한 번에 최대 50개씩 조회 가능
-    for i in range(0, len(video_ids), 50):
-        batch_ids = video_ids[i:i+50]
+    # 한 번에 최대 50개씩 조회 가능 (여러 조회를 배치 요청 하나로 묶어 전송)
+    requests = [
+        (i, youtube.videos().list(part='statistics,snippet', id=','.join(video_ids[i:i+50])))
+        for i in range(0, len(video_ids), 50)
+    ]
+    responses = _execute_batch(youtube, limiter, 'videos.list', requests, usage)
+    
+    for key, request in requests:
+        response, error = responses[key]
+        if error is not None:
+            print(f"통계 정보 조회 중 오류: {error}")
+            continue
         
-        try:
-            response = youtube.videos().list(
-                part='statistics,snippet',
-                id=','.join(batch_ids)
-            ).execute()
-            
-            for item in response.get('items', []):
-                video_id = item['id']
-                statistics = item.get('statistics', {})
-                snippet = item.get('snippet', {})
-                
-                stats_dict[video_id] = {
-                    'view_count': int(statistics.get('viewCount', 0)),
-                    'like_count': int(statistics.get('likeCount', 0)),
-                    'comment_count': int(statistics.get('commentCount', 0)),
-                    'tags': ', '.join(snippet.get('tags', []))  # 태그를 쉼표로 연결
-                }
-            
-            time.sleep(0.1)
+        for item in (response or {}).get('items', []):
+            video_id = item['id']
+            statistics = item.get('statistics', {})
+            snippet = item.get('snippet', {})
             
-        except HttpError as e:
-            print(f"통계 정보 조회 중 오류: {e}")
-            continue
+            stats_dict[video_id] = {
+                'view_count': int(statistics.get('viewCount', 0)),
+                'like_count': int(statistics.get('likeCount', 0)),
+                'comment_count': int(statistics.get('commentCount', 0)),
+                'tags': ', '.join(snippet.get('tags', []))  # 태그를 쉼표로 연결
+            }
     
     return stats_dict
 
 
-def collect_youtube_videos(api_key, query, start_date, end_date, channel_filter=True, max_results=50):
+def _uploads_playlist_id(channel_id):
+    """채널의 업로드 재생목록 ID (채널 ID의 'UC' 접두어를 'UU'로 바꾼 값)"""
+    return 'UU' + channel_id[2:]
+
+
+def _sweep_channel(youtube, limiter, usage, channel_name, channel_id,
+                   published_after, published_before):
     """
-    유튜브 영상 수집
+    채널 업로드 재생목록을 최신순으로 훑어 기간 내 영상 레코드 수집
+    
+    playlistItems.list는 페이지당 1 unit이며, 기간 시작 이전 영상이 나오면 중단한다.
+    태그/통계는 videos.list(50개당 1 unit)로 한 번에 채운다.
+    """
+    records = []
+    page_token = None
+    window_start = pd.Timestamp(published_after)
+    window_end = pd.Timestamp(published_before)
+    
+    while True:
+        params = {
+            'part': 'snippet,contentDetails',
+            'playlistId': _uploads_playlist_id(channel_id),
+            'maxResults': 50
+        }
+        if page_token:
+            params['pageToken'] = page_token
+        
+        response = _execute(
+            youtube.playlistItems().list(**params), limiter, 'playlistItems.list', usage=usage
+        )
+        items = response.get('items', [])
+        
+        # 게시 시각이 없는 항목은 비공개/삭제된 영상 (NaT라 기간 비교에서 제외됨)
+        published = parse_youtube_timestamps(
+            item.get('contentDetails', {}).get('videoPublishedAt') for item in items
+        )
+        reached_start = bool((published < window_start).any())
+        in_range = (published >= window_start) & (published <= window_end)
+        titles = clean_html_values(item['snippet'].get('title', '') for item in items)
+        descriptions = clean_html_values(item['snippet'].get('description', '') for item in items)
+        
+        for item, published_at, keep, title, description in zip(items, published, in_range, titles, descriptions):
+            if not keep:
+                continue
+            
+            snippet = item['snippet']
+            video_id = item['contentDetails']['videoId']
+            records.append({
+                'type': 'youtube_video',
+                'video_id': video_id,
+                'title': title,
+                'description': description,
+                'channel_name': channel_name,
+                'channel_id': snippet.get('channelId', channel_id),
+                'published_at': published_at,
+                'url': f"https://www.youtube.com/watch?v={video_id}"
+            })
+        
+        page_token = response.get('nextPageToken')
+        if reached_start or not page_token or not items:
+            break
+    
+    stats_dict = get_video_statistics(
+        youtube, [record['video_id'] for record in records], limiter, usage
+    )
+    for record in records:
+        stats = stats_dict.get(record['video_id'], {})
+        record['view_count'] = stats.get('view_count', 0)
+        record['like_count'] = stats.get('like_count', 0)
+        record['comment_count'] = stats.get('comment_count', 0)
+        record['tags'] = stats.get('tags', '')
+    
+    return records
+
+
+def _remember_uploads(key, stored_at, records):
+    """
+    채널 업로드 목록 보관
+    
+    기간이 계속 바뀌는 장기 실행 프로세스(스케줄러 등)에서 보관 목록이 끝없이 늘지 않도록
+    기록할 때 만료된 항목을 지우고, 그래도 최대 보관 수를 넘으면 오래된 항목부터 지운다.
+    """
+    with _uploads_lock:
+        expired = [k for k, (t, _) in _uploads_memo.items() if stored_at - t >= UPLOADS_MEMO_TTL]
+        for k in expired:
+            del _uploads_memo[k]
+        
+        # 다시 기록한 항목은 가장 최근 항목이 되도록 뒤로 옮김 (dict는 삽입 순서 유지)
+        _uploads_memo.pop(key, None)
+        _uploads_memo[key] = (stored_at, records)
+        while len(_uploads_memo) > UPLOADS_MEMO_MAX_ENTRIES:
+            del _uploads_memo[next(iter(_uploads_memo))]
+
+
+def sweep_channel_uploads(api_key, published_after, published_before, max_workers=5, usage=None,
+                          use_memo=True):
+    """
+    언론사 채널 업로드 목록을 기간 단위로 수집 (키워드 무관)
+    
+    한 번 훑은 결과는 프로세스 내에 UPLOADS_MEMO_TTL초 동안 보관되므로, 같은 기간으로
+    여러 키워드를 수집해도 채널당 한 번만 호출한다. 응답 캐시가 설정되어 있으면
+    재실행 시에도 playlistItems/videos 응답을 재사용한다.
     
     Parameters:
     -----------
     api_key : str
         유튜브 API 키
-    query : str
-        검색 키워드
-    start_date : str
-        시작일 (YYYY-MM-DD) - 한국 시간대 기준
-    end_date : str
-        종료일 (YYYY-MM-DD) - 한국 시간대 기준
-    channel_filter : bool
-        언론사 채널만 필터링할지 여부
-    max_results : int
-        최대 수집 건수
+    published_after : str
+        기간 시작 (UTC, YYYY-MM-DDTHH:MM:SSZ)
+    published_before : str
+        기간 종료 (UTC, YYYY-MM-DDTHH:MM:SSZ)
+    max_workers : int
+        채널별 요청을 동시에 보낼 최대 수
+    usage : collections.Counter
+        메서드별 사용 units를 누적할 카운터
+    use_memo : bool
+        False면 보관된 결과를 쓰지 않고 매번 새로 조회한다 (새 업로드를 바로 봐야 하는
+        스케줄러용). 새로 조회한 결과는 그대로 보관한다
         
     Returns:
     --------
-    pd.DataFrame
-        수집된 영상 데이터
+    dict
+        채널 이름을 키로 하는 영상 레코드 리스트 (최신순)
     """
+    youtube = get_youtube_client(api_key)
+    limiter = rate_limiter.get_limiter("youtube", api_key)
+    now = time.time()
+    
+    uploads = {}
+    to_sweep = []
+    with _uploads_lock:
+        for channel_name, channel_id in MEDIA_CHANNELS.items():
+            memo = _uploads_memo.get((channel_id, published_after, published_before))
+            if use_memo and memo and now - memo[0] < UPLOADS_MEMO_TTL:
+                uploads[channel_name] = memo[1]
+            else:
+                to_sweep.append(channel_name)
+    
+    def sweep(channel_name):
+        return _sweep_channel(
+            youtube, limiter, usage, channel_name, MEDIA_CHANNELS[channel_name],
+            published_after, published_before
+        )
+    
+    if to_sweep:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(to_sweep)))) as executor:
+            futures = {executor.submit(sweep, channel_name): channel_name for channel_name in to_sweep}
+            try:
+                for future in as_completed(futures):
+                    channel_name = futures[future]
+                    try:
+                        uploads[channel_name] = future.result()
+                    except HttpError as e:
+                        if e.resp.status == 403:
+                            raise Exception("유튜브 API 할당량 초과. 내일 다시 시도해주세요.")
+                        print(f"{channel_name} 업로드 목록 조회 중 오류: {e}")
+                        continue
+                    
+                    _remember_uploads(
+                        (MEDIA_CHANNELS[channel_name], published_after, published_before),
+                        now, uploads[channel_name]
+                    )
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+    
+    return {
+        channel_name: uploads[channel_name]
+        for channel_name in MEDIA_CHANNELS if channel_name in uploads
+    }
+
+
+def _matches_query(record, terms):
+    """제목/설명/태그에 모든 검색어가 포함되는지 확인 (대소문자 무시)"""
+    text = ' '.join([record['title'], record['description'], record['tags']]).casefold()
+    return all(term in text for term in terms)
+
+
+def _attach_statistics(youtube, limiter, usage, records):
+    """통계 정보가 없는 영상 레코드에 videos.list 통계 추가 (업로드 목록 방식은 이미 포함)"""
+    video_ids = [record['video_id'] for record in records if 'view_count' not in record]
+    if not video_ids:
+        return records
+    
+    stats_dict = get_video_statistics(youtube, video_ids, limiter, usage)
+    
+    for record in records:
+        if 'view_count' in record:
+            continue
+        stats = stats_dict.get(record['video_id'], {})
+        record['view_count'] = stats.get('view_count', 0)
+        record['like_count'] = stats.get('like_count', 0)
+        record['comment_count'] = stats.get('comment_count', 0)
+        record['tags'] = stats.get('tags', '')
+    return records
+
+
+def iter_youtube_videos(api_key, query, start_date, end_date, channel_filter=True, max_results=50,
+                        since=None, max_workers=5, engine="search", usage=None,
+                        known_video_ids=None, use_memo=True):
+    """
+    유튜브 영상을 묶음 단위로 수집하는 제너레이터
+    
+    언론사 채널 검색은 배분 회차마다, 전체 검색은 검색 페이지마다, 업로드 목록 방식은
+    기간 전체 조회가 끝난 뒤 한 번에 통계까지 채운 레코드 리스트를 생성한다.
+    이미 생성한 영상은 다시 생성하지 않는다. 파라미터는 collect_youtube_videos()와 같다.
+    
+    Parameters:
+    -----------
+    usage : Counter
+        메서드별 사용 할당량(units)을 누적할 Counter
+    known_video_ids : set
+        같은 실행의 다른 키워드에서 이미 수집한 영상 ID. 해당 영상도 결과에는 포함하지만
+        통계 정보(videos.list)는 다시 요청하지 않는다
+        
+    Yields:
+    -------
+    list
+        영상 레코드 리스트
+    """
+    
+    if usage is None:
+        usage = Counter()
     
     try:
-        youtube = build('youtube', 'v3', developerKey=api_key)
+        youtube = get_youtube_client(api_key)
+        limiter = rate_limiter.get_limiter("youtube", api_key)
+        
+        # 한국 시간 기준 기간을 API가 받는 UTC 문자열로 변환
+        # 시작일: 한국 시간 00:00:00, 종료일: 한국 시간 23:59:59
+        start_datetime_kst = kst_timestamp(start_date)
+        if since:
+            # 워터마크와 같은 초에 게시된 영상도 받음 (이미 받은 영상은 video_id로 중복 제거)
+            start_datetime_kst = max(start_datetime_kst, kst_timestamp(since))
+        end_datetime_kst = kst_timestamp(f"{end_date} 23:59:59")
         
-        # 한국 시간을 UTC로 변환 (한국은 UTC+9)
-        from datetime import datetime as dt, timedelta
+        start_datetime = start_datetime_kst.tz_convert('UTC').strftime("%Y-%m-%dT%H:%M:%SZ")
+        end_datetime = end_datetime_kst.tz_convert('UTC').strftime("%Y-%m-%dT%H:%M:%SZ")
         
-        # 시작일: 한국 시간 00:00:00 → UTC (9시간 빼기)
-        start_datetime_kst = dt.strptime(f"{start_date} 00:00:00", "%Y-%m-%d %H:%M:%S")
-        start_datetime_utc = start_datetime_kst - timedelta(hours=9)
-        start_datetime = start_datetime_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
+        seen = set()
         
-        # 종료일: 한국 시간 23:59:59 → UTC (9시간 빼기)
-        end_datetime_kst = dt.strptime(f"{end_date} 23:59:59", "%Y-%m-%d %H:%M:%S")
-        end_datetime_utc = end_datetime_kst - timedelta(hours=9)
-        end_datetime = end_datetime_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
+        known = known_video_ids if known_video_ids is not None else set()
         
-        results = []
+        def emit(records):
+            # 페이지가 바뀌며 같은 영상이 다시 나오는 경우 제거 후 새 영상에만 통계 추가
+            unique = []
+            for record in records:
+                if record['video_id'] not in seen:
+                    seen.add(record['video_id'])
+                    unique.append(record)
+            _attach_statistics(
+                youtube, limiter, usage,
+                [record for record in unique if record['video_id'] not in known]
+            )
+            return unique
         
-        if channel_filter:
+        if channel_filter and engine == "uploads":
+            # 업로드 목록에서 키워드가 포함된 영상을 채널별로 번갈아 가며 배분
+            uploads = sweep_channel_uploads(
+                api_key, start_datetime, end_datetime, max_workers, usage, use_memo
+            )
+            terms = query.casefold().split()
+            matches = {
+                channel_name: [record for record in records if _matches_query(record, terms)]
+                for channel_name, records in uploads.items()
+            }
+            
+            taken = {channel_name: [] for channel_name in matches}
+            total_taken = 0
+            depth = 0
+            while total_taken < max_results and any(len(m) > depth for m in matches.values()):
+                for channel_name, records in matches.items():
+                    if total_taken < max_results and len(records) > depth:
+                        taken[channel_name].append(dict(records[depth], type='youtube_video'))
+                        total_taken += 1
+                depth += 1
+            
+            records = emit([record for records in taken.values() for record in records])
+            if records:
+                yield records
+            
+        elif channel_filter:
             # 언론사 채널별로 검색
-            for channel_name, channel_id in MEDIA_CHANNELS.items():
-                try:
-                    search_response = youtube.search().list(
-                        q=query,
-                        channelId=channel_id,
-                        part='id,snippet',
-                        type='video',
-                        publishedAfter=start_datetime,
-                        publishedBefore=end_datetime,
-                        maxResults=min(50, max_results),
-                        order='date'
-                    ).execute()
+            # search.list는 결과 수와 무관하게 페이지당 100 units이므로 항상 50건씩 받아
+            # 채널별 버퍼에 담아 두고, 버퍼에서 채널을 번갈아 가며 하나씩 꺼내 배분한다.
+            # 버퍼가 빈 채널만 다음 페이지를 요청하므로 필요한 페이지 수가 최소화된다.
+            buffers = {channel_name: [] for channel_name in MEDIA_CHANNELS}
+            page_tokens = {channel_name: None for channel_name in MEDIA_CHANNELS}
+            exhausted = set()
+            total_taken = 0
+            
+            # 배분 회차 전체에서 스레드 풀 하나를 써서 스레드별 HTTP 연결을 재사용
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(MEDIA_CHANNELS)))) as executor:
+                while total_taken < max_results:
+                    # 버퍼가 비어 있고 결과가 남은 채널의 다음 페이지를 병렬로 요청
+                    to_fetch = [
+                        channel_name for channel_name in MEDIA_CHANNELS
+                        if not buffers[channel_name] and channel_name not in exhausted
+                    ]
+                    pages = _search_channels_concurrently(
+                        youtube, limiter, usage, query, start_datetime, end_datetime,
+                        [(channel_name, page_tokens[channel_name]) for channel_name in to_fetch],
+                        executor
+                    )
                     
-                    for item in search_response.get('items', []):
-                        if len(results) >= max_results:
-                            break
-                            
-                        video_id = item['id']['videoId']
-                        snippet = item['snippet']
-                        
-                        # published_at을 한국 시간대로 변환
-                        published_at_utc = snippet.get('publishedAt', '')
-                        published_at_kst = convert_utc_to_kst(published_at_utc)
-                        
-                        results.append({
-                            'type': 'youtube_video',
-                            'video_id': video_id,
-                            'title': clean_html(snippet.get('title', '')),
-                            'description': clean_html(snippet.get('description', '')),
-                            'channel_name': channel_name,
-                            'channel_id': snippet.get('channelId', ''),
-                            'published_at': published_at_kst,
-                            'url': f"https://www.youtube.com/watch?v={video_id}"
-                        })
+                    for channel_name in to_fetch:
+                        items, next_token = pages[channel_name]
+                        buffers[channel_name].extend(items)
+                        page_tokens[channel_name] = next_token
+                        if not next_token or not items:
+                            exhausted.add(channel_name)
+                    
+                    if not any(buffers.values()):
+                        break
                     
-                    time.sleep(0.1)  # API 제한 준수
+                    # 채널을 번갈아 가며 배분 (결과가 남은 채널의 버퍼가 비면 다시 요청)
+                    taken = []
+                    need_refill = False
+                    while total_taken < max_results and not need_refill:
+                        progressed = False
+                        for channel_name in MEDIA_CHANNELS:
+                            if total_taken >= max_results:
+                                break
+                            if buffers[channel_name]:
+                                taken.append((buffers[channel_name].pop(0), channel_name))
+                                total_taken += 1
+                                progressed = True
+                            elif channel_name not in exhausted:
+                                need_refill = True
+                        if not progressed:
+                            break
                     
-                except HttpError as e:
-                    if e.resp.status == 403:
-                        raise Exception("유튜브 API 할당량 초과. 내일 다시 시도해주세요.")
-                    print(f"{channel_name} 검색 중 오류: {e}")
-                    continue
+                    records = emit(_video_records(
+                        [item for item, _ in taken], [channel_name for _, channel_name in taken]
+                    ))
+                    if records:
+                        yield records
                     
         else:
             # 전체 검색
             try:
-                search_response = youtube.search().list(
-                    q=query,
-                    part='id,snippet',
-                    type='video',
-                    publishedAfter=start_datetime,
-                    publishedBefore=end_datetime,
-                    maxResults=min(50, max_results),
-                    order='date'
-                ).execute()
+                page_token = None
+                total_taken = 0
                 
-                for item in search_response.get('items', []):
-                    video_id = item['id']['videoId']
-                    snippet = item['snippet']
+                while total_taken < max_results:
+                    remaining = max_results - total_taken
+                    items, page_token = _search_page(
+                        youtube, limiter, usage, query, start_datetime, end_datetime,
+                        min(50, remaining), page_token=page_token
+                    )
                     
-                    # published_at을 한국 시간대로 변환
-                    published_at_utc = snippet.get('publishedAt', '')
-                    published_at_kst = convert_utc_to_kst(published_at_utc)
+                    page_items = items[:remaining]
+                    records = emit(_video_records(
+                        page_items, [item['snippet'].get('channelTitle', '') for item in page_items]
+                    ))
+                    total_taken += len(records)
+                    if records:
+                        yield records
                     
-                    results.append({
-                        'type': 'youtube_video',
-                        'video_id': video_id,
-                        'title': clean_html(snippet.get('title', '')),
-                        'description': clean_html(snippet.get('description', '')),
-                        'channel_name': snippet.get('channelTitle', ''),
-                        'channel_id': snippet.get('channelId', ''),
-                        'published_at': published_at_kst,
-                        'url': f"https://www.youtube.com/watch?v={video_id}"
-                    })
+                    if not page_token or not items:
+                        break
                     
             except HttpError as e:
                 if e.resp.status == 403:
                     raise Exception("유튜브 API 할당량 초과. 내일 다시 시도해주세요.")
                 raise Exception(f"유튜브 검색 중 오류: {str(e)}")
         
-        if not results:
-            return pd.DataFrame(columns=['type', 'video_id', 'title', 'description', 
-                                         'channel_name', 'channel_id', 'published_at', 'url',
-                                         'view_count', 'like_count', 'comment_count', 'tags'])
-        
-        # 수집된 영상 ID 리스트 추출
-        video_ids = [result['video_id'] for result in results]
-        
-        # 상세 통계 정보 가져오기
-        stats_dict = get_video_statistics(youtube, video_ids)
-        
-        # 각 결과에 통계 정보 추가
-        for result in results:
-            video_id = result['video_id']
-            stats = stats_dict.get(video_id, {})
-            result['view_count'] = stats.get('view_count', 0)
-            result['like_count'] = stats.get('like_count', 0)
-            result['comment_count'] = stats.get('comment_count', 0)
-            result['tags'] = stats.get('tags', '')
-        
-        df = pd.DataFrame(results)
-        return df
-        
     except Exception as e:
         raise Exception(f"유튜브 영상 수집 중 오류: {str(e)}")
 
 
-def collect_youtube_comments(api_key, video_ids, max_comments_per_video=100):
+def collect_youtube_videos(api_key, query, start_date, end_date, channel_filter=True, max_results=50,
+                           since=None, max_workers=5, engine="search", use_memo=True):
     """
-    유튜브 댓글 수집
+    유튜브 영상 수집
+    
+    search.list를 nextPageToken으로 페이징하여 max_results까지 수집한다. 언론사 채널
+    모드에서는 채널별 검색을 병렬로 보내고, 수집 건수를 아직 결과가 남은 채널에
+    고르게 배분한다 (결과 순서는 MEDIA_CHANNELS 순서로 고정).
+    실제로 사용한 메서드별 할당량(units)은 반환 DataFrame의 attrs["quota_units"]에 기록된다.
+    
+    Parameters:
+    -----------
+    api_key : str
+        유튜브 API 키
+    query : str
+        검색 키워드
+    start_date : str
+        시작일 (YYYY-MM-DD) - 한국 시간대 기준
+    end_date : str
+        종료일 (YYYY-MM-DD) - 한국 시간대 기준
+    channel_filter : bool
+        언론사 채널만 필터링할지 여부
+    max_results : int
+        최대 수집 건수
+    since : str
+        증분 수집 워터마크 (YYYY-MM-DD HH:MM:SS, 한국 시간). 지정하면 이 시각 이후
+        (같은 시각 포함) 게시된 영상만 검색
+    max_workers : int
+        언론사 채널 모드에서 채널별 검색을 동시에 보낼 최대 요청 수
+    engine : str
+        언론사 채널 모드의 수집 방식. "search"는 채널별 search.list(페이지당 100 units),
+        "uploads"는 채널 업로드 목록(playlistItems.list, 페이지당 1 unit)을 기간 단위로
+        가져와 제목/설명/태그에서 키워드를 직접 찾는다
+    use_memo : bool
+        "uploads" 방식에서 프로세스 내에 보관한 업로드 목록을 재사용할지 여부
+        (sweep_channel_uploads() 참고)
+        
+    Returns:
+    --------
+    pd.DataFrame
+        수집된 영상 데이터
+    """
+    usage = Counter()
+    results = []
+    for records in iter_youtube_videos(api_key, query, start_date, end_date, channel_filter,
+                                       max_results, since, max_workers, engine, usage,
+                                       use_memo=use_memo):
+        results.extend(records)
+    
+    if channel_filter and engine != "uploads":
+        # 배분 회차별로 섞여 나온 결과를 MEDIA_CHANNELS 순서로 정렬 (채널 내 순서 유지)
+        channel_order = {channel_name: i for i, channel_name in enumerate(MEDIA_CHANNELS)}
+        results.sort(key=lambda record: channel_order[record['channel_name']])
+    
+    if not results:
+        df = pd.DataFrame(columns=['type', 'video_id', 'title', 'description', 
+                                   'channel_name', 'channel_id', 'published_at', 'url',
+                                   'view_count', 'like_count', 'comment_count', 'tags'])
+    else:
+        df = pd.DataFrame(results)
+    
+    df.attrs['quota_units'] = dict(usage)
+    return df
+
+
+def _comment_records(video_id, items):
+    """
+    commentThreads.list 결과 항목들을 댓글 레코드로 변환
+    
+    작성/수정 시각과 작성자/본문은 페이지 전체를 한 번에 한국 시간 기준 tz-aware 시각과
+    정리된 문자열로 변환한다.
+    """
+    comments = [item['snippet']['topLevelComment']['snippet'] for item in items]
+    published = parse_youtube_timestamps(comment.get('publishedAt') for comment in comments)
+    updated = parse_youtube_timestamps(comment.get('updatedAt') for comment in comments)
+    authors = clean_html_values(comment.get('authorDisplayName', '') for comment in comments)
+    texts = clean_html_values(comment.get('textDisplay', '') for comment in comments)
+    
+    return [
+        {
+            'type': 'youtube_comment',
+            'video_id': video_id,
+            'comment_id': item['id'],
+            'author': author,
+            'text': text,
+            'like_count': comment.get('likeCount', 0),
+            'published_at': published_at,
+            'updated_at': updated_at
+        }
+        for item, comment, author, text, published_at, updated_at in zip(
+            items, comments, authors, texts, published, updated
+        )
+    ]
+
+
+def iter_youtube_comments(api_key, video_ids, max_comments_per_video=100, max_workers=4,
+                          progress_callback=None, usage=None, published_at=None):
+    """
+    유튜브 댓글을 페이지 단위로 수집하는 제너레이터
+    
+    영상별로 nextPageToken을 따라 max_comments_per_video까지 댓글을 수집한다. 매 회차마다
+    다음 페이지가 필요한 영상들의 요청을 배치 요청으로 묶고, 배치들을 최대 max_workers개
+    스레드에서 동시에 보낸다. 영상당 상한에 도달하거나 다음 페이지가 없는 영상은
+    즉시 수집을 마친다. 회차마다 영상 하나의 댓글 한 페이지씩을 생성한다.
     
     Parameters:
     -----------
@@ -298,75 +881,162 @@ def collect_youtube_comments(api_key, video_ids, max_comments_per_video=100):
         영상 ID 리스트
     max_comments_per_video : int
         영상당 최대 댓글 수
+    max_workers : int
+        동시에 보낼 최대 배치 요청 수
+    progress_callback : callable
+        영상 하나의 수집이 끝날 때마다 (완료 영상 수, 전체 영상 수)로 호출
+    usage : Counter
+        메서드별 사용 할당량(units)을 누적할 Counter
+    published_at : dict
+        영상 ID별 게시 시각 (댓글 응답 캐시 유지 시간 결정, 없으면 최근 영상으로 취급)
         
-    Returns:
-    --------
-    pd.DataFrame
-        수집된 댓글 데이터
+    Yields:
+    -------
+    list
+        영상 하나의 댓글 레코드 리스트 (한 페이지 분량)
     """
     
+    if usage is None:
+        usage = Counter()
+    
     try:
-        youtube = build('youtube', 'v3', developerKey=api_key)
+        youtube = get_youtube_client(api_key)
+        limiter = rate_limiter.get_limiter("youtube", api_key)
         
-        all_comments = []
+        video_ids = list(dict.fromkeys(video_ids))
+        counts = {video_id: 0 for video_id in video_ids}
+        # 최근 영상의 댓글은 짧게, 오래된 영상의 댓글은 길게 캐시
+        ttls = {
+            video_id: response_cache.comment_thread_ttl((published_at or {}).get(video_id))
+            for video_id in video_ids
+        }
+        pending = {video_id: None for video_id in video_ids}  # 영상 ID → 다음 페이지 토큰
+        completed = 0
         
-        for video_id in video_ids:
-            try:
-                # 댓글 스레드 가져오기
-                request = youtube.commentThreads().list(
-                    part='snippet',
-                    videoId=video_id,
-                    maxResults=min(100, max_comments_per_video),
-                    order='relevance',
-                    textFormat='plainText'
-                )
+        def finish(video_id):
+            nonlocal completed
+            completed += 1
+            if progress_callback is not None:
+                progress_callback(completed, len(video_ids))
+        
+        # 회차 전체에서 스레드 풀 하나를 써서 스레드별 HTTP 연결을 재사용
+        # (배치 수는 모든 영상을 요청하는 첫 회차가 가장 많음)
+        max_chunks = (len(video_ids) + BATCH_SIZE - 1) // BATCH_SIZE
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, max_chunks))) as executor:
+            while pending:
+                # 다음 페이지가 필요한 영상들의 댓글 스레드 요청
+                requests = []
+                for video_id, page_token in pending.items():
+                    params = {
+                        'part': 'snippet',
+                        'videoId': video_id,
+                        'maxResults': min(100, max_comments_per_video - counts[video_id]),
+                        'order': 'relevance',
+                        'textFormat': 'plainText'
+                    }
+                    if page_token:
+                        params['pageToken'] = page_token
+                    requests.append((video_id, youtube.commentThreads().list(**params)))
                 
-                response = request.execute()
+                chunks = [requests[i:i + BATCH_SIZE] for i in range(0, len(requests), BATCH_SIZE)]
+                responses = {}
                 
-                for item in response.get('items', []):
-                    comment = item['snippet']['topLevelComment']['snippet']
-                    
-                    # published_at과 updated_at을 한국 시간대로 변환
-                    published_at_utc = comment.get('publishedAt', '')
-                    updated_at_utc = comment.get('updatedAt', '')
-                    published_at_kst = convert_utc_to_kst(published_at_utc)
-                    updated_at_kst = convert_utc_to_kst(updated_at_utc)
-                    
-                    all_comments.append({
-                        'type': 'youtube_comment',
-                        'video_id': video_id,
-                        'comment_id': item['id'],
-                        'author': clean_html(comment.get('authorDisplayName', '')),
-                        'text': clean_html(comment.get('textDisplay', '')),
-                        'like_count': comment.get('likeCount', 0),
-                        'published_at': published_at_kst,
-                        'updated_at': updated_at_kst
-                    })
+                futures = [
+                    executor.submit(_execute_batch, youtube, limiter, 'commentThreads.list', chunk, usage, ttls)
+                    for chunk in chunks
+                ]
+                try:
+                    for future in as_completed(futures):
+                        responses.update(future.result())
+                except Exception:
+                    for future in futures:
+                        future.cancel()
+                    raise
                 
-                time.sleep(0.1)  # API 제한 준수
+                next_pending = {}
                 
-            except HttpError as e:
-                if e.resp.status == 403:
-                    # 댓글이 비활성화된 영상이거나 API 할당량 초과
-                    if 'commentsDisabled' in str(e):
-                        print(f"영상 {video_id}: 댓글이 비활성화되어 있습니다.")
+                for video_id in pending:
+                    response, error = responses[video_id]
+                    
+                    if error is not None:
+                        if isinstance(error, HttpError) and error.resp.status == 403:
+                            # 댓글이 비활성화된 영상이거나 API 할당량 초과
+                            if 'commentsDisabled' in str(error):
+                                print(f"영상 {video_id}: 댓글이 비활성화되어 있습니다.")
+                                finish(video_id)
+                                continue
+                            else:
+                                raise Exception("유튜브 API 할당량 초과. 내일 다시 시도해주세요.")
+                        print(f"영상 {video_id} 댓글 수집 중 오류: {error}")
+                        finish(video_id)
                         continue
+                    
+                    remaining = max_comments_per_video - counts[video_id]
+                    items = (response or {}).get('items', [])
+                    comments = _comment_records(video_id, items[:remaining])
+                    counts[video_id] += len(comments)
+                    
+                    next_token = (response or {}).get('nextPageToken')
+                    if next_token and items and counts[video_id] < max_comments_per_video:
+                        next_pending[video_id] = next_token
                     else:
-                        raise Exception("유튜브 API 할당량 초과. 내일 다시 시도해주세요.")
-                print(f"영상 {video_id} 댓글 수집 중 오류: {e}")
-                continue
-        
-        if not all_comments:
-            return pd.DataFrame(columns=['type', 'video_id', 'comment_id', 'author', 
-                                         'text', 'like_count', 'published_at', 'updated_at'])
-        
-        df = pd.DataFrame(all_comments)
-        return df
+                        finish(video_id)
+                    
+                    if comments:
+                        yield comments
+                
+                pending = next_pending
         
     except Exception as e:
         raise Exception(f"유튜브 댓글 수집 중 오류: {str(e)}")
 
 
+def collect_youtube_comments(api_key, video_ids, max_comments_per_video=100, max_workers=4,
+                             progress_callback=None, published_at=None):
+    """
+    유튜브 댓글 수집
+    
+    iter_youtube_comments()의 결과를 영상 순서대로 모아 하나의 DataFrame으로 만든다.
+    
+    Parameters:
+    -----------
+    api_key : str
+        유튜브 API 키
+    video_ids : list
+        영상 ID 리스트
+    max_comments_per_video : int
+        영상당 최대 댓글 수
+    max_workers : int
+        동시에 보낼 최대 배치 요청 수
+    progress_callback : callable
+        영상 하나의 수집이 끝날 때마다 (완료 영상 수, 전체 영상 수)로 호출
+    published_at : dict
+        영상 ID별 게시 시각 (댓글 응답 캐시 유지 시간 결정)
+        
+    Returns:
+    --------
+    pd.DataFrame
+        수집된 댓글 데이터
+    """
+    usage = Counter()
+    comments_by_video = {video_id: [] for video_id in video_ids}
+    
+    for comments in iter_youtube_comments(api_key, video_ids, max_comments_per_video,
+                                          max_workers, progress_callback, usage, published_at):
+        comments_by_video[comments[0]['video_id']].extend(comments)
+    
+    all_comments = [comment for comments in comments_by_video.values() for comment in comments]
+    
+    if not all_comments:
+        df = pd.DataFrame(columns=['type', 'video_id', 'comment_id', 'author', 
+                                   'text', 'like_count', 'published_at', 'updated_at'])
+    else:
+        df = pd.DataFrame(all_comments)
+    
+    df.attrs['quota_units'] = dict(usage)
+    return df
+
+
 def validate_api_key(api_key):
     """
     유튜브 API 키 유효성 검증
@@ -377,7 +1047,7 @@ def validate_api_key(api_key):
         (성공 여부, 메시지)
     """
     try:
-        youtube = build('youtube', 'v3', developerKey=api_key)
+        youtube = get_youtube_client(api_key)
         
         # 간단한 검색 요청으로 키 유효성 확인
         request = youtube.search().list(
@@ -386,7 +1056,8 @@ def validate_api_key(api_key):
             maxResults=1
         )
         
-        request.execute()
+        _execute(request, rate_limiter.get_limiter("youtube", api_key), 'search.list',
+                 use_cache=False)
         return True, "✅ 유튜브 API 키가 유효합니다."
         
     except HttpError as e: